@@ -0,0 +1,103 @@
+"""
+Benchmark: threaded prefetching JSON loader vs. the legacy sequential loader.
+
+Writes a synthetic folder of extracted-paper JSON files and compares files
+per second of the loader before prefetching (open + json.load, one file after
+the other) with json_loader.iter_json_files using the stdlib decoder and,
+if installed, orjson.
+
+Local disks hide the per-file latency of network file systems, which is what
+prefetching is for; --latency-ms adds a sleep to every file read to emulate
+it (e.g. 2-5 ms for NFS/SMB).
+
+Usage:
+    python benchmarks/bench_json_loader.py [--files 500] [--kb 200] [--latency-ms 0] [--threads 4]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import json_loader
+from json_loader import DEFAULT_LOAD_THREADS, iter_json_files
+
+def legacy_load(paths, latency):
+    """load_json_content as it was before prefetching."""
+    papers = 0
+    for path in paths:
+        if latency:
+            time.sleep(latency)
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+        papers += 1
+    return papers
+
+def prefetch_load(paths, threads):
+    return sum(1 for _path, data, _error in iter_json_files(paths, threads=threads) if data is not None)
+
+def make_corpus(directory, files, kb):
+    words = "forest management ecosystem services Schutzwald rockfall resilience stand structure ".split()
+    text = " ".join(words[i % len(words)] for i in range(kb * 1024 // 9))
+    paths = []
+    for i in range(files):
+        path = Path(directory) / f"paper{i:05d}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"filename": f"paper{i:05d}.pdf", "full_text": text,
+                       "page_offsets": list(range(0, len(text), 3000))}, f, ensure_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="Number of JSON files (default: 500)")
+    parser.add_argument("--kb", type=int, default=200, help="Approximate text size per file in KB (default: 200)")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Emulated per-file read latency in milliseconds (default: 0)")
+    parser.add_argument("--threads", type=int, default=DEFAULT_LOAD_THREADS,
+                        help=f"Prefetch threads (default: {DEFAULT_LOAD_THREADS})")
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    original_read = json_loader._read_file
+    if latency:
+        def slow_read(path):
+            time.sleep(latency)
+            return original_read(path)
+        json_loader._read_file = slow_read
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = make_corpus(temp_dir, args.files, args.kb)
+        print(f"{args.files} files of ~{args.kb} KB, emulated latency {args.latency_ms:g} ms")
+        print(f"{'loader':<38}{'time (s)':>10}{'files/s':>10}")
+
+        cases = [("legacy sequential json.load", lambda: legacy_load(paths, latency))]
+        decoders = [("stdlib json", False)]
+        if json_loader.ORJSON_AVAILABLE:
+            decoders.append(("orjson", True))
+        for decoder, use_orjson in decoders:
+            cases.append((f"sequential, {decoder}",
+                          lambda use_orjson=use_orjson: _with_decoder(use_orjson, prefetch_load, paths, 1)))
+            cases.append((f"prefetch {args.threads} threads, {decoder}",
+                          lambda use_orjson=use_orjson: _with_decoder(use_orjson, prefetch_load, paths, args.threads)))
+
+        for name, func in cases:
+            start = time.perf_counter()
+            loaded = func()
+            elapsed = time.perf_counter() - start
+            assert loaded == args.files
+            print(f"{name:<38}{elapsed:>10.3f}{loaded / elapsed:>10.0f}")
+
+def _with_decoder(use_orjson, func, *args):
+    available = json_loader.ORJSON_AVAILABLE
+    json_loader.ORJSON_AVAILABLE = use_orjson
+    try:
+        return func(*args)
+    finally:
+        json_loader.ORJSON_AVAILABLE = available
+
+if __name__ == "__main__":
+    main()
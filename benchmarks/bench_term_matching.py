@@ -0,0 +1,112 @@
+"""
+Benchmark: term matching engines vs. the number of query terms.
+
+Scans a synthetic document for the first matches of N query terms (words,
+wildcards and two-word phrases, as built by the query parser) with:
+
+  per-term finditer  the evaluation before term_scanner (one search per term)
+  regex              term_scanner's combined lookahead scan
+  aho-corasick       term_scanner's automaton engine, pure Python and, if
+                     installed, pyahocorasick
+
+The regex scans slow down linearly with the number of terms; the automaton
+does not. The crossover of the pure-Python automaton is what
+term_scanner.AUTO_AHO_CORASICK_TERMS is based on.
+
+Usage:
+    python benchmarks/bench_term_matching.py [--kb 200] [--terms 10 50 100 250 500 1000] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import aho_corasick
+import term_scanner
+from query_parser import _escape_term_to_regex
+from term_scanner import scan_terms
+
+def make_vocabulary(rng, size=5000):
+    letters = "abcdefghiklmnoprstuvwz"
+    return sorted({"".join(rng.choice(letters) for _ in range(rng.randint(4, 11))) for _ in range(size)})
+
+def make_text(rng, vocabulary, kb):
+    words = []
+    size = 0
+    while size < kb * 1024:
+        word = rng.choice(vocabulary)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+def make_terms(rng, vocabulary, count):
+    patterns = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.2:
+            stem = rng.choice(vocabulary)
+            patterns.append(_escape_term_to_regex(stem[:max(3, len(stem) - 2)] + "*", False))
+        elif kind < 0.35:
+            patterns.append(_escape_term_to_regex(f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}", True))
+        else:
+            patterns.append(_escape_term_to_regex(rng.choice(vocabulary), False))
+    return list(dict.fromkeys(patterns))
+
+def per_term(text, patterns):
+    """evaluate_ast's matching before term_scanner."""
+    return {p: [m.span() for _, m in zip(range(3), re.finditer(p, text))] for p in patterns}
+
+def timed(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kb", type=int, default=200, help="Document size in KB (default: 200)")
+    parser.add_argument("--terms", type=int, nargs="+", default=[10, 50, 100, 250, 500, 1000],
+                        help="Term counts to measure (default: 10 50 100 250 500 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(rng)
+    text = make_text(rng, vocabulary, args.kb)
+
+    engines = [("per-term finditer", None, None), ("regex", "regex", None),
+               ("aho-corasick (Python)", "aho-corasick", False)]
+    if aho_corasick.PYAHOCORASICK_AVAILABLE:
+        engines.append(("aho-corasick (pyahocorasick)", "aho-corasick", True))
+
+    print(f"Document of {len(text) / 1024:.0f} KB; milliseconds per scan (best of {args.repeat})")
+    print(f"{'terms':>6}" + "".join(f"{name:>30}" for name, _, _ in engines))
+    native = aho_corasick.PYAHOCORASICK_AVAILABLE
+    try:
+        for count in args.terms:
+            patterns = make_terms(rng, vocabulary, count)
+            reference = per_term(text, patterns)
+            row = f"{len(patterns):>6}"
+            for _name, engine, use_native in engines:
+                if engine is None:
+                    elapsed, hits = timed(lambda: per_term(text, patterns), args.repeat)
+                else:
+                    if use_native is not None:
+                        aho_corasick.PYAHOCORASICK_AVAILABLE = use_native
+                        term_scanner._automaton.cache_clear()
+                    elapsed, hits = timed(lambda: scan_terms(text, patterns, engine=engine), args.repeat)
+                assert hits == reference
+                row += f"{elapsed * 1000:>30.1f}"
+            print(row)
+    finally:
+        aho_corasick.PYAHOCORASICK_AVAILABLE = native
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: fused single-pass text cleaner vs. the legacy regex chain.
+
+Compares throughput (MB/s) of text_normalizer.TextNormalizer, which backs
+pdf_extractor.clean_extracted_text, with the previous implementation
+(whitespace regex, two page-number regexes and four str.replace calls),
+plus the whitespace-only normalization used by validator._prep_text.
+
+Usage:
+    python benchmarks/bench_text_cleaner.py [--size-mb 8] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from text_normalizer import DEFAULT_NORMALIZER, collapse_whitespace
+
+def legacy_clean(text):
+    """clean_extracted_text as it was before the fused normalizer."""
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\b\d+\b\s*(?=\n|$)', '', text)
+    text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
+    text = text.replace('‘', "'")
+    text = text.replace('’', "'")
+    text = text.replace('“', '"')
+    text = text.replace('”', '"')
+    return text.strip()
+
+def legacy_prep(text):
+    """validator._prep_text as it was before the fused normalizer."""
+    return re.sub(r"\s+", " ", text).strip()
+
+def make_corpus(size_mb):
+    """Synthetic PDF-like text: short lines, page footers, hyphenation, umlauts and smart quotes."""
+    page = (
+        "Forest management and ecosystem services in the Swiss Alps\n"
+        "The  “protective forest” concept (Schützwald) reduces rockfall risk;\n"
+        "stand   structure, regeneration and  climate change are discussed in detail.\n"
+        "Table 3\n12.5\n47\nTotal basal area per hectare  \t  in 2019\n"
+        "‘Selective thinning’ improved   resilience of the stands.\n"
+    ) * 20
+    pages = []
+    size = 0
+    n = 1
+    while size < size_mb * 1024 * 1024:
+        chunk = page + f"\n{n}\n"
+        pages.append(chunk)
+        size += len(chunk.encode("utf-8"))
+        n += 1
+    return "".join(pages)
+
+def bench(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=8.0, help="Size of the synthetic text (default: 8)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions; the best time is reported")
+    args = parser.parse_args()
+
+    text = make_corpus(args.size_mb)
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    print(f"Text size: {mb:.1f} MB")
+    print(f"{'implementation':<38}{'time (s)':>10}{'MB/s':>10}")
+
+    cases = [
+        ("legacy clean_extracted_text", legacy_clean),
+        ("fused TextNormalizer", DEFAULT_NORMALIZER.normalize),
+        ("legacy _prep_text (\\s+ sub)", legacy_prep),
+        ("fused collapse_whitespace", collapse_whitespace),
+        ("collapse_whitespace on cleaned text", collapse_whitespace),
+    ]
+    cleaned = DEFAULT_NORMALIZER.normalize(text)
+    for name, func in cases:
+        sample = cleaned if name.endswith("on cleaned text") else text
+        elapsed = bench(func, sample, args.repeat)
+        print(f"{name:<38}{elapsed:>10.4f}{mb / elapsed:>10.1f}")
+
+if __name__ == "__main__":
+    main()
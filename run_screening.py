@@ -11,6 +11,7 @@ Supports any research domain with customizable search criteria and validation lo
 Usage:
     python run_screening.py --input <pdf_folder> --output <results_folder> --search-terms <search_file> [--config <config_file>]
     python run_screening.py --input <pdf_folder> --output <results_folder> --query-file <query_txt> [--config <config_file>]
+    python run_screening.py --input <pdf_folder> --output <results_folder> --queries-file <queries_txt> [--config <config_file>]
 
 Examples:
     # Basic usage
@@ -28,8 +29,16 @@ from pathlib import Path
 # Import toolkit modules
 sys.path.append(str(Path(__file__).parent / "scripts"))
 from search_parser import parse_search_terms
-from validator import validate_papers, load_config
+from validator import validate_papers, load_config, save_validation_results
 from report_generator import generate_reports, generate_html_report, sort_pdf_files
+from corpus_store import CORPUS_FILENAME, CORPUS_FORMATS
+from packed_corpus import PACK_FILENAME
+from dedup import DEFAULT_THRESHOLD as DEFAULT_DEDUP_THRESHOLD
+from inventory import DEFAULT_INCLUDE, build_inventory
+from term_scanner import DEFAULT_MATCHING_ENGINE, MATCHING_ENGINES
+from query_planner import DEFAULT_SAMPLE_SIZE, QueryPlanner
+from query_batch import load_query_batch, save_query_matrix, validate_papers_batch
+from watcher import DEFAULT_POLL_INTERVAL, ScreeningWatcher
 
 # Optional: new query parser
 try:
@@ -38,6 +47,9 @@ except Exception:
     parse_query = None  # type: ignore
     pretty_print = None  # type: ignore
 
+# Where run_validation stores the text extracted from PDF input
+EXTRACTION_DIR = Path("test_results") / "extracted_json"
+
 def print_banner():
     """Print toolkit banner."""
     print("=" * 60)
@@ -45,7 +57,7 @@ def print_banner():
     print("   Configurable automated PDF screening for any domain")
     print("=" * 60)
 
-def check_prerequisites(args):
+def check_prerequisites(args, inventory=None):
     """Check if all required files and directories exist."""
     print("🔍 Checking prerequisites...")
     
@@ -56,13 +68,21 @@ def check_prerequisites(args):
     if not input_path.exists():
         errors.append(f"❌ Input directory not found: {input_path}")
     else:
-        pdf_files = list(input_path.glob("*.pdf"))
-        json_files = list(input_path.glob("*.json"))
+        if inventory is None:
+            inventory = build_inventory(input_path)
         
-        if pdf_files:
-            print(f"✅ Found {len(pdf_files)} PDF files")
-        elif json_files:
-            print(f"✅ Found {len(json_files)} JSON files (pre-extracted)")
+        if inventory.pdfs:
+            subfolders = {Path(entry.relative).parent for entry in inventory.pdfs} - {Path(".")}
+            where = f" (in {len(subfolders)} subfolders)" if subfolders else ""
+            print(f"✅ Found {len(inventory.pdfs)} PDF files{where}")
+        elif inventory.json_count:
+            print(f"✅ Found {inventory.json_count} JSON files (pre-extracted)")
+        elif inventory.corpus:
+            print(f"✅ Found {CORPUS_FILENAME} corpus store (pre-extracted)")
+        elif inventory.pack:
+            print(f"✅ Found {PACK_FILENAME} packed corpus (pre-extracted)")
+        elif getattr(args, "watch", False):
+            print("⏳ No PDF files yet - watch mode will screen them as they arrive")
         else:
             errors.append(f"❌ No PDF or JSON files found in {input_path}")
     
@@ -73,6 +93,12 @@ def check_prerequisites(args):
             errors.append(f"❌ Query file not found: {qf}")
         else:
             print(f"✅ Query file: {qf}")
+    elif getattr(args, "queries_file", None):
+        qf = Path(args.queries_file)
+        if not qf.exists():
+            errors.append(f"❌ Queries file not found: {qf}")
+        else:
+            print(f"✅ Queries file: {qf}")
     else:
         search_file = Path(args.search_terms)
         if not search_file.exists():
@@ -159,14 +185,57 @@ def display_configuration(config):
     
     text_proc = config.get("text_processing", {})
     print(f"   Case sensitive: {text_proc.get('case_sensitive', False)}")
+    print(f"   Matching engine: {text_proc.get('matching_engine', DEFAULT_MATCHING_ENGINE)}")
     print(f"   Encoding: {text_proc.get('encoding', 'utf-8')}")
 
-def run_validation(input_dir, search_blocks, config, *, query_node=None):
+def build_extraction_options(config, *, query_node=None, early_stop=False, limits=None, preflight=True,
+                             stage="full", front_pages=None):
+    """Build the ExtractionOptions shared by batch and watch mode (see run_validation)."""
+    # Import here to handle missing libraries gracefully
+    from pdf_extractor import ExtractionOptions
+    
+    limits = limits or {}
+    text_proc = config.get("text_processing", {})
+    return ExtractionOptions(
+        stop_query=query_node if early_stop else None,
+        case_sensitive=text_proc.get("case_sensitive", False),
+        matching_engine=text_proc.get("matching_engine", DEFAULT_MATCHING_ENGINE),
+        max_pages=limits.get("max_pages"),
+        max_chars=limits.get("max_chars"),
+        preflight=preflight,
+        stage=stage,
+        **({"front_pages": front_pages} if front_pages else {})
+    )
+
+def run_validation(input_dir, search_blocks, config, *, query_node=None, workers=1, cache_dir=None,
+                   early_stop=False, limits=None, preflight=True, corpus_format="json", stage="full",
+                   front_pages=None, dedup_threshold=None, inventory=None, query_plan=True, query_batch=None):
     """Run the validation process.
     
+    Args:
+        inventory: inventory.Inventory of input_dir (built here if not given)
+        workers: Number of processes used for PDF text extraction
+        cache_dir: Optional persistent extraction cache directory
+        early_stop: Stop reading each PDF once the query verdict is decided (query mode)
+        limits: Optional dict with per-PDF extraction limits: 'timeout' (seconds),
+                'max_memory_mb', 'max_pages', 'max_chars' and 'recycle_after'
+        preflight: Triage PDFs before full extraction (see scripts/preflight.py)
+        corpus_format: Storage for extracted text: "json" (one file per PDF) or
+                       "jsonl.gz" (single compressed corpus store)
+        stage: "full" screens full texts, "abstract" only the front matter
+               (title, abstract, keywords) of each PDF
+        front_pages: Page budget per PDF in the abstract stage
+        dedup_threshold: Screen only one paper per group of duplicates (exact
+                         or with at least this estimated text similarity)
+        query_plan: Evaluate the query's terms most selective first, planned
+                    from the first papers (see scripts/query_planner.py)
+        query_batch: Optional list of (name, query_node) screened together in
+                     one pass over the papers (see scripts/query_batch.py)
+    
     Returns:
         tuple: (validation_results, failed_pdfs_list) where failed_pdfs_list contains
-               dicts with 'filename', 'error_code', 'error_message'
+               dicts with 'filename', 'error_code', 'error_message'; with query_batch,
+               validation_results is a dict {name: validation results of that query}
     """
     print("🔍 Starting validation process...")
     
@@ -174,39 +243,76 @@ def run_validation(input_dir, search_blocks, config, *, query_node=None):
     
     try:
         # Step 1: Check if we need to extract PDFs first
-        input_path = Path(input_dir)
-        pdf_files = list(input_path.glob("*.pdf"))
-        json_files = list(input_path.glob("*.json"))
+        if inventory is None:
+            inventory = build_inventory(input_dir)
         
         json_source_dir = input_dir
+        source_format = None  # auto-detect pre-extracted input
+        # Pre-extracted JSON was listed with the PDFs (--recursive, --include/--exclude, never the output folder)
+        json_options = {"json_files": inventory.json_files}
         
         # If we have PDFs but no JSONs, extract first
-        if pdf_files and not json_files:
+        if inventory.pdfs and not inventory.pre_extracted:
             print("📄 PDF files detected - extracting text...")
             
             # Create extraction directory
-            extraction_dir = Path("test_results") / "extracted_json"
+            extraction_dir = EXTRACTION_DIR
             extraction_dir.mkdir(parents=True, exist_ok=True)
             
             # Import here to handle missing libraries gracefully
             from pdf_extractor import extract_pdfs_to_json
             
-            extracted_count, failed_pdfs = extract_pdfs_to_json(input_dir, extraction_dir)
+            limits = limits or {}
+            options = build_extraction_options(config, query_node=query_node, early_stop=early_stop,
+                                               limits=limits, preflight=preflight, stage=stage,
+                                               front_pages=front_pages)
+            extracted_count, failed_pdfs = extract_pdfs_to_json(
+                input_dir, extraction_dir, workers=workers, cache_dir=cache_dir, options=options,
+                timeout=limits.get("timeout"), max_memory_mb=limits.get("max_memory_mb"),
+                recycle_after=limits.get("recycle_after"), corpus_format=corpus_format,
+                inventory=inventory
+            )
             
-            if extracted_count == 0 and len(failed_pdfs) == len(pdf_files):
+            if extracted_count == 0 and len(failed_pdfs) == len(inventory.pdfs):
                 raise Exception("PDF extraction failed - no text could be extracted from any PDF")
             
             json_source_dir = str(extraction_dir)
+            source_format = corpus_format
+            # The extracted JSON mirrors the input subfolders of a recursive run
+            json_options = {"recursive": inventory.options.get("recursive", False)}
             print(f"✅ Extracted text from {extracted_count} PDF files")
             
             if failed_pdfs:
                 print(f"⚠️  {len(failed_pdfs)} PDF(s) failed extraction (see report for details)")
         
-        elif json_files:
-            print(f"📝 Using existing JSON files ({len(json_files)} found)")
+        elif inventory.json_count:
+            print(f"📝 Using existing JSON files ({inventory.json_count} found)")
+        elif inventory.corpus:
+            print(f"📝 Using existing corpus store ({CORPUS_FILENAME})")
+        elif inventory.pack:
+            print(f"📝 Using existing packed corpus ({PACK_FILENAME})")
         
         # Step 2: Run validation on JSON files
-        results = validate_papers(json_source_dir, search_blocks, "config.json", query_node=query_node)
+        if query_batch is not None:
+            results_by_query = validate_papers_batch(json_source_dir, [node for _name, node in query_batch],
+                                                     "config.json", corpus_format=source_format,
+                                                     dedup_threshold=dedup_threshold, json_options=json_options)
+            print(f"✅ Validation complete!")
+            print(f"   Successfully processed: {len(results_by_query[0])}")
+            if failed_pdfs:
+                print(f"   Failed extraction: {len(failed_pdfs)}")
+            duplicates = sum(1 for r in results_by_query[0] if r.get("duplicate_of"))
+            if duplicates:
+                print(f"   Duplicates (verdicts copied): {duplicates}")
+            for (name, _node), results in zip(query_batch, results_by_query):
+                included = sum(1 for r in results if r["overall_result"])
+                print(f"   [{name}] Included: {included}  Excluded: {len(results) - included}")
+            return {name: results for (name, _node), results in zip(query_batch, results_by_query)}, failed_pdfs
+        
+        planner = QueryPlanner(query_node) if query_node is not None and query_plan else None
+        results = validate_papers(json_source_dir, search_blocks, "config.json", query_node=query_node,
+                                  corpus_format=source_format, dedup_threshold=dedup_threshold,
+                                  planner=planner, json_options=json_options)
         
         # Statistics
         total_papers = len(results)
@@ -217,8 +323,14 @@ def run_validation(input_dir, search_blocks, config, *, query_node=None):
         print(f"   Successfully processed: {total_papers}")
         if failed_pdfs:
             print(f"   Failed extraction: {len(failed_pdfs)}")
+        duplicates = sum(1 for r in results if r.get("duplicate_of"))
+        if duplicates:
+            print(f"   Duplicates (verdict copied): {duplicates}")
         print(f"   Included: {included}")
         print(f"   Excluded: {excluded}")
+        if planner is not None and planner.plan is not None:
+            print(f" Query plan (term frequencies from the first {planner.sample_size} papers):")
+            print(planner.format_plan(indent=3))
         
         return results, failed_pdfs
         
@@ -226,8 +338,12 @@ def run_validation(input_dir, search_blocks, config, *, query_node=None):
         print(f"❌ Validation failed: {e}")
         return None, failed_pdfs
 
-def generate_outputs(results, output_dir, search_blocks, config, *, query_string: str | None = None, failed_pdfs: list | None = None):
-    """Generate all output files and reports."""
+def generate_outputs(results, output_dir, search_blocks, config, *, query_string: str | None = None, failed_pdfs: list | None = None,
+                     input_dir="input_pdfs"):
+    """Generate all output files and reports.
+    
+    PDFs are sorted from input_dir into output_dir/sorted_pdfs.
+    """
     print(" Generating reports and organizing results...")
     
     output_path = Path(output_dir)
@@ -242,8 +358,7 @@ def generate_outputs(results, output_dir, search_blocks, config, *, query_string
         # Save JSON results
         if config.get("output_settings", {}).get("json_results", True):
             json_file = output_path / "validation_results.json"
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            save_validation_results(results, json_file)
             print(f" JSON results: {json_file}")
         
         # Save failed PDFs to separate file if any failed
@@ -255,7 +370,7 @@ def generate_outputs(results, output_dir, search_blocks, config, *, query_string
         
         # Sort PDFs (if available)
         try:
-            sort_pdf_files(results, "input_pdfs", output_path)
+            sort_pdf_files(results, input_dir, output_path)
             print(" PDFs organized by validation results")
         except Exception as e:
             print(f"  PDF sorting skipped: {e}")
@@ -266,6 +381,33 @@ def generate_outputs(results, output_dir, search_blocks, config, *, query_string
         print(f" Output generation failed: {e}")
         return False
 
+def generate_batch_outputs(results_by_query, queries, output_dir, config, *, failed_pdfs: list | None = None,
+                           input_dir="input_pdfs"):
+    """Generate the paper x query matrix and, per query, the outputs of generate_outputs.
+    
+    queries: list of (name, query string); the outputs of each query go to
+    output_dir/queries/<name>.
+    """
+    output_path = Path(output_dir)
+    matrix_file = output_path / "query_matrix.csv"
+    try:
+        save_query_matrix([name for name, _query in queries], [results_by_query[name] for name, _query in queries],
+                          matrix_file)
+    except Exception as e:
+        print(f" Output generation failed: {e}")
+        return False
+    print(f" Query matrix: {matrix_file}")
+    
+    for name, query_string in queries:
+        print()
+        print(f" [{name}]")
+        query_dir = output_path / "queries" / name
+        query_dir.mkdir(parents=True, exist_ok=True)
+        if not generate_outputs(results_by_query[name], query_dir, None, config, query_string=query_string,
+                                failed_pdfs=failed_pdfs, input_dir=input_dir):
+            return False
+    return True
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -287,10 +429,74 @@ Examples:
                        help="(Deprecated) File containing block-based search terms configuration")
     group.add_argument("--query-file",
                        help="File containing a raw Boolean query string")
+    group.add_argument("--queries-file",
+                       help="File containing several named Boolean queries ([name] headers), "
+                            "all screened in one pass over the papers")
     parser.add_argument("--config", default="config.json",
                        help="Configuration file (default: config.json)")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                       help="Extract PDFs with N parallel worker processes (default: 1)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                       help="Persistent extraction cache shared across runs (keyed by PDF content); "
+                            "also keeps parsed queries")
+    parser.add_argument("--early-stop", action="store_true",
+                       help="Query mode: stop reading a PDF as soon as its verdict can no longer change")
+    parser.add_argument("--corpus-format", choices=CORPUS_FORMATS, default="json",
+                       help="Store extracted text as one JSON file per PDF (json, default) or as a single "
+                            "compressed corpus file (jsonl.gz), which is much faster for very large batches")
+    parser.add_argument("--stage", choices=("full", "abstract"), default="full",
+                       help="Screen full texts (default) or only the title/abstract/keywords front matter, "
+                            "which is much faster for a first screening pass")
+    parser.add_argument("--front-pages", type=int, metavar="K",
+                       help="Abstract stage: read at most K pages per PDF (default: 2)")
+    parser.add_argument("--dedup", action="store_true",
+                       help="Detect duplicate and near-duplicate papers and screen only one copy of each")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_DEDUP_THRESHOLD, metavar="SIM",
+                       help=f"Text similarity (0-1) from which papers count as near duplicates "
+                            f"(default: {DEFAULT_DEDUP_THRESHOLD})")
+    parser.add_argument("--no-preflight", action="store_true",
+                       help="Skip the quick triage that rejects encrypted, corrupt and image-only PDFs before extraction")
+    parser.add_argument("--no-query-plan", action="store_true",
+                       help=f"Evaluate query terms in the order written instead of most selective first "
+                            f"(planned from the first {DEFAULT_SAMPLE_SIZE} papers)")
+    parser.add_argument("--recursive", action="store_true",
+                       help="Also screen PDFs in subfolders of the input folder; sorted_pdfs keeps the subfolders")
+    parser.add_argument("--include", action="append", metavar="PATTERN",
+                       help="Only screen files matching PATTERN, e.g. \"*.pdf\" (default) or \"2023/*\"; repeatable")
+    parser.add_argument("--exclude", action="append", metavar="PATTERN",
+                       help="Skip files and subfolders matching PATTERN, e.g. \"drafts\" or \"*_supplement.pdf\"; repeatable")
+    parser.add_argument("--watch", action="store_true",
+                       help="Keep running after the initial screening and screen new or changed PDFs "
+                            "in the input folder as they arrive (Ctrl+C to stop)")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, metavar="SECONDS",
+                       help=f"Watch mode: seconds between checks of the input folder (default: {DEFAULT_POLL_INTERVAL:g})")
+    limits = parser.add_argument_group("per-PDF extraction limits")
+    limits.add_argument("--timeout", type=float, metavar="SECONDS",
+                       help="Abort extraction of a PDF after this many seconds (EXTRACTION_TIMEOUT)")
+    limits.add_argument("--max-memory", type=int, metavar="MB",
+                       help="Address-space cap per extraction worker (RESOURCE_LIMIT; not on Windows)")
+    limits.add_argument("--max-pages", type=int, metavar="N",
+                       help="Reject PDFs with more than N pages (RESOURCE_LIMIT)")
+    limits.add_argument("--max-chars", type=int, metavar="N",
+                       help="Reject PDFs with more than N extracted characters (RESOURCE_LIMIT)")
+    limits.add_argument("--recycle-after", type=int, metavar="N",
+                       help="Restart each extraction worker after N PDFs to contain memory leaks")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.early_stop and not args.query_file:
+        parser.error("--early-stop requires --query-file")
+    if args.front_pages is not None and args.front_pages < 1:
+        parser.error("--front-pages must be at least 1")
+    if not 0 < args.dedup_threshold <= 1:
+        parser.error("--dedup-threshold must be between 0 and 1")
+    if args.watch and args.dedup:
+        parser.error("--watch cannot be combined with --dedup")
+    if args.watch and args.queries_file:
+        parser.error("--watch cannot be combined with --queries-file")
+    if args.poll_interval <= 0:
+        parser.error("--poll-interval must be positive")
     
     # Print banner
     print_banner()
@@ -298,10 +504,18 @@ Examples:
     # Load configuration
     config = load_config(args.config)
     display_configuration(config)
+    engine = config.get("text_processing", {}).get("matching_engine", DEFAULT_MATCHING_ENGINE)
+    if engine not in MATCHING_ENGINES:
+        print(f"❌ Unknown text_processing.matching_engine '{engine}' (use one of: {', '.join(MATCHING_ENGINES)})")
+        sys.exit(1)
     print()
     
+    # List the input folder once for all steps (the output folder is never entered)
+    inventory = build_inventory(args.input, include=args.include or DEFAULT_INCLUDE, exclude=args.exclude or (),
+                                recursive=args.recursive, skip_dirs=[args.output])
+    
     # Check prerequisites
-    if not check_prerequisites(args):
+    if not check_prerequisites(args, inventory):
         print("\n Prerequisites check failed. Please fix the issues above.")
         sys.exit(1)
     
@@ -311,7 +525,29 @@ Examples:
     query_node = None
     search_blocks = None
     query_str_for_report = None
-    if getattr(args, "query_file", None):
+    queries = None
+    query_batch = None
+    if getattr(args, "queries_file", None):
+        if parse_query is None:
+            print("❌ Query mode requested but query parser is unavailable")
+            sys.exit(1)
+        try:
+            queries = load_query_batch(args.queries_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading queries file: {e}")
+            sys.exit(1)
+        query_cache = Path(args.cache_dir) / "queries" if args.cache_dir else None
+        query_batch = []
+        print(f" Using {len(queries)} queries:")
+        for name, query_str in queries:
+            try:
+                query_batch.append((name, parse_query(query_str, cache_dir=query_cache)))
+            except Exception as e:
+                print(f"❌ Query parse error in [{name}]: {e}")
+                sys.exit(1)
+            print(f"   [{name}] {query_str}")
+        print("⚠️  validation_logic in config is ignored in query mode.")
+    elif getattr(args, "query_file", None):
         if parse_query is None:
             print("❌ Query mode requested but query parser is unavailable")
             sys.exit(1)
@@ -319,7 +555,9 @@ Examples:
         if not query_str:
             sys.exit(1)
         try:
-            query_node = parse_query(query_str)
+            # Parsed queries are kept next to the extraction cache, if there is one
+            query_cache = Path(args.cache_dir) / "queries" if args.cache_dir else None
+            query_node = parse_query(query_str, cache_dir=query_cache)
             query_str_for_report = query_str
             if pretty_print:
                 print(" Using query:")
@@ -337,20 +575,58 @@ Examples:
     
     print()
     
-    # Run validation
-    results, failed_pdfs = run_validation(args.input, search_blocks, config, query_node=query_node)
-    if not results:
-        sys.exit(1)
-    
-    print()
+    limits = {
+        "timeout": args.timeout,
+        "max_memory_mb": args.max_memory,
+        "max_pages": args.max_pages,
+        "max_chars": args.max_chars,
+        "recycle_after": args.recycle_after
+    }
     
-    # Generate outputs
-    if not generate_outputs(results, args.output, search_blocks, config, query_string=query_str_for_report, failed_pdfs=failed_pdfs):
-        sys.exit(1)
+    results, failed_pdfs = [], []
+    if inventory.pdfs or inventory.pre_extracted:
+        # Run validation
+        results, failed_pdfs = run_validation(args.input, search_blocks, config, query_node=query_node,
+                                              workers=args.workers, cache_dir=args.cache_dir,
+                                              early_stop=args.early_stop,
+                                              preflight=not args.no_preflight,
+                                              corpus_format=args.corpus_format,
+                                              stage=args.stage, front_pages=args.front_pages,
+                                              dedup_threshold=args.dedup_threshold if args.dedup else None,
+                                              limits=limits, inventory=inventory,
+                                              query_plan=not args.no_query_plan, query_batch=query_batch)
+        if not results:
+            sys.exit(1)
+        
+        print()
+        
+        # Generate outputs
+        if query_batch is not None:
+            if not generate_batch_outputs(results, queries, args.output, config, failed_pdfs=failed_pdfs,
+                                          input_dir=args.input):
+                sys.exit(1)
+        elif not generate_outputs(results, args.output, search_blocks, config, query_string=query_str_for_report,
+                                  failed_pdfs=failed_pdfs, input_dir=args.input):
+            sys.exit(1)
+        
+        print()
+        print(" Literature screening completed successfully!")
+        print(f" Results available in: {Path(args.output).absolute()}")
     
-    print()
-    print(" Literature screening completed successfully!")
-    print(f" Results available in: {Path(args.output).absolute()}")
+    if args.watch:
+        print()
+        options = build_extraction_options(config, query_node=query_node, early_stop=args.early_stop,
+                                           limits=limits, preflight=not args.no_preflight,
+                                           stage=args.stage, front_pages=args.front_pages)
+        watcher = ScreeningWatcher(args.input, args.output, config, query_node=query_node,
+                                   search_blocks=search_blocks, query_string=query_str_for_report,
+                                   options=options, cache_dir=args.cache_dir,
+                                   extraction_dir=EXTRACTION_DIR, corpus_format=args.corpus_format,
+                                   include=args.include or DEFAULT_INCLUDE, exclude=args.exclude or (),
+                                   recursive=args.recursive, limits=limits)
+        # The inventory predates the initial run, so PDFs changed meanwhile are screened again
+        watcher.seed(results, failed_pdfs, inventory.snapshot())
+        watcher.run(interval=args.poll_interval)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,9 @@
-"""
-Universal Literature Screening Toolkit (ULST) Scripts Module
-===========================================================
-
-Core processing modules for automated literature screening.
-"""
-
-__version__ = "1.0.3"
+"""
+Universal Literature Screening Toolkit (ULST) Scripts Module
+===========================================================
+
+Core processing modules for automated literature screening.
+"""
+
+__version__ = "1.0.3"
 __author__ = "Ulrike Hiltner"
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Aho-Corasick Module
+
+Multi-pattern literal search: finds every occurrence of any of a set of
+keys in one pass over the text, at a cost that does not grow with the
+number of keys. Used by term_scanner for queries with many terms.
+
+Uses the pyahocorasick package (C implementation) when it is installed and
+a pure-Python automaton otherwise; both report the same occurrences.
+"""
+
+try:
+    import ahocorasick
+    PYAHOCORASICK_AVAILABLE = True
+except ImportError:
+    PYAHOCORASICK_AVAILABLE = False
+
+class AhoCorasick:
+    """
+    Automaton over a fixed list of non-empty keys.
+
+    Args:
+        keys: Strings to search for
+        native: Use pyahocorasick (default: whenever it is installed)
+    """
+
+    def __init__(self, keys, native=None):
+        self.keys = list(keys)
+        self.native = PYAHOCORASICK_AVAILABLE if native is None else native
+        if self.native:
+            self._automaton = ahocorasick.Automaton()
+            for index, key in enumerate(self.keys):
+                self._automaton.add_word(key, index)
+            self._automaton.make_automaton()
+        else:
+            self._build()
+
+    def _build(self):
+        # Trie: transitions per state, and key indexes ending in each state
+        goto = [{}]
+        output = [[]]
+        for index, key in enumerate(self.keys):
+            state = 0
+            for ch in key:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(index)
+
+        # Failure links in breadth-first order; outputs inherit along them
+        # (the root's children keep failing to the root)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                target = fail[state]
+                while target and ch not in goto[target]:
+                    target = fail[target]
+                fail[next_state] = goto[target].get(ch, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(keys) for keys in output]
+
+    def iter(self, text):
+        """
+        Yield (end, key_index) for every occurrence of every key, in order
+        of their end offset (end is the index of the last character).
+        """
+        if self.native:
+            yield from self._automaton.iter(text)
+            return
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for end, ch in enumerate(text):
+            transitions = goto[state]
+            while ch not in transitions and state:
+                state = fail[state]
+                transitions = goto[state]
+            state = transitions.get(ch, 0)
+            if output[state]:
+                for index in output[state]:
+                    yield end, index
@@ -0,0 +1,301 @@
+"""
+Corpus Index Module
+
+In-memory inverted index for screening one corpus with many queries, e.g.
+while refining a query. Every paper is tokenized once into posting lists
+(word -> ascending ids of the papers containing it); a query is then
+evaluated for all papers at once with set operations, AND as intersection,
+OR as union and NOT as difference, instead of scanning every text again.
+
+Words are the \\w+ runs of the text that validate_single_paper_query
+matches against (whitespace-normalized, and case- and accent-folded for
+case-insensitive screening). A vocabulary kept in sorted order turns a
+wildcard term like forest* into a contiguous range of words.
+
+A single-word term is answered by the index alone: \\bforest\\b matches
+exactly the papers containing the word "forest". Phrases and terms with
+punctuation ("ecosystem service*", x-ray) only get candidates from the
+index, the papers containing all of their words; those candidates are then
+read again and checked with the term's regex. Evidence snippets are only
+collected for the papers that pass, so screen() yields the same results as
+validate_papers at a fraction of the cost.
+
+Try queries interactively against an extraction directory:
+
+    python scripts/corpus_index.py test_results/extracted_json
+"""
+
+import argparse
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from corpus_store import CorpusReader
+from inventory import list_json_files
+from json_loader import iter_json_files, load_json_file
+from packed_corpus import PackedCorpus
+from pdf_extractor import get_paper_filename
+from query_planner import QueryPlanner
+from term_scanner import scan_terms
+from validator import (_iter_terms, _term_regex, detect_corpus_format, load_config, query_result,
+                       scanned_text, validate_single_paper_query)
+
+_WORD = re.compile(r"\w+")
+
+# Pattern syntax built by query_parser._escape_term_to_regex besides escaped text
+_TERM_SYNTAX = re.compile(r"\\b|\\s\+|\\w\*|\\(.)|(.)", re.DOTALL)
+
+def _term_words(pattern):
+    """
+    Split a term pattern into the words every match must contain.
+
+    Returns (words, exact): words is a list of (word, is_prefix) that a
+    paper must contain for the pattern to match it; is_prefix marks a word
+    followed by the \\w* wildcard, which only needs a word starting with it.
+    exact is True if containing the words is also sufficient (single-word
+    terms), so the index answers the term without a regex check.
+    """
+    literal = []
+    wildcard = False
+    for m in _TERM_SYNTAX.finditer(pattern):
+        token = m.group(0)
+        if token == "\\s+":
+            literal.append(" ")
+        elif token == "\\w*":
+            wildcard = True
+            literal.append("*")
+        elif token == "\\b":
+            literal.append(" ")
+        else:
+            literal.append(m.group(1) or m.group(2))
+    text = "".join(literal)
+    words = []
+    for m in _WORD.finditer(text):
+        # A word ending right before \w* may be extended in the text
+        words.append((m.group(0), text[m.end():m.end() + 1] == "*"))
+    exact = (len(words) == 1 and text.strip(" *") == words[0][0]
+             and (not wildcard or words[0][1]))
+    return words, exact
+
+class CorpusIndex:
+    """
+    Posting lists of the words of a corpus.
+
+    Args:
+        case_sensitive: Index the unfolded text (must match the screening config)
+        loader: Callable returning the paper with a given id, used to
+                check candidates of inexact terms and to collect evidence
+    """
+
+    def __init__(self, case_sensitive=False, loader=None):
+        self.case_sensitive = case_sensitive
+        self.loader = loader
+        self.filenames = []
+        self._postings = {}
+        self._vocabulary = None
+        self._texts = set()
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def add(self, paper):
+        """Index one paper; returns its id (papers are numbered in order of addition)."""
+        doc_id = len(self.filenames)
+        self.filenames.append(paper.get("filename", "unknown"))
+        if paper.get("full_text"):
+            self._texts.add(doc_id)
+            postings = self._postings
+            for word in set(_WORD.findall(scanned_text(paper, self.case_sensitive))):
+                posting = postings.get(word)
+                if posting is None:
+                    postings[word] = posting = array("I")
+                posting.append(doc_id)
+            self._vocabulary = None
+        return doc_id
+
+    def word_documents(self, word, prefix=False):
+        """Ids of the papers containing word (or, with prefix=True, any word starting with it)."""
+        if not prefix:
+            return set(self._postings.get(word, ()))
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        docs = set()
+        i = bisect_left(vocabulary, word)
+        while i < len(vocabulary) and vocabulary[i].startswith(word):
+            docs.update(self._postings[vocabulary[i]])
+            i += 1
+        return docs
+
+    def term_candidates(self, pattern):
+        """(ids of the papers pattern may match, exact): exact means it matches all of them."""
+        words, exact = _term_words(pattern)
+        docs = None
+        for word, prefix in words:
+            found = self.word_documents(word, prefix)
+            docs = found if docs is None else docs & found
+            if not docs:
+                break
+        return (set(self._texts) if docs is None else docs), exact
+
+    def document_frequencies(self, node):
+        """
+        {TermNode.pattern: fraction of papers containing the term} for the
+        terms of a query AST, as used by query_planner.QueryPlanner; for
+        inexact terms the fraction of candidate papers (an upper bound).
+        """
+        total = max(len(self), 1)
+        return {n.pattern: len(self.term_candidates(_term_regex(n, self.case_sensitive).pattern)[0]) / total
+                for n in _iter_terms(node)}
+
+    def evaluate(self, node):
+        """Ids of all papers the query AST is true for."""
+        patterns = {n.pattern: _term_regex(n, self.case_sensitive).pattern for n in _iter_terms(node)}
+        matches = {}
+        unverified = {}
+        for pattern in set(patterns.values()):
+            docs, exact = self.term_candidates(pattern)
+            if exact:
+                matches[pattern] = docs
+            else:
+                matches[pattern] = set()
+                unverified[pattern] = docs
+        self._verify(unverified, matches)
+
+        def eval_node(n):
+            if n.kind == "term":
+                return matches[patterns[n.pattern]]
+            if n.kind == "not":
+                return self._texts - eval_node(n.child)
+            sets = [eval_node(c) for c in n.children]
+            if n.kind == "and":
+                return set.intersection(*sets)
+            return set.union(*sets)
+
+        return eval_node(node)
+
+    def _verify(self, candidates, matches):
+        """Check inexact terms with their regex, reading each candidate paper once."""
+        by_doc = {}
+        for pattern, docs in candidates.items():
+            for doc_id in docs:
+                by_doc.setdefault(doc_id, []).append(pattern)
+        if by_doc and self.loader is None:
+            raise ValueError("CorpusIndex needs a loader to check phrase and punctuation terms")
+        for doc_id in sorted(by_doc):
+            text = scanned_text(self.loader(doc_id), self.case_sensitive)
+            for pattern, spans in scan_terms(text, by_doc[doc_id], limit=1).items():
+                if spans:
+                    matches[pattern].add(doc_id)
+
+    def screen(self, query_node, config):
+        """
+        Yield the validation result of every paper, in order, as
+        validate_papers would; only included papers are read again (for
+        their evidence).
+        """
+        if config.get("text_processing", {}).get("case_sensitive", False) != self.case_sensitive:
+            raise ValueError("The index was built for a different case_sensitive setting")
+        included = self.evaluate(query_node)
+        for doc_id, filename in enumerate(self.filenames):
+            if doc_id in included:
+                yield validate_single_paper_query(self.loader(doc_id), query_node, config)
+            elif doc_id in self._texts:
+                yield query_result(get_paper_filename(filename), False, [])
+            else:
+                yield validate_single_paper_query({"filename": filename}, query_node, config)
+
+    def close(self):
+        """Release the paper source (a memory-mapped pack stays open until then)."""
+        close = getattr(self.loader, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class _Loader:
+    """Random access to the papers of an extraction directory, by index id."""
+
+    def __init__(self, lookup, close=None):
+        self._lookup = lookup
+        self.close = close or (lambda: None)
+
+    def __call__(self, doc_id):
+        return self._lookup(doc_id)
+
+def build_index(json_dir, case_sensitive=False, corpus_format=None, json_options=None):
+    """
+    Index the extracted papers of json_dir (JSON files selected by
+    json_options, corpus store or pack, see validator.open_papers) in the
+    order validate_papers reads them.
+    """
+    corpus_format = corpus_format or detect_corpus_format(json_dir)
+    if corpus_format == "pack":
+        corpus = PackedCorpus(json_dir)
+        index = CorpusIndex(case_sensitive, _Loader(corpus.__getitem__, corpus.close))
+        for paper in corpus:
+            index.add(paper)
+    elif corpus_format == "jsonl.gz":
+        reader = CorpusReader(json_dir)
+        index = CorpusIndex(case_sensitive)
+        index.loader = _Loader(lambda doc_id: reader.get(index.filenames[doc_id]))
+        for paper in reader:
+            index.add(paper)
+    else:
+        paths = []
+        index = CorpusIndex(case_sensitive, _Loader(lambda doc_id: load_json_file(paths[doc_id])))
+        for json_path, data, error in iter_json_files(list_json_files(json_dir, **(json_options or {}))):
+            if error is not None:
+                print(f"Error loading {json_path.name}: {error}")
+                continue
+            paths.append(json_path)
+            index.add(data)
+    return index
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index an extraction directory and try queries against it interactively"
+    )
+    parser.add_argument("directory", help="Extraction directory, e.g. test_results/extracted_json")
+    parser.add_argument("--config", default="config.json", help="Configuration file (for case sensitivity)")
+    parser.add_argument("--show", type=int, default=10, help="Matching papers to list per query (default: 10)")
+    parser.add_argument("--plan", action="store_true",
+                        help="Also print the evaluation order chosen by the query planner")
+    parser.add_argument("--recursive", action="store_true",
+                        help="Also index JSON files in subfolders (extraction of a --recursive run)")
+    args = parser.parse_args()
+
+    if not Path(args.directory).is_dir():
+        parser.error(f"not a directory: {args.directory}")
+    from query_parser import QuerySyntaxError, parse_query
+
+    case_sensitive = load_config(args.config).get("text_processing", {}).get("case_sensitive", False)
+    start = time.perf_counter()
+    with build_index(args.directory, case_sensitive, json_options={"recursive": args.recursive}) as index:
+        print(f"Indexed {len(index)} papers in {time.perf_counter() - start:.1f}s. "
+              "Enter a query per line (empty line or Ctrl+D to quit).")
+        for line in sys.stdin:
+            if not line.strip():
+                break
+            try:
+                node = parse_query(line)
+            except QuerySyntaxError as e:
+                print(f"❌ {e}")
+                continue
+            if args.plan:
+                print(QueryPlanner(node, frequencies=index.document_frequencies(node)).format_plan(indent=3))
+            start = time.perf_counter()
+            included = sorted(index.evaluate(node))
+            print(f"{len(included)} of {len(index)} papers match ({(time.perf_counter() - start) * 1000:.0f} ms)")
+            for doc_id in included[:args.show]:
+                print(f"   {get_paper_filename(index.filenames[doc_id])}")
+
+if __name__ == "__main__":
+    main()
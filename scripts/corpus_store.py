@@ -0,0 +1,162 @@
+"""
+Corpus Store Module
+
+Single-file storage for extracted papers, as an alternative to one JSON file
+per PDF. Large screening runs otherwise spend much of their I/O time on file
+metadata (100k papers = 100k small files), which is especially slow on
+network file systems.
+
+Layout (inside the extraction directory):
+  corpus.jsonl.gz      one gzip member per paper, each holding one JSON line;
+                       the concatenation is itself a valid gzip file, so
+                       `zcat corpus.jsonl.gz` shows every record
+  corpus.jsonl.gz.idx  offset index, one line per record:
+                       "<offset>\\t<length>\\t<filename>"
+
+Records are only ever appended. If a paper is written twice, the later record
+wins. A record whose index line is missing (e.g. after an interrupted run) is
+simply not visible; a missing index is rebuilt by scanning the members.
+"""
+
+import gzip
+import json
+import zlib
+from pathlib import Path
+
+CORPUS_FILENAME = "corpus.jsonl.gz"
+INDEX_SUFFIX = ".idx"
+
+# Output formats accepted by extract_pdfs_to_json / --corpus-format
+CORPUS_FORMATS = ("json", "jsonl.gz")
+
+def corpus_path(directory):
+    """Path of the corpus file inside an extraction directory."""
+    return Path(directory) / CORPUS_FILENAME
+
+def has_corpus(directory):
+    """True if the directory holds a corpus store."""
+    return corpus_path(directory).is_file()
+
+class CorpusWriter:
+    """
+    Append papers to a corpus store.
+
+    Args:
+        directory: Extraction directory (created if needed)
+        append: Keep existing records; otherwise start a new, empty store
+    """
+
+    def __init__(self, directory, append=False):
+        self.path = corpus_path(directory)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "ab" if append else "wb"
+        self._data = open(self.path, mode)
+        self._index = open(str(self.path) + INDEX_SUFFIX, mode)
+        if append and self._index.tell() > 0:
+            # Terminate a partial last line left by an interrupted run
+            self._index.write(b"\n")
+
+    def write(self, record):
+        """Append one paper record (a dict with at least 'filename')."""
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        member = gzip.compress(line, compresslevel=6)
+        offset = self._data.tell()
+        self._data.write(member)
+        # Data before index, so an index line never points past the data
+        self._data.flush()
+        self._index.write(f"{offset}\t{len(member)}\t{record['filename']}\n".encode("utf-8"))
+        self._index.flush()
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _scan_members(path, chunk_size=1024 * 1024):
+    """Yield (offset, length, record) for every gzip member of a corpus file."""
+    with open(path, "rb") as f:
+        offset = 0
+        while True:
+            f.seek(offset)
+            decompressor = zlib.decompressobj(wbits=31)
+            parts = []
+            consumed = 0
+            try:
+                while not decompressor.eof:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    consumed += len(chunk)
+                    parts.append(decompressor.decompress(chunk))
+            except zlib.error:
+                # Damaged tail from an interrupted write
+                return
+            if not decompressor.eof:
+                return
+            length = consumed - len(decompressor.unused_data)
+            yield offset, length, json.loads(b"".join(parts))
+            offset += length
+
+class CorpusReader:
+    """
+    Read papers from a corpus store.
+
+    Iteration streams records in the order they were first written, reading
+    one compressed record at a time; get() looks a single paper up by filename.
+    """
+
+    def __init__(self, directory):
+        self.path = corpus_path(directory)
+        self._offsets = self._load_index()
+
+    def _load_index(self):
+        """Map filename -> (offset, length) for the latest record of each paper."""
+        offsets = {}
+        index_path = Path(str(self.path) + INDEX_SUFFIX)
+        if not index_path.is_file():
+            print(f"Rebuilding missing corpus index for {self.path}")
+            with open(index_path, "wb") as index:
+                for offset, length, record in _scan_members(self.path):
+                    offsets[record["filename"]] = (offset, length)
+                    index.write(f"{offset}\t{length}\t{record['filename']}\n".encode("utf-8"))
+            return offsets
+
+        with open(index_path, "rb") as index:
+            for raw_line in index:
+                try:
+                    offset, length, filename = raw_line.decode("utf-8").rstrip("\n").split("\t", 2)
+                    location = (int(offset), int(length))
+                except ValueError:
+                    # Partial line from an interrupted run
+                    continue
+                # Re-inserting moves nothing: dict order is first-write order
+                offsets[filename] = location
+        return offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def filenames(self):
+        return list(self._offsets)
+
+    def _read(self, f, offset, length):
+        f.seek(offset)
+        return json.loads(gzip.decompress(f.read(length)))
+
+    def get(self, filename):
+        """Return the record for one paper, or None if it is not stored."""
+        location = self._offsets.get(filename)
+        if location is None:
+            return None
+        with open(self.path, "rb") as f:
+            return self._read(f, *location)
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            for offset, length in self._offsets.values():
+                yield self._read(f, offset, length)
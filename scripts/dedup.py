@@ -0,0 +1,169 @@
+"""
+Duplicate Detection Module
+
+Finds papers that occur more than once in a screening batch (renamed
+downloads, the same file from two databases, preprint and published
+version) so that only one representative per cluster is evaluated.
+
+Papers are checked one at a time, in the order they are screened:
+
+  1. exact duplicates: same PDF bytes (SHA-256) or same cleaned text
+  2. near duplicates: MinHash signatures of word 5-gram shingles of the
+     case/accent-folded text, bucketed with LSH banding; candidates are
+     confirmed by their estimated Jaccard similarity
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+the minimum is kept per hash bin, which makes a signature cost one pass over
+the text instead of one pass per permutation.
+
+The first paper of a cluster is its representative; later members point to it.
+"""
+
+import hashlib
+import zlib
+from pathlib import Path
+
+from extraction_cache import hash_pdf
+from text_normalizer import NORMALIZATION_VERSION, fold_text
+
+# Signature length (hash bins) and LSH banding: 32 bands of 4 rows put the
+# candidate threshold near a similarity of 0.42, well below DEFAULT_THRESHOLD
+SIGNATURE_SIZE = 128
+BAND_ROWS = 4
+
+# Words per shingle
+SHINGLE_WORDS = 5
+
+# Estimated Jaccard similarity at which two papers count as near duplicates
+DEFAULT_THRESHOLD = 0.8
+
+_EMPTY_BIN = 0xFFFFFFFF
+
+def _mix(value):
+    # Multiplicative (Fibonacci) hashing spreads crc32's linear structure
+    return (value * 0x9E3779B1) & 0xFFFFFFFF
+
+def minhash_signature(folded_text, size=SIGNATURE_SIZE, shingle_words=SHINGLE_WORDS):
+    """
+    One-permutation MinHash signature of a text's word shingles.
+
+    Returns a tuple of `size` hash values; bins no shingle fell into hold
+    0xFFFFFFFF.
+    """
+    words = folded_text.split()
+    signature = [_EMPTY_BIN] * size
+    if len(words) < shingle_words:
+        shingles = [" ".join(words)] if words else []
+    else:
+        shingles = (" ".join(words[i:i + shingle_words]) for i in range(len(words) - shingle_words + 1))
+    for shingle in shingles:
+        h = _mix(zlib.crc32(shingle.encode("utf-8")))
+        b = h % size
+        if h < signature[b]:
+            signature[b] = h
+    return tuple(signature)
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    used = 0
+    equal = 0
+    for a, b in zip(sig_a, sig_b):
+        if a == _EMPTY_BIN and b == _EMPTY_BIN:
+            continue
+        used += 1
+        if a == b:
+            equal += 1
+    return equal / used if used else 0.0
+
+class Deduplicator:
+    """
+    Streaming exact- and near-duplicate detector.
+
+    Args:
+        threshold: Minimum estimated Jaccard similarity for near duplicates
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._by_bytes = {}
+        self._by_text = {}
+        self._signatures = {}
+        self._buckets = {}
+
+    def _text_keys(self, paper):
+        full_text = paper.get("full_text") or ""
+        if paper.get("normalization_version") == NORMALIZATION_VERSION and "folded_text" in paper:
+            folded = paper["folded_text"]
+        else:
+            folded = fold_text(" ".join(full_text.split()))[0]
+        text_hash = hashlib.sha256(full_text.encode("utf-8")).hexdigest()
+        return folded, text_hash
+
+    def _byte_hash(self, paper):
+        pdf_path = paper.get("pdf_path")
+        if not pdf_path or not Path(pdf_path).is_file():
+            return None
+        try:
+            return hash_pdf(pdf_path)
+        except OSError:
+            return None
+
+    def _bands(self, signature):
+        for start in range(0, len(signature), BAND_ROWS):
+            yield (start, signature[start:start + BAND_ROWS])
+
+    def check(self, paper):
+        """
+        Register a paper and report whether it duplicates an earlier one.
+
+        Returns:
+            tuple or None: (representative_filename, match, similarity) where
+                           match is 'identical_file', 'identical_text' or
+                           'near_duplicate'; None if the paper is new (it then
+                           becomes the representative of its own cluster)
+        """
+        filename = paper.get("filename", "unknown")
+        byte_hash = self._byte_hash(paper)
+        if byte_hash and byte_hash in self._by_bytes:
+            return self._by_bytes[byte_hash], 'identical_file', 1.0
+
+        folded, text_hash = self._text_keys(paper)
+        if text_hash in self._by_text:
+            return self._by_text[text_hash], 'identical_text', 1.0
+
+        signature = minhash_signature(folded)
+        best = None
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self._buckets.get(band, ()))
+        for candidate in candidates:
+            similarity = estimate_similarity(signature, self._signatures[candidate])
+            if similarity >= self.threshold and (best is None or similarity > best[1]
+                                                 or (similarity == best[1] and candidate < best[0])):
+                best = (candidate, similarity)
+        if best is not None:
+            return best[0], 'near_duplicate', round(best[1], 3)
+
+        # New representative
+        if byte_hash:
+            self._by_bytes[byte_hash] = filename
+        self._by_text[text_hash] = filename
+        self._signatures[filename] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(filename)
+        return None
+
+def duplicate_clusters(validation_results):
+    """
+    Group validation results into duplicate clusters.
+
+    Returns:
+        list: one dict per cluster with 'representative' and 'duplicates'
+              (the member results), in order of the representatives
+    """
+    clusters = {}
+    for result in validation_results:
+        representative = result.get("duplicate_of")
+        if representative:
+            clusters.setdefault(representative, []).append(result)
+    return [{"representative": rep, "duplicates": members} for rep, members in clusters.items()]
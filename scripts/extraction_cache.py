@@ -0,0 +1,96 @@
+"""
+Extraction Cache Module
+
+Content-addressed, on-disk cache for PDF extraction results.
+
+Entries are keyed by the SHA-256 of the PDF bytes combined with a version
+string describing the extractor (see pdf_extractor.extraction_cache_version),
+so a renamed or moved PDF is still a cache hit while a changed PDF or an
+updated extractor/cleaner is a miss. Definitive failures (encrypted or
+corrupted PDFs) are cached as well so they are not retried on every run.
+
+Writes go to a temporary file that is atomically renamed into place, which
+makes it safe for several runs to share one cache directory concurrently.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Failures that will not go away by retrying the same bytes with the same extractor
+CACHEABLE_ERROR_CODES = {'PDF_ENCRYPTED', 'PDF_CORRUPTED'}
+
+_CHUNK_SIZE = 1024 * 1024
+
+def hash_pdf(pdf_path):
+    """Return the hex SHA-256 digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ExtractionCache:
+    """Persistent extraction cache rooted at cache_dir."""
+
+    def __init__(self, cache_dir, version):
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, content_hash):
+        key = hashlib.sha256(f"{content_hash}:{self.version}".encode("utf-8")).hexdigest()
+        # Two-level fan-out keeps directories small on large libraries
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, content_hash):
+        """Return the cached extraction outcome, or None on a miss."""
+        entry_path = self._entry_path(content_hash)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("version") != self.version or entry.get("content_hash") != content_hash:
+            return None
+        return entry.get("outcome")
+
+    def put(self, content_hash, outcome):
+        """
+        Store an extraction outcome.
+
+        Only complete successful extractions and failures listed in
+        CACHEABLE_ERROR_CODES are stored. Returns True if the entry was written.
+        """
+        error_code = outcome.get('error_code')
+        if error_code and error_code not in CACHEABLE_ERROR_CODES:
+            return False
+        if outcome.get('complete') is False:
+            # Stopped early for one particular query; not reusable
+            return False
+
+        entry_path = self._entry_path(content_hash)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "content_hash": content_hash,
+            "version": self.version,
+            "outcome": outcome
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            # Atomic on POSIX and Windows; concurrent writers of the same key
+            # produce identical content, so last-writer-wins is harmless
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            print(f"Warning: could not write extraction cache entry: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
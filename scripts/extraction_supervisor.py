@@ -0,0 +1,193 @@
+"""
+Extraction Supervisor Module
+
+Runs PDF extraction in supervised worker processes so that a single
+malformed PDF cannot stall or exhaust a whole screening run:
+
+  - per-document wall-clock budget: a worker that overruns is killed and replaced
+  - address-space cap per worker (POSIX only, via resource.RLIMIT_AS)
+  - recycling of workers after N documents to contain library memory leaks
+
+Results are yielded in input order, independent of which worker finishes first.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+try:
+    import resource
+    RESOURCE_LIMITS_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_LIMITS_AVAILABLE = False
+
+# Task statuses yielded by SupervisedPool.imap
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_MEMORY = "memory"
+STATUS_CRASHED = "crashed"
+
+def _worker_main(conn, func, max_memory_mb):
+    """Worker loop: apply func to (index, item) tasks until told to stop."""
+    if max_memory_mb and RESOURCE_LIMITS_AVAILABLE:
+        limit = int(max_memory_mb) * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            print(f"Warning: could not apply memory limit of {max_memory_mb} MB: {e}")
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        index, item = task
+        try:
+            reply = (index, STATUS_OK, func(item))
+        except MemoryError:
+            reply = (index, STATUS_MEMORY, None)
+        except Exception as e:
+            reply = (index, STATUS_CRASHED, str(e))
+        conn.send(reply)
+    conn.close()
+
+class _Worker:
+    """One supervised worker process and its pipe."""
+
+    def __init__(self, ctx, func, max_memory_mb):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, func, max_memory_mb), daemon=True)
+        self.process.start()
+        # Only the child holds this end, so its death shows up as EOF on self.conn
+        child_conn.close()
+        self.tasks_done = 0
+        self.task = None  # (index, deadline) while busy
+
+    def assign(self, index, item, timeout):
+        deadline = time.monotonic() + timeout if timeout else None
+        self.task = (index, deadline)
+        self.conn.send((index, item))
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class SupervisedPool:
+    """
+    Minimal process pool with per-task timeouts, memory caps and worker recycling.
+
+    Args:
+        func: Picklable callable applied to each item
+        workers: Number of worker processes
+        timeout: Wall-clock seconds allowed per item (None = unlimited)
+        max_memory_mb: Address-space cap per worker in MB (None = unlimited; POSIX only)
+        max_tasks_per_worker: Replace a worker after this many items (None = never)
+
+    Idle workers are kept between imap calls, so a long-running caller (watch
+    mode) does not start a process per item; close() or leaving a with block
+    stops them.
+    """
+
+    def __init__(self, func, workers=1, *, timeout=None, max_memory_mb=None, max_tasks_per_worker=None):
+        self.func = func
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._ctx = multiprocessing.get_context()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the idle workers."""
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def _spawn(self):
+        return _Worker(self._ctx, self.func, self.max_memory_mb)
+
+    def imap(self, items):
+        """
+        Yield (item, status, result) for each item, in input order.
+
+        status is one of STATUS_OK (result is func's return value),
+        STATUS_TIMEOUT, STATUS_MEMORY (MemoryError in the worker) or
+        STATUS_CRASHED (result is the error message or the worker's exit code).
+        """
+        items = list(items)
+        pending = deque(range(len(items)))
+        done = {}
+        next_index = 0
+        workers = self._workers
+        workers.extend(self._spawn() for _ in range(min(self.workers, len(items)) - len(workers)))
+
+        def replace(slot, kill=False):
+            workers[slot].stop(kill=kill)
+            workers[slot] = self._spawn() if pending else None
+
+        try:
+            while next_index < len(items):
+                for worker in workers:
+                    if worker is not None and worker.task is None and pending:
+                        index = pending.popleft()
+                        worker.assign(index, items[index], self.timeout)
+
+                busy = [w for w in workers if w is not None and w.task is not None]
+                if not busy:
+                    raise RuntimeError("SupervisedPool lost track of pending tasks")
+                wait_for = None
+                if self.timeout:
+                    wait_for = max(0.0, min(w.task[1] for w in busy) - time.monotonic())
+                ready = wait([w.conn for w in busy], wait_for)
+
+                for slot, worker in enumerate(workers):
+                    if worker is None or worker.task is None:
+                        continue
+                    index, deadline = worker.task
+                    if worker.conn in ready:
+                        try:
+                            _index, status, result = worker.conn.recv()
+                        except (EOFError, OSError):
+                            # Worker died mid-task (segfault, OOM killer, ...)
+                            worker.process.join(timeout=5)
+                            done[index] = (STATUS_CRASHED, worker.process.exitcode)
+                            replace(slot, kill=True)
+                            continue
+                        done[index] = (status, result)
+                        worker.task = None
+                        worker.tasks_done += 1
+                        if self.max_tasks_per_worker and worker.tasks_done >= self.max_tasks_per_worker:
+                            replace(slot)
+                    elif deadline is not None and time.monotonic() >= deadline:
+                        done[index] = (STATUS_TIMEOUT, None)
+                        replace(slot, kill=True)
+
+                while next_index in done:
+                    status, result = done.pop(next_index)
+                    yield items[next_index], status, result
+                    next_index += 1
+        finally:
+            # Workers still busy (the caller stopped iterating early) are killed, idle ones kept
+            for worker in workers:
+                if worker is not None and worker.task is not None:
+                    worker.stop(kill=True)
+            self._workers = [w for w in workers if w is not None and w.task is None]
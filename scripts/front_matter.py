@@ -0,0 +1,92 @@
+"""
+Front Matter Module
+
+Helpers for title/abstract screening (--stage abstract), where only the front
+matter of each paper is needed:
+
+  - find_front_matter_end: locate the "Introduction" heading that ends the
+    title/abstract/keywords block on a page
+  - read_pdf_metadata: title, subject and keywords from the PDF document
+    information dictionary, completed from XMP metadata where available
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Pages read by default in abstract stage
+DEFAULT_FRONT_PAGES = 2
+
+# A line holding only an (optionally numbered) introduction heading, e.g.
+# "1. Introduction", "I INTRODUCTION", "1 Einleitung"
+_FRONT_MATTER_END = re.compile(
+    r"^[ \t]*(?:(?:\d+|[IVX]+)\.?[ \t]+)?(?:introduction|einleitung)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+_XMP_NAMESPACES = {
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "pdf": "http://ns.adobe.com/pdf/1.3/",
+}
+
+def find_front_matter_end(page_text):
+    """Return the offset of an introduction heading in raw page text, or None."""
+    match = _FRONT_MATTER_END.search(page_text)
+    return match.start() if match else None
+
+def _xmp_values(root, path):
+    """Text of an XMP property, flattening rdf:Alt/Bag/Seq containers."""
+    values = []
+    for element in root.iterfind(f".//{path}", _XMP_NAMESPACES):
+        items = element.findall(".//rdf:li", _XMP_NAMESPACES)
+        for node in items or [element]:
+            if node.text and node.text.strip():
+                values.append(node.text.strip())
+    return values
+
+def _read_xmp(xml_text):
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return {}
+    xmp = {}
+    title = _xmp_values(root, "dc:title")
+    if title:
+        xmp["title"] = title[0]
+    description = _xmp_values(root, "dc:description")
+    if description:
+        xmp["subject"] = description[0]
+    keywords = _xmp_values(root, "pdf:Keywords") or _xmp_values(root, "dc:subject")
+    if keywords:
+        xmp["keywords"] = "; ".join(keywords)
+    return xmp
+
+def read_pdf_metadata(pdf_path):
+    """
+    Read descriptive metadata of a PDF.
+
+    Returns:
+        dict: any of 'title', 'subject' and 'keywords' that are present
+              (empty if PyMuPDF is unavailable or the file has none)
+    """
+    if not PYMUPDF_AVAILABLE:
+        return {}
+    try:
+        with fitz.open(pdf_path) as doc:
+            info = doc.metadata or {}
+            xml_text = doc.get_xml_metadata()
+    except Exception:
+        return {}
+
+    metadata = {key: (info.get(key) or "").strip() for key in ("title", "subject", "keywords")}
+    if xml_text:
+        for key, value in _read_xmp(xml_text).items():
+            if not metadata[key]:
+                metadata[key] = value
+    return {key: value for key, value in metadata.items() if value}
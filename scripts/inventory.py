@@ -0,0 +1,176 @@
+"""
+Input Inventory Module
+
+Lists the input folder once per run and hands the result to every stage
+(prerequisite check, extraction, sorting, watch mode) instead of each
+stage globbing the folder again.
+
+The folder is walked with os.scandir, which reports whether an entry is a
+file or a folder without an extra stat call on most file systems, and on
+Windows also returns size and modification time from the directory
+listing itself. This keeps a pass over a large library on a network drive
+close to one round trip per folder.
+
+Each PDF is recorded with its path relative to the input folder (with "/"
+separators), which the toolkit then uses as the paper's filename, so that
+equally named PDFs in different subfolders stay apart and sorted_pdfs
+mirrors the input layout.
+"""
+
+import os
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from corpus_store import has_corpus
+from packed_corpus import has_pack
+
+# File name patterns of the documents to screen
+DEFAULT_INCLUDE = ("*.pdf",)
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    """One PDF of the input folder."""
+    path: Path
+    relative: str
+    size: int
+    mtime_ns: int
+
+@dataclass
+class Inventory:
+    """
+    Result of one pass over the input folder.
+
+    Attributes:
+        root: The input folder
+        pdfs: InventoryEntry per PDF, sorted by relative path
+        json_files: Sorted paths of the pre-extracted JSON files in root,
+                    selected like the PDFs (patterns for ".pdf" names apply
+                    to the ".json" names) in the same pass
+        corpus: True if root holds a corpus store (corpus.jsonl.gz)
+        pack: True if root holds a packed corpus (corpus.pack)
+        options: The iter_inventory arguments the folder was listed with
+    """
+    root: Path
+    pdfs: list = field(default_factory=list)
+    json_files: list = field(default_factory=list)
+    corpus: bool = False
+    pack: bool = False
+    options: dict = field(default_factory=dict)
+
+    @property
+    def json_count(self):
+        """Number of pre-extracted JSON files."""
+        return len(self.json_files)
+
+    @property
+    def pre_extracted(self):
+        """True if root holds extracted text in any format."""
+        return bool(self.json_files or self.corpus or self.pack)
+
+    def snapshot(self):
+        """{relative path: (size, mtime_ns)} for every PDF."""
+        return {entry.relative: (entry.size, entry.mtime_ns) for entry in self.pdfs}
+
+def _matches(patterns, name, relative):
+    name = name.lower()
+    relative = relative.lower()
+    return any(fnmatchcase(name, p) or fnmatchcase(relative, p) for p in patterns)
+
+def iter_inventory(root, include=DEFAULT_INCLUDE, exclude=(), recursive=False, skip_dirs=()):
+    """
+    Stream the PDFs below a folder.
+
+    Args:
+        root: Folder to list
+        include: File name patterns to keep (case-insensitive), e.g. "*.pdf"
+        exclude: Patterns for files or folders to leave out, matched against
+                 the name and against the path relative to root, e.g.
+                 "drafts" or "2019/*"
+        recursive: Also list subfolders
+        skip_dirs: Folders never entered, e.g. an output folder inside root
+
+    Yields:
+        InventoryEntry, in file system order. Hidden entries (starting with
+        ".") and entries that vanish while listing are skipped.
+    """
+    for _selection, entry in _scan(root, [(include, exclude)], recursive, skip_dirs):
+        yield entry
+
+def _scan(root, selections, recursive=False, skip_dirs=()):
+    """
+    One pass of iter_inventory for several (include, exclude) selections.
+
+    Folders matching the exclude patterns of any selection are not entered.
+
+    Yields:
+        (index of the selection, InventoryEntry) per selected file; a file
+        selected more than once is yielded once per selection.
+    """
+    root = Path(root)
+    selections = [([p.lower() for p in include], [p.lower() for p in exclude]) for include, exclude in selections]
+    folder_exclude = [p for _include, exclude in selections for p in exclude]
+    skipped = {os.path.normcase(os.path.abspath(d)) for d in skip_dirs}
+    folders = [(root, "")]
+    while folders:
+        folder, prefix = folders.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        subfolders = []
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                relative = prefix + entry.name
+                try:
+                    if entry.is_dir():
+                        if (recursive and not _matches(folder_exclude, entry.name, relative)
+                                and os.path.normcase(os.path.abspath(entry.path)) not in skipped):
+                            subfolders.append((Path(entry.path), relative + "/"))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    selected = [index for index, (include, exclude) in enumerate(selections)
+                                if _matches(include, entry.name, relative)
+                                and not _matches(exclude, entry.name, relative)]
+                    if not selected:
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                inventory_entry = InventoryEntry(Path(entry.path), relative, stat.st_size, stat.st_mtime_ns)
+                for index in selected:
+                    yield index, inventory_entry
+        folders.extend(subfolders)
+
+def _as_json(patterns):
+    """Patterns for ".pdf" names turned into patterns for the ".json" names."""
+    return tuple(p[:-4] + ".json" if p.lower().endswith(".pdf") else p for p in patterns)
+
+def list_json_files(root, include=("*.json",), exclude=(), recursive=False, skip_dirs=()):
+    """
+    Sorted paths of the JSON files of a folder, selected as by
+    iter_inventory (only files directly in root unless recursive).
+    """
+    return sorted(entry.path for entry in iter_inventory(root, include, exclude, recursive, skip_dirs)
+                  if entry.path.name.lower().endswith(".json"))
+
+def build_inventory(root, include=DEFAULT_INCLUDE, exclude=(), recursive=False, skip_dirs=()):
+    """
+    Build the Inventory of an input folder (see iter_inventory for the
+    arguments), listing its PDFs and pre-extracted JSON in one pass.
+    """
+    root = Path(root)
+    options = {"include": tuple(include), "exclude": tuple(exclude), "recursive": recursive,
+               "skip_dirs": tuple(skip_dirs)}
+    selections = [(include, exclude), (_as_json(include), _as_json(exclude))]
+    pdfs, json_files = [], []
+    for selection, entry in _scan(root, selections, recursive, skip_dirs):
+        if selection == 0:
+            pdfs.append(entry)
+        elif entry.path.name.lower().endswith(".json"):
+            json_files.append(entry.path)
+    pdfs.sort(key=lambda e: e.relative)
+    return Inventory(root, pdfs, sorted(json_files), has_corpus(root), has_pack(root), options)
@@ -0,0 +1,288 @@
+"""
+Packed Corpus Module
+
+Read-only binary packing of an extraction directory for repeated screening
+runs over the same corpus. Loading one JSON file (or gzip record) per paper
+means every run re-reads and re-decodes the whole corpus; a pack is opened
+with mmap instead, so a warm start costs a few page faults regardless of
+corpus size, and each text is only decoded when it is actually read.
+
+Layout of corpus.pack (all integers little-endian):
+  header   magic "LSTPACK1", format version, document count, and the
+           offset/length of the name list and of the document table
+  blobs    per document: full_text (UTF-8), folded_text (UTF-8) and the
+           remaining JSON fields (page_offsets, fold_offsets, ...) as JSON
+  names    filenames, newline-separated (read only for lookups by name)
+  table    per document six uint64: offset and length of each blob
+
+Documents are exposed as PackedDocument views. A view is a read-only mapping
+with the same keys as the JSON record, so it can be passed wherever a paper
+dict is expected; text fields are decoded on first access. text_bytes and
+folded_bytes are zero-copy memoryviews of the mapped file for byte-level
+scanners (regex on bytes, index builders); their offsets count UTF-8 bytes,
+not characters.
+
+Build a pack from an extraction directory (JSON files or corpus store):
+
+    python scripts/packed_corpus.py test_results/extracted_json
+
+Writing new extraction results into the directory removes its pack, since
+it would no longer match; validate_papers then falls back to the JSON files.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from corpus_store import CorpusReader, has_corpus
+from json_loader import decode_json
+
+PACK_FILENAME = "corpus.pack"
+PACK_MAGIC = b"LSTPACK1"
+PACK_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQQ")  # magic, version, count, names offset/length, table offset/length
+_ENTRY_FIELDS = 6
+_ABSENT = 0xFFFFFFFFFFFFFFFF  # length of a folded_text blob the record did not have
+
+def pack_path(directory):
+    """Path of the pack file inside an extraction directory."""
+    return Path(directory) / PACK_FILENAME
+
+def has_pack(directory):
+    """True if the directory holds a packed corpus."""
+    return pack_path(directory).is_file()
+
+def discard_pack(directory):
+    """Remove the pack of a directory whose extraction results are being changed."""
+    try:
+        pack_path(directory).unlink()
+    except FileNotFoundError:
+        pass
+
+def write_pack(papers, directory):
+    """
+    Pack paper records into directory/corpus.pack.
+
+    papers is any iterable of paper dicts; it is consumed one record at a
+    time. The pack is written to a temporary file and moved into place, so
+    readers never see a partial pack.
+
+    Returns:
+        int: number of documents packed
+    """
+    path = pack_path(directory)
+    temp_path = path.with_name(path.name + ".tmp")
+    table = []
+    names = []
+    with open(temp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for paper in papers:
+            full_text = (paper.get("full_text") or "").encode("utf-8")
+            folded = paper.get("folded_text")
+            folded = folded.encode("utf-8") if folded is not None else None
+            meta = {k: v for k, v in paper.items() if k not in ("full_text", "folded_text")}
+            meta = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+            entry = []
+            for blob in (full_text, folded, meta):
+                entry.append(f.tell())
+                if blob is None:
+                    entry.append(_ABSENT)
+                    continue
+                f.write(blob)
+                entry.append(len(blob))
+            table.extend(entry)
+            names.append(paper.get("filename", "unknown").replace("\n", " "))
+
+        names_blob = "\n".join(names).encode("utf-8")
+        names_offset = f.tell()
+        f.write(names_blob)
+        # uint64 table, 8-byte aligned so it can be cast without copying
+        f.write(b"\0" * (-f.tell() % 8))
+        table_offset = f.tell()
+        table_blob = struct.pack(f"<{len(table)}Q", *table)
+        f.write(table_blob)
+        f.seek(0)
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(names), names_offset, len(names_blob),
+                             table_offset, len(table_blob)))
+    os.replace(temp_path, path)
+    return len(names)
+
+class PackedDocument(Mapping):
+    """Lazy, read-only view of one packed paper (see module docstring)."""
+
+    __slots__ = ("_corpus", "_index", "_meta", "_text", "_folded")
+
+    def __init__(self, corpus, index):
+        self._corpus = corpus
+        self._index = index
+        self._meta = None
+        self._text = None
+        self._folded = None
+
+    def _blob(self, field):
+        offset, length = self._corpus._entry(self._index, field)
+        if length == _ABSENT:
+            return None
+        return self._corpus._buffer[offset:offset + length]
+
+    @property
+    def text_bytes(self):
+        """full_text as a zero-copy memoryview of UTF-8 bytes."""
+        return self._blob(0)
+
+    @property
+    def folded_bytes(self):
+        """folded_text as a zero-copy memoryview of UTF-8 bytes (None if not stored)."""
+        return self._blob(1)
+
+    @property
+    def meta(self):
+        """All fields of the record except full_text and folded_text."""
+        if self._meta is None:
+            self._meta = decode_json(self._blob(2))
+        return self._meta
+
+    def _has_folded(self):
+        return self._corpus._entry(self._index, 1)[1] != _ABSENT
+
+    def __getitem__(self, key):
+        if key == "full_text":
+            if self._text is None:
+                self._text = str(self.text_bytes, "utf-8")
+            return self._text
+        if key == "folded_text" and self._has_folded():
+            if self._folded is None:
+                self._folded = str(self.folded_bytes, "utf-8")
+            return self._folded
+        return self.meta[key]
+
+    def __iter__(self):
+        yield "full_text"
+        if self._has_folded():
+            yield "folded_text"
+        yield from self.meta
+
+    def __len__(self):
+        return len(self.meta) + 1 + self._has_folded()
+
+    def __contains__(self, key):
+        if key == "full_text" or (key == "folded_text" and self._has_folded()):
+            return True
+        return key in self.meta
+
+class PackedCorpus:
+    """
+    Memory-mapped packed corpus.
+
+    Iteration yields PackedDocument views in pack order; get() looks a
+    paper up by filename. Use as a context manager (or call close()) to
+    unmap the file; views must not be used after that.
+    """
+
+    def __init__(self, directory):
+        self.path = pack_path(directory)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            self._file.close()
+            raise ValueError(f"Not a packed corpus: {self.path}")
+        self._buffer = memoryview(self._mmap)
+        header = _HEADER.unpack_from(self._buffer)
+        magic, version, self._count, self._names_offset, self._names_length, table_offset, table_length = header
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Not a packed corpus (or unsupported version): {self.path}")
+        self._table = self._buffer[table_offset:table_offset + table_length].cast("Q")
+        self._names = None
+        self._positions = None
+
+    def _entry(self, index, field):
+        base = index * _ENTRY_FIELDS + field * 2
+        return self._table[base], self._table[base + 1]
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return PackedDocument(self, index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield PackedDocument(self, index)
+
+    def filenames(self):
+        if self._names is None:
+            blob = self._buffer[self._names_offset:self._names_offset + self._names_length]
+            self._names = str(blob, "utf-8").split("\n") if self._count else []
+        return self._names
+
+    def get(self, filename):
+        """Return the view of one paper, or None if it is not packed."""
+        if self._positions is None:
+            # Like the corpus store, the last record of a filename wins
+            self._positions = {name: index for index, name in enumerate(self.filenames())}
+        index = self._positions.get(filename)
+        return None if index is None else self[index]
+
+    def close(self):
+        if self._buffer is None:
+            return
+        table = getattr(self, "_table", None)
+        if table is not None:
+            table.release()
+        self._buffer.release()
+        self._buffer = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A caller still holds text_bytes/folded_bytes; the mapping is
+            # released once those views are garbage collected
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def pack_directory(directory, recursive=False):
+    """
+    Pack the papers of an extraction directory (JSON files or corpus store);
+    recursive also packs JSON files in subfolders.
+    """
+    from pdf_extractor import iter_json_content
+
+    papers = CorpusReader(directory) if has_corpus(directory) else iter_json_content(directory, recursive=recursive)
+    return write_pack(papers, directory)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack an extraction directory into a memory-mapped corpus.pack for fast repeated screening"
+    )
+    parser.add_argument("directory", help="Extraction directory, e.g. test_results/extracted_json")
+    parser.add_argument("--recursive", action="store_true",
+                        help="Also pack JSON files in subfolders (extraction of a --recursive run)")
+    args = parser.parse_args()
+
+    if not Path(args.directory).is_dir():
+        parser.error(f"not a directory: {args.directory}")
+    start = time.perf_counter()
+    count = pack_directory(args.directory, recursive=args.recursive)
+    size_mb = pack_path(args.directory).stat().st_size / (1024 * 1024)
+    print(f"Packed {count} papers into {pack_path(args.directory)} "
+          f"({size_mb:.1f} MB, {time.perf_counter() - start:.1f}s)")
+
+if __name__ == "__main__":
+    main()
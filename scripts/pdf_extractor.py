@@ -1,296 +1,792 @@
-"""
-PDF Extractor Module
-
-Handles PDF text extraction and converts PDFs to JSON format for processing.
-Supports multiple PDF extraction methods for maximum compatibility.
-"""
-
-import json
-import os
-from pathlib import Path
-import re
-
-# PDF extraction libraries
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
-
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
-def extract_text_with_pymupdf(pdf_path):
-    """
-    Extract text using PyMuPDF (primary method).
-    
-    Returns:
-        tuple: (text, error_code) where error_code is None on success or one of:
-               'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
-    """
-    try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text.strip(), None
-    except fitz.FileDataError as e:
-        # Corrupted or invalid PDF structure
-        print(f"PyMuPDF extraction failed for {pdf_path}: Corrupted PDF file")
-        return None, 'PDF_CORRUPTED'
-    except fitz.FileNotFoundError as e:
-        print(f"PyMuPDF extraction failed for {pdf_path}: File not found")
-        return None, 'FILE_NOT_FOUND'
-    except RuntimeError as e:
-        # Check for encryption/password protection
-        error_str = str(e).lower()
-        if 'password' in error_str or 'encrypted' in error_str or 'crypt' in error_str:
-            print(f"PyMuPDF extraction failed for {pdf_path}: PDF is encrypted or password-protected")
-            return None, 'PDF_ENCRYPTED'
-        print(f"PyMuPDF extraction failed for {pdf_path}: {e}")
-        return None, 'UNKNOWN_ERROR'
-    except Exception as e:
-        # Catch-all for other errors
-        error_str = str(e).lower()
-        if 'password' in error_str or 'encrypted' in error_str or 'crypt' in error_str:
-            print(f"PyMuPDF extraction failed for {pdf_path}: PDF is encrypted or password-protected")
-            return None, 'PDF_ENCRYPTED'
-        print(f"PyMuPDF extraction failed for {pdf_path}: {e}")
-        return None, 'UNKNOWN_ERROR'
-
-def extract_text_with_pdfplumber(pdf_path):
-    """
-    Extract text using pdfplumber (fallback method).
-    
-    Returns:
-        tuple: (text, error_code) where error_code is None on success or one of:
-               'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
-    """
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text.strip(), None
-    except FileNotFoundError as e:
-        print(f"pdfplumber extraction failed for {pdf_path}: File not found")
-        return None, 'FILE_NOT_FOUND'
-    except Exception as e:
-        error_str = str(e).lower()
-        if 'password' in error_str or 'encrypted' in error_str or 'crypt' in error_str:
-            print(f"pdfplumber extraction failed for {pdf_path}: PDF is encrypted or password-protected")
-            return None, 'PDF_ENCRYPTED'
-        elif 'corrupt' in error_str or 'invalid' in error_str or 'damaged' in error_str:
-            print(f"pdfplumber extraction failed for {pdf_path}: Corrupted PDF file")
-            return None, 'PDF_CORRUPTED'
-        print(f"pdfplumber extraction failed for {pdf_path}: {e}")
-        return None, 'UNKNOWN_ERROR'
-
-def extract_text_from_pdf(pdf_path):
-    """
-    Extract text from PDF using available methods with fallback strategy.
-    
-    Returns:
-        tuple: (text, error_code) where error_code is one of:
-               None (success), 'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'NO_TEXT_CONTENT',
-               'LIBRARY_MISSING', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
-    """
-    # Check if any extraction library is available
-    if not PYMUPDF_AVAILABLE and not PDFPLUMBER_AVAILABLE:
-        return None, 'LIBRARY_MISSING'
-    
-    # Try PyMuPDF first (fastest and most reliable)
-    if PYMUPDF_AVAILABLE:
-        text, error_code = extract_text_with_pymupdf(pdf_path)
-        if text and len(text) > 50:  # Reasonable text extracted
-            return text, None
-        elif error_code in ['PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND']:
-            # These errors are definitive, no point trying fallback
-            return None, error_code
-        # Otherwise, try fallback (might be scanned PDF or OCR needed)
-    
-    # Fallback to pdfplumber
-    if PDFPLUMBER_AVAILABLE:
-        text, error_code = extract_text_with_pdfplumber(pdf_path)
-        if text and len(text) > 50:
-            return text, None
-        elif error_code:
-            return None, error_code
-    
-    # Both methods failed to extract sufficient text
-    # This usually means scanned PDF without OCR or truly empty PDF
-    return None, 'NO_TEXT_CONTENT'
-
-def clean_extracted_text(text):
-    """Clean and normalize extracted text."""
-    if not text:
-        return ""
-    
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove page numbers and common artifacts
-    text = re.sub(r'\b\d+\b\s*(?=\n|$)', '', text)  # Standalone numbers
-    text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)  # Page numbers
-    
-    # Normalize encoding issues - fix smart quotes and similar characters
-    text = text.replace(''', "'")  # Left single quote
-    text = text.replace(''', "'")  # Right single quote  
-    text = text.replace('"', '"')  # Left double quote
-    text = text.replace('"', '"')  # Right double quote
-    
-    return text.strip()
-
-def extract_pdfs_to_json(input_dir, output_dir):
-    """
-    Extract text from PDF files and save as JSON files.
-    
-    Args:
-        input_dir: Directory containing PDF files
-        output_dir: Directory to save JSON files
-    
-    Returns:
-        tuple: (successful_count, failed_list) where failed_list contains
-               dicts with keys 'filename', 'error_code', 'error_message'
-    """
-    
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    
-    pdf_files = list(Path(input_dir).glob("*.pdf"))
-    
-    if not pdf_files:
-        print(f"No PDF files found in {input_dir}")
-        return 0, []
-    
-    print(f"Found {len(pdf_files)} PDF files to process...")
-    
-    processed_count = 0
-    failed_files = []
-    
-    # Error code descriptions for user-friendly messages
-    ERROR_MESSAGES = {
-        'PDF_ENCRYPTED': 'PDF is password-protected or encrypted',
-        'PDF_CORRUPTED': 'PDF file is corrupted or has invalid structure',
-        'NO_TEXT_CONTENT': 'PDF contains no extractable text (likely scanned image)',
-        'LIBRARY_MISSING': 'No PDF extraction libraries available (install PyMuPDF or pdfplumber)',
-        'FILE_NOT_FOUND': 'PDF file not found or inaccessible',
-        'UNKNOWN_ERROR': 'Unknown error during PDF extraction'
-    }
-    
-    for pdf_path in pdf_files:
-        try:
-            print(f"Processing: {pdf_path.name}")
-            
-            # Extract text with error categorization
-            full_text, error_code = extract_text_from_pdf(pdf_path)
-            
-            if error_code:
-                # Extraction failed with specific error
-                error_msg = ERROR_MESSAGES.get(error_code, 'Unknown error')
-                print(f"  ❌ Failed: {error_msg}")
-                failed_files.append({
-                    'filename': pdf_path.name,
-                    'error_code': error_code,
-                    'error_message': error_msg
-                })
-                continue
-            
-            if not full_text or len(full_text) < 100:
-                print(f"  ⚠️  Warning: Minimal text extracted from {pdf_path.name}")
-                failed_files.append({
-                    'filename': pdf_path.name,
-                    'error_code': 'NO_TEXT_CONTENT',
-                    'error_message': ERROR_MESSAGES['NO_TEXT_CONTENT']
-                })
-                continue
-            
-            # Clean text
-            cleaned_text = clean_extracted_text(full_text)
-            
-            # Create JSON structure
-            json_data = {
-                "filename": pdf_path.name,
-                "pdf_path": str(pdf_path),
-                "full_text": cleaned_text,
-                "text_length": len(cleaned_text),
-                "extraction_method": "PyMuPDF" if PYMUPDF_AVAILABLE else "pdfplumber",
-                "extraction_date": "2025-09-05"
-            }
-            
-            # Save JSON file
-            json_filename = pdf_path.stem + ".json"
-            json_path = Path(output_dir) / json_filename
-            
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
-            
-            processed_count += 1
-            print(f"  ✅ Successfully extracted {len(cleaned_text)} characters")
-            
-        except Exception as e:
-            print(f"  ❌ Unexpected error processing {pdf_path.name}: {e}")
-            failed_files.append({
-                'filename': pdf_path.name,
-                'error_code': 'UNKNOWN_ERROR',
-                'error_message': str(e)
-            })
-    
-    print(f"\n📊 Extraction Summary:")
-    print(f"  Successful: {processed_count}/{len(pdf_files)} files")
-    if failed_files:
-        print(f"  Failed: {len(failed_files)} files")
-        # Group by error type
-        error_counts = {}
-        for failure in failed_files:
-            error_code = failure['error_code']
-            error_counts[error_code] = error_counts.get(error_code, 0) + 1
-        
-        print(f"  Error breakdown:")
-        for error_code, count in sorted(error_counts.items()):
-            print(f"    - {ERROR_MESSAGES.get(error_code, error_code)}: {count} file(s)")
-    
-    return processed_count, failed_files
-
-def load_json_content(json_dir):
-    """Load all JSON files from directory."""
-    json_files = list(Path(json_dir).glob("*.json"))
-    papers = []
-    
-    for json_path in json_files:
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                papers.append(data)
-        except Exception as e:
-            print(f"Error loading {json_path.name}: {e}")
-    
-    print(f"Loaded {len(papers)} papers from JSON files")
-    return papers
-
-def get_paper_filename(json_filename):
-    """Convert JSON filename back to PDF filename."""
-    if json_filename.endswith('.json'):
-        return json_filename[:-5] + '.pdf'  # Replace .json with .pdf
-    return json_filename
-
-def check_pdf_extraction_capabilities():
-    """Check which PDF extraction libraries are available."""
-    capabilities = []
-    
-    if PYMUPDF_AVAILABLE:
-        capabilities.append("PyMuPDF (recommended)")
-    
-    if PDFPLUMBER_AVAILABLE:
-        capabilities.append("pdfplumber (fallback)")
-    
-    if not capabilities:
-        return "No PDF extraction libraries available. Please install PyMuPDF or pdfplumber."
-    
-    return f"Available: {', '.join(capabilities)}"
+"""
+PDF Extractor Module
+
+Handles PDF text extraction and converts PDFs to JSON format for processing.
+Supports multiple PDF extraction methods for maximum compatibility.
+"""
+
+import json
+import os
+import signal
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from extraction_cache import ExtractionCache, hash_pdf
+from corpus_store import CorpusWriter
+from inventory import build_inventory, list_json_files
+from json_loader import DEFAULT_LOAD_THREADS, iter_json_files
+from packed_corpus import discard_pack
+from preflight import preflight_pdf
+from front_matter import DEFAULT_FRONT_PAGES, find_front_matter_end, read_pdf_metadata
+from text_normalizer import DEFAULT_NORMALIZER, NORMALIZATION_VERSION, fold_text
+from term_scanner import DEFAULT_MATCHING_ENGINE
+from extraction_supervisor import (
+    SupervisedPool, STATUS_OK, STATUS_TIMEOUT, STATUS_MEMORY, RESOURCE_LIMITS_AVAILABLE
+)
+
+# PDF extraction libraries
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    import pdfplumber
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+# Bump when a change alters extracted or cleaned text so cached results are invalidated
+EXTRACTOR_VERSION = "3"
+CLEANER_VERSION = "3"
+
+def extraction_cache_version():
+    """Version string identifying the extraction pipeline for cache keys."""
+    libraries = []
+    if PYMUPDF_AVAILABLE:
+        libraries.append("pymupdf")
+    if PDFPLUMBER_AVAILABLE:
+        libraries.append("pdfplumber")
+    return (f"extractor-{EXTRACTOR_VERSION}/cleaner-{CLEANER_VERSION}/norm-{NORMALIZATION_VERSION}/"
+            f"{'+'.join(libraries) or 'none'}")
+
+def iter_pages_with_pymupdf(pdf_path):
+    """
+    Yield the text of each page using PyMuPDF.
+    
+    Pages are produced lazily so callers can stop reading a document early.
+    Library errors propagate to the caller.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        for page in doc:
+            yield page.get_text()
+    finally:
+        doc.close()
+
+def iter_pages_with_pdfplumber(pdf_path):
+    """
+    Yield the text of each page using pdfplumber.
+    
+    Non-empty pages are newline-terminated, empty pages yield "".
+    Library errors propagate to the caller.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            yield page_text + "\n" if page_text else ""
+
+# Share of unprintable or U+FFFD characters above which a page's text layer counts as garbled
+GARBLED_RATIO = 0.1
+
+def _needs_fallback(page_text):
+    """True if a page's text layer is empty or garbled (e.g. fonts without a ToUnicode map)."""
+    compact = "".join(page_text.split())
+    if not compact:
+        return True
+    if compact.isprintable():
+        bad = compact.count("\ufffd")
+    else:
+        bad = sum(1 for ch in compact if ch == "\ufffd" or not ch.isprintable())
+    return bad / len(compact) > GARBLED_RATIO
+
+def iter_pages_with_page_fallback(pdf_path):
+    """
+    Yield (text, engine) for each page, using PyMuPDF and re-extracting only
+    empty or garbled pages with pdfplumber.
+    
+    pdfplumber is opened lazily, so documents with a good text layer never pay
+    for it. Its text is used only if it is better than PyMuPDF's. PyMuPDF
+    errors propagate to the caller; pdfplumber errors just disable the fallback.
+    """
+    plumber = None
+    plumber_usable = PDFPLUMBER_AVAILABLE
+    try:
+        for index, page_text in enumerate(iter_pages_with_pymupdf(pdf_path)):
+            if plumber_usable and _needs_fallback(page_text):
+                try:
+                    if plumber is None:
+                        plumber = pdfplumber.open(pdf_path)
+                    alt_text = plumber.pages[index].extract_text() or ""
+                except Exception:
+                    plumber_usable = False
+                    alt_text = ""
+                if not _needs_fallback(alt_text):
+                    yield alt_text + "\n", "pdfplumber"
+                    continue
+            yield page_text, "PyMuPDF"
+    finally:
+        if plumber is not None:
+            plumber.close()
+
+def _iter_tagged(iter_pages, engine):
+    """Adapt a plain page iterator to yield (text, engine) pairs."""
+    def iter_tagged(pdf_path):
+        for page_text in iter_pages(pdf_path):
+            yield page_text, engine
+    return iter_tagged
+
+def _pymupdf_error_code(pdf_path, e):
+    """Report a PyMuPDF failure and map it to an error code."""
+    if isinstance(e, fitz.FileDataError):
+        # Corrupted or invalid PDF structure
+        print(f"PyMuPDF extraction failed for {pdf_path}: Corrupted PDF file")
+        return 'PDF_CORRUPTED'
+    if isinstance(e, fitz.FileNotFoundError):
+        print(f"PyMuPDF extraction failed for {pdf_path}: File not found")
+        return 'FILE_NOT_FOUND'
+    # Check for encryption/password protection
+    error_str = str(e).lower()
+    if 'password' in error_str or 'encrypted' in error_str or 'crypt' in error_str:
+        print(f"PyMuPDF extraction failed for {pdf_path}: PDF is encrypted or password-protected")
+        return 'PDF_ENCRYPTED'
+    print(f"PyMuPDF extraction failed for {pdf_path}: {e}")
+    return 'UNKNOWN_ERROR'
+
+def _pdfplumber_error_code(pdf_path, e):
+    """Report a pdfplumber failure and map it to an error code."""
+    if isinstance(e, FileNotFoundError):
+        print(f"pdfplumber extraction failed for {pdf_path}: File not found")
+        return 'FILE_NOT_FOUND'
+    error_str = str(e).lower()
+    if 'password' in error_str or 'encrypted' in error_str or 'crypt' in error_str:
+        print(f"pdfplumber extraction failed for {pdf_path}: PDF is encrypted or password-protected")
+        return 'PDF_ENCRYPTED'
+    elif 'corrupt' in error_str or 'invalid' in error_str or 'damaged' in error_str:
+        print(f"pdfplumber extraction failed for {pdf_path}: Corrupted PDF file")
+        return 'PDF_CORRUPTED'
+    print(f"pdfplumber extraction failed for {pdf_path}: {e}")
+    return 'UNKNOWN_ERROR'
+
+def extract_text_with_pymupdf(pdf_path):
+    """
+    Extract text using PyMuPDF (primary method).
+    
+    Returns:
+        tuple: (text, error_code) where error_code is None on success or one of:
+               'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
+    """
+    try:
+        text = "".join(iter_pages_with_pymupdf(pdf_path))
+        return text.strip(), None
+    except Exception as e:
+        return None, _pymupdf_error_code(pdf_path, e)
+
+def extract_text_with_pdfplumber(pdf_path):
+    """
+    Extract text using pdfplumber (fallback method).
+    
+    Returns:
+        tuple: (text, error_code) where error_code is None on success or one of:
+               'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
+    """
+    try:
+        text = "".join(iter_pages_with_pdfplumber(pdf_path))
+        return text.strip(), None
+    except Exception as e:
+        return None, _pdfplumber_error_code(pdf_path, e)
+
+def extract_pages_from_pdf(pdf_path, evaluator=None, max_pages=None, max_chars=None, front_pages=None):
+    """
+    Extract text page by page using available methods with fallback strategy.
+    
+    If an evaluator is given (see validator.IncrementalEvaluator), the cleaned
+    text of each page is fed to it and reading stops as soon as it reports that
+    the query verdict can no longer change.
+    
+    Documents with more than max_pages pages or max_chars characters are
+    rejected with 'RESOURCE_LIMIT'.
+    
+    With front_pages set, only the front matter is read: at most front_pages
+    pages, ending before an "Introduction" heading if one comes first (see
+    front_matter.find_front_matter_end).
+    
+    PyMuPDF reads the document and pdfplumber re-extracts only the pages whose
+    text layer is empty or garbled (see iter_pages_with_page_fallback). The
+    whole document is re-read with pdfplumber only if PyMuPDF fails on it.
+    
+    Returns:
+        tuple: (pages, error_code, complete, engines) where pages is the list of
+               raw page texts read, error_code is None on success or one of the
+               codes returned by extract_text_from_pdf, complete is False when
+               reading stopped early, and engines names the library that
+               produced each page ('PyMuPDF' or 'pdfplumber')
+    """
+    # Check if any extraction library is available
+    if not PYMUPDF_AVAILABLE and not PDFPLUMBER_AVAILABLE:
+        return None, 'LIBRARY_MISSING', True, None
+    
+    # PyMuPDF first (fastest and most reliable), pdfplumber as fallback
+    methods = []
+    if PYMUPDF_AVAILABLE:
+        methods.append((iter_pages_with_page_fallback, _pymupdf_error_code, False))
+    if PDFPLUMBER_AVAILABLE:
+        methods.append((_iter_tagged(iter_pages_with_pdfplumber, "pdfplumber"), _pdfplumber_error_code, True))
+    
+    for iter_pages, error_code_for, is_fallback in methods:
+        if evaluator is not None:
+            evaluator.reset()
+        pages = []
+        engines = []
+        char_count = 0
+        try:
+            for page_text, engine in iter_pages(pdf_path):
+                pages.append(page_text)
+                engines.append(engine)
+                char_count += len(page_text)
+                if (max_pages and len(pages) > max_pages) or (max_chars and char_count > max_chars):
+                    print(f"Extraction stopped for {pdf_path}: document exceeds the page/character limit")
+                    return None, 'RESOURCE_LIMIT', True, None
+                if front_pages:
+                    heading = find_front_matter_end(page_text)
+                    if heading is not None:
+                        pages[-1] = page_text = page_text[:heading]
+                if evaluator is not None and evaluator.feed(clean_extracted_text(page_text)):
+                    # Verdict decided; the remaining pages cannot change it
+                    return pages, None, False, engines
+                if front_pages and (heading is not None or len(pages) >= front_pages):
+                    # End of the front matter
+                    return pages, None, True, engines
+        except Exception as e:
+            error_code = error_code_for(pdf_path, e)
+            if is_fallback or error_code in ['PDF_ENCRYPTED', 'PDF_CORRUPTED', 'FILE_NOT_FOUND']:
+                # These errors are definitive, no point trying fallback
+                return None, error_code, True, None
+            # Otherwise, try fallback
+            continue
+        
+        if len("".join(pages).strip()) > 50:  # Reasonable text extracted
+            return pages, None, True, engines
+        # Empty pages were already retried with pdfplumber, so there is nothing left to try
+        break
+    
+    # Neither library could extract sufficient text
+    # This usually means scanned PDF without OCR or truly empty PDF
+    return None, 'NO_TEXT_CONTENT', True, None
+
+def extract_text_from_pdf(pdf_path):
+    """
+    Extract text from PDF using available methods with fallback strategy.
+    
+    Returns:
+        tuple: (text, error_code) where error_code is one of:
+               None (success), 'PDF_ENCRYPTED', 'PDF_CORRUPTED', 'NO_TEXT_CONTENT',
+               'LIBRARY_MISSING', 'FILE_NOT_FOUND', 'UNKNOWN_ERROR'
+    """
+    pages, error_code, _complete, _engines = extract_pages_from_pdf(pdf_path)
+    if error_code:
+        return None, error_code
+    return "".join(pages).strip(), None
+
+def clean_extracted_text(text):
+    """
+    Clean and normalize extracted text.
+    
+    Collapses whitespace, strips a trailing page number and folds typographic
+    quotes in a single pass (see text_normalizer.TextNormalizer).
+    """
+    return DEFAULT_NORMALIZER.normalize(text)
+
+def join_cleaned_pages(pages):
+    """
+    Clean each page and join the results with single spaces.
+    
+    Returns:
+        tuple: (text, page_offsets) where page_offsets[i] is the character offset
+               in text at which page i starts (empty pages share the offset of
+               the next text)
+    """
+    parts = []
+    page_offsets = []
+    text_len = 0
+    for page_text in pages:
+        cleaned = clean_extracted_text(page_text)
+        start = text_len + 1 if text_len else 0
+        page_offsets.append(start)
+        if cleaned:
+            parts.append(cleaned)
+            text_len = start + len(cleaned)
+    return " ".join(parts), page_offsets
+
+# Error code descriptions for user-friendly messages
+ERROR_MESSAGES = {
+    'PDF_ENCRYPTED': 'PDF is password-protected or encrypted',
+    'PDF_CORRUPTED': 'PDF file is corrupted or has invalid structure',
+    'NO_TEXT_CONTENT': 'PDF contains no extractable text (likely scanned image)',
+    'LIBRARY_MISSING': 'No PDF extraction libraries available (install PyMuPDF or pdfplumber)',
+    'FILE_NOT_FOUND': 'PDF file not found or inaccessible',
+    'EXTRACTION_TIMEOUT': 'PDF extraction exceeded the per-document time limit',
+    'RESOURCE_LIMIT': 'PDF exceeded the memory, page or character limit',
+    'UNKNOWN_ERROR': 'Unknown error during PDF extraction'
+}
+
+@dataclass(frozen=True)
+class ExtractionOptions:
+    """
+    Per-document extraction settings, shipped to worker processes.
+    
+    stop_query: Optional query AST. When set, each document is read page by
+                page and reading stops once the query verdict is decided
+                (the saved text is then partial, see extract_pages_from_pdf).
+    case_sensitive: Case handling used when evaluating stop_query.
+    matching_engine: Term matching engine for stop_query (see term_scanner).
+    max_pages: Reject documents with more pages than this (RESOURCE_LIMIT).
+    max_chars: Reject documents with more extracted characters than this.
+    preflight: Triage each document (see preflight.preflight_pdf) and skip
+               full extraction of files that cannot yield text.
+    stage: "full" reads whole documents; "abstract" reads only the front
+           matter (first front_pages pages, up to an "Introduction" heading)
+           plus the title, subject and keywords from the PDF metadata.
+    front_pages: Page budget of the abstract stage.
+    """
+    stop_query: Any = None
+    case_sensitive: bool = False
+    matching_engine: str = DEFAULT_MATCHING_ENGINE
+    max_pages: Any = None
+    max_chars: Any = None
+    preflight: bool = True
+    stage: str = "full"
+    front_pages: int = DEFAULT_FRONT_PAGES
+
+def _make_evaluator(options):
+    """Build an incremental query evaluator for early termination, if requested."""
+    if options is None or options.stop_query is None:
+        return None
+    # Imported lazily: validator itself imports this module
+    from validator import IncrementalEvaluator
+    return IncrementalEvaluator(options.stop_query, case_sensitive=options.case_sensitive,
+                                engine=options.matching_engine)
+
+# One cache handle per process, reused across PDFs
+_CACHES = {}
+
+def _open_cache(cache_dir, options=None):
+    version = extraction_cache_version()
+    if options is not None and options.stage == "abstract":
+        # Front-matter extractions must never be served to full-text runs
+        version += f"/abstract-{options.front_pages}"
+    key = (str(cache_dir), version)
+    if key not in _CACHES:
+        _CACHES[key] = ExtractionCache(cache_dir, version)
+    return _CACHES[key]
+
+def _extraction_method(page_engines):
+    """Summarize per-page engines, e.g. "PyMuPDF" or "PyMuPDF+pdfplumber"."""
+    engines = sorted(set(page_engines), key=lambda engine: engine != "PyMuPDF")
+    return "+".join(engines) or ("PyMuPDF" if PYMUPDF_AVAILABLE else "pdfplumber")
+
+def _extract_single_pdf(pdf_path, cache_dir=None, options=None):
+    """
+    Extract and clean the text of one PDF, consulting the extraction cache first.
+    
+    Runs in a worker process when extract_pdfs_to_json is called with workers > 1,
+    so it must stay a picklable module-level function.
+    
+    Returns:
+        dict: {'full_text', 'error_code', 'error_message'} where full_text is the
+              cleaned text on success and error_code is None. Cache hits carry
+              'cached': True; documents cut short by early termination carry
+              'complete': False and 'pages_read'; failures found by the
+              preflight triage carry 'stage': 'preflight' and 'triage_reason'.
+    """
+    cache = None
+    content_hash = None
+    if cache_dir:
+        try:
+            cache = _open_cache(cache_dir, options)
+            content_hash = hash_pdf(pdf_path)
+            cached = cache.get(content_hash)
+            if cached is not None:
+                return dict(cached, cached=True)
+        except OSError:
+            # Unreadable file: let the extractor report the proper error code
+            content_hash = None
+    
+    outcome = None
+    if options is None or options.preflight:
+        outcome = _preflight_outcome(pdf_path, options)
+    if outcome is None:
+        outcome = _extract_uncached(pdf_path, options)
+    if cache is not None and content_hash:
+        cache.put(content_hash, outcome)
+    return outcome
+
+def _preflight_outcome(pdf_path, options=None):
+    """Return a failure outcome if preflight triage rejects the PDF, else None."""
+    # The page limit guards full reads; the abstract stage only reads a few pages
+    max_pages = options.max_pages if options and options.stage != "abstract" else None
+    error_code, reason = preflight_pdf(pdf_path, max_pages=max_pages)
+    if error_code is None:
+        return None
+    return {
+        'full_text': None,
+        'error_code': error_code,
+        'error_message': ERROR_MESSAGES[error_code],
+        'stage': 'preflight',
+        'triage_reason': reason
+    }
+
+def _extract_uncached(pdf_path, options=None):
+    """Run the extractor and cleaner on one PDF (see _extract_single_pdf)."""
+    try:
+        # Extract text with error categorization
+        max_pages = options.max_pages if options else None
+        max_chars = options.max_chars if options else None
+        abstract_stage = options is not None and options.stage == "abstract"
+        pages, error_code, complete, engines = extract_pages_from_pdf(
+            pdf_path, _make_evaluator(options), max_pages=max_pages, max_chars=max_chars,
+            front_pages=options.front_pages if abstract_stage else None
+        )
+        
+        if error_code:
+            return {
+                'full_text': None,
+                'error_code': error_code,
+                'error_message': ERROR_MESSAGES.get(error_code, 'Unknown error')
+            }
+        
+        full_text = "".join(pages).strip()
+        if complete and (not full_text or len(full_text) < 100):
+            return {
+                'full_text': None,
+                'error_code': 'NO_TEXT_CONTENT',
+                'error_message': ERROR_MESSAGES['NO_TEXT_CONTENT'],
+                'minimal_text': True
+            }
+        
+        metadata = read_pdf_metadata(pdf_path) if abstract_stage else {}
+        if metadata:
+            # Title, subject and keywords go in front of page 1 so they are screened too
+            cleaned_text, page_offsets = join_cleaned_pages([". ".join(metadata.values())] + pages)
+            page_offsets = page_offsets[1:]
+        else:
+            cleaned_text, page_offsets = join_cleaned_pages(pages)
+        # Folded shadow copy for case-insensitive matching (done here so it runs in the workers)
+        folded_text, fold_offsets = fold_text(cleaned_text)
+        outcome = {
+            'full_text': cleaned_text,
+            'page_offsets': page_offsets,
+            'page_engines': engines,
+            'folded_text': folded_text,
+            'fold_offsets': fold_offsets,
+            'error_code': None,
+            'error_message': None
+        }
+        if not complete:
+            outcome['complete'] = False
+            outcome['pages_read'] = len(pages)
+        if abstract_stage:
+            outcome['extraction_stage'] = 'abstract'
+            outcome['pages_read'] = len(pages)
+            outcome['metadata'] = metadata
+        return outcome
+    except MemoryError:
+        return {
+            'full_text': None,
+            'error_code': 'RESOURCE_LIMIT',
+            'error_message': ERROR_MESSAGES['RESOURCE_LIMIT']
+        }
+    except Exception as e:
+        return {
+            'full_text': None,
+            'error_code': 'UNKNOWN_ERROR',
+            'error_message': str(e),
+            'unexpected': True
+        }
+
+def _supervised_outcome(status, result):
+    """Translate a SupervisedPool status into an extraction outcome."""
+    if status == STATUS_OK:
+        return result
+    if status == STATUS_TIMEOUT:
+        error_code = 'EXTRACTION_TIMEOUT'
+    elif status == STATUS_MEMORY or result == -getattr(signal, "SIGKILL", 9):
+        # MemoryError under the address-space cap, or killed by the OOM killer
+        error_code = 'RESOURCE_LIMIT'
+    else:
+        return {
+            'full_text': None,
+            'error_code': 'UNKNOWN_ERROR',
+            'error_message': f"Extraction worker crashed ({result})",
+            'unexpected': True
+        }
+    return {
+        'full_text': None,
+        'error_code': error_code,
+        'error_message': ERROR_MESSAGES[error_code]
+    }
+
+def _iter_extractions(pdf_files, workers, cache_dir=None, options=None, *,
+                      timeout=None, max_memory_mb=None, recycle_after=None):
+    """
+    Yield (pdf_path, outcome) pairs in the order of pdf_files.
+    
+    With workers > 1, or when a timeout, memory cap or recycling interval is set,
+    the PDFs are processed by a SupervisedPool: hung workers are killed after
+    `timeout` seconds, workers are replaced after `recycle_after` documents, and
+    results are still yielded in submission order, so the output stays
+    deterministic regardless of which worker finishes first.
+    """
+    extract = partial(_extract_single_pdf, cache_dir=cache_dir, options=options)
+    if workers <= 1 and not (timeout or max_memory_mb or recycle_after):
+        for pdf_path in pdf_files:
+            print(f"Processing: {pdf_path.name}")
+            yield pdf_path, extract(pdf_path)
+        return
+    
+    with SupervisedPool(extract, workers, timeout=timeout, max_memory_mb=max_memory_mb,
+                        max_tasks_per_worker=recycle_after) as pool:
+        for pdf_path, status, result in pool.imap(pdf_files):
+            print(f"Processed: {pdf_path.name}")
+            yield pdf_path, _supervised_outcome(status, result)
+
+def paper_record(pdf_path, outcome, filename=None):
+    """
+    Build the JSON structure stored for a successfully extracted PDF.
+    
+    filename defaults to the PDF's name; inventories pass its path relative
+    to the input folder.
+    """
+    pdf_path = Path(pdf_path)
+    cleaned_text = outcome['full_text']
+    json_data = {
+        "filename": filename or pdf_path.name,
+        "pdf_path": str(pdf_path),
+        "full_text": cleaned_text,
+        "text_length": len(cleaned_text),
+        "page_count": len(outcome['page_offsets']),
+        "page_offsets": outcome['page_offsets'],
+        "normalization_version": NORMALIZATION_VERSION,
+        "folded_text": outcome['folded_text'],
+        "fold_offsets": outcome['fold_offsets'],
+        "page_engines": outcome['page_engines'],
+        "extraction_method": _extraction_method(outcome['page_engines']),
+        "extraction_date": "2025-09-05"
+    }
+    if outcome.get('complete') is False:
+        # Early termination: text covers only the pages needed for the verdict
+        json_data["extraction_complete"] = False
+        json_data["pages_read"] = outcome['pages_read']
+    if outcome.get('extraction_stage') == 'abstract':
+        # Front matter only: page_count/page_offsets cover the pages read
+        json_data["extraction_stage"] = "abstract"
+        json_data["pages_read"] = outcome['pages_read']
+        json_data["metadata"] = outcome['metadata']
+    return json_data
+
+def json_path_for(output_dir, filename):
+    """Location of a PDF's JSON file; subfolders of the input are mirrored."""
+    return Path(output_dir) / Path(filename).with_suffix(".json")
+
+def extract_pdfs_to_json(input_dir, output_dir, workers=1, cache_dir=None, options=None, *,
+                         timeout=None, max_memory_mb=None, recycle_after=None, corpus_format="json",
+                         inventory=None):
+    """
+    Extract text from PDF files and save as JSON files.
+    
+    Args:
+        input_dir: Directory containing PDF files
+        output_dir: Directory to save JSON files
+        workers: Number of worker processes (1 = sequential, in-process)
+        cache_dir: Optional extraction cache directory shared across runs;
+                   unchanged PDFs and known-bad PDFs are served from it
+        options: Optional ExtractionOptions applied to every document
+        timeout: Wall-clock seconds allowed per PDF (EXTRACTION_TIMEOUT when exceeded)
+        max_memory_mb: Address-space cap per worker process (RESOURCE_LIMIT when exceeded)
+        recycle_after: Replace each worker process after this many PDFs
+        corpus_format: "json" writes one JSON file per PDF; "jsonl.gz" writes a
+                       single compressed corpus store (see corpus_store.py)
+        inventory: Optional inventory.Inventory of input_dir; PDFs in subfolders
+                   keep their relative path as filename (and JSON location)
+    
+    Returns:
+        tuple: (successful_count, failed_list) where failed_list contains
+               dicts with keys 'filename', 'error_code', 'error_message' and
+               'stage' ('preflight' or 'extraction')
+    """
+    
+    # Create output directory; a pack of earlier results would be stale
+    os.makedirs(output_dir, exist_ok=True)
+    discard_pack(output_dir)
+    
+    # Sorted so that results and failure lists are reproducible across runs
+    if inventory is None:
+        inventory = build_inventory(input_dir)
+    pdf_files = [entry.path for entry in inventory.pdfs]
+    relative_names = {entry.path: entry.relative for entry in inventory.pdfs}
+    
+    if not pdf_files:
+        print(f"No PDF files found in {input_dir}")
+        return 0, []
+    
+    workers = max(1, min(workers or 1, len(pdf_files)))
+    if workers > 1:
+        print(f"Found {len(pdf_files)} PDF files to process ({workers} workers)...")
+    else:
+        print(f"Found {len(pdf_files)} PDF files to process...")
+    
+    processed_count = 0
+    cached_count = 0
+    stopped_early_count = 0
+    failed_files = []
+    
+    if max_memory_mb and not RESOURCE_LIMITS_AVAILABLE:
+        print("⚠️  Memory limits are not supported on this platform and will be ignored")
+    
+    corpus = CorpusWriter(output_dir) if corpus_format == "jsonl.gz" else None
+    extractions = _iter_extractions(pdf_files, workers, cache_dir, options, timeout=timeout,
+                                    max_memory_mb=max_memory_mb, recycle_after=recycle_after)
+    for pdf_path, outcome in extractions:
+        filename = relative_names[pdf_path]
+        try:
+            if outcome.get('cached'):
+                cached_count += 1
+            error_code = outcome['error_code']
+            if error_code:
+                if outcome.get('unexpected'):
+                    print(f"  ❌ Unexpected error processing {filename}: {outcome['error_message']}")
+                elif outcome.get('minimal_text'):
+                    print(f"  ⚠️  Warning: Minimal text extracted from {filename}")
+                elif outcome.get('stage') == 'preflight':
+                    print(f"  ❌ Skipped by preflight: {outcome['error_message']} ({outcome['triage_reason']})")
+                else:
+                    print(f"  ❌ Failed: {outcome['error_message']}")
+                failed_files.append({
+                    'filename': filename,
+                    'error_code': error_code,
+                    'error_message': outcome['error_message'],
+                    'stage': outcome.get('stage', 'extraction')
+                })
+                continue
+            
+            cleaned_text = outcome['full_text']
+            json_data = paper_record(pdf_path, outcome, filename)
+            if json_data.get("extraction_complete") is False:
+                stopped_early_count += 1
+            
+            if corpus is not None:
+                corpus.write(json_data)
+            else:
+                # Save JSON file
+                json_path = json_path_for(output_dir, filename)
+                json_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(json_data, f, ensure_ascii=False, indent=2)
+            
+            processed_count += 1
+            print(f"  ✅ Successfully extracted {len(cleaned_text)} characters")
+            
+        except Exception as e:
+            print(f"  ❌ Unexpected error processing {filename}: {e}")
+            failed_files.append({
+                'filename': filename,
+                'error_code': 'UNKNOWN_ERROR',
+                'error_message': str(e),
+                'stage': 'extraction'
+            })
+    if corpus is not None:
+        corpus.close()
+    
+    print(f"\n📊 Extraction Summary:")
+    print(f"  Successful: {processed_count}/{len(pdf_files)} files")
+    if cache_dir:
+        print(f"  Served from cache: {cached_count}/{len(pdf_files)} files")
+    if stopped_early_count:
+        print(f"  Stopped early (verdict decided): {stopped_early_count} files")
+    if failed_files:
+        print(f"  Failed: {len(failed_files)} files")
+        # Group by error type
+        error_counts = {}
+        preflight_counts = {}
+        for failure in failed_files:
+            error_code = failure['error_code']
+            error_counts[error_code] = error_counts.get(error_code, 0) + 1
+            if failure.get('stage') == 'preflight':
+                preflight_counts[error_code] = preflight_counts.get(error_code, 0) + 1
+        
+        print(f"  Error breakdown:")
+        for error_code, count in sorted(error_counts.items()):
+            triaged = preflight_counts.get(error_code)
+            suffix = f" ({triaged} caught by preflight)" if triaged else ""
+            print(f"    - {ERROR_MESSAGES.get(error_code, error_code)}: {count} file(s){suffix}")
+    
+    return processed_count, failed_files
+
+def iter_json_content(json_dir, threads=DEFAULT_LOAD_THREADS, json_files=None, **json_options):
+    """
+    Yield the papers of a JSON directory one at a time.
+    
+    json_files are the JSON files to read, e.g. Inventory.json_files of an
+    input folder that was already listed. Otherwise only JSON files directly
+    in json_dir are read, unless json_options (inventory.list_json_files
+    arguments: include, exclude, recursive, skip_dirs) select others, e.g.
+    recursive=True for an extraction directory mirroring a recursive input
+    folder.
+    
+    Files are read ahead on `threads` threads (see json_loader.py), but only a
+    bounded number of papers is held in memory, so memory use does not grow
+    with the size of the corpus. Unreadable files are reported and skipped.
+    """
+    if json_files is None:
+        json_files = list_json_files(json_dir, **json_options)
+    loaded = 0
+    
+    for json_path, data, error in iter_json_files(json_files, threads=threads):
+        if error is not None:
+            print(f"Error loading {json_path.name}: {error}")
+            continue
+        loaded += 1
+        yield data
+    
+    print(f"Loaded {loaded} papers from JSON files")
+
+def load_json_content(json_dir, **json_options):
+    """Load all JSON files from directory (see iter_json_content)."""
+    return list(iter_json_content(json_dir, **json_options))
+
+def get_paper_filename(json_filename):
+    """Convert JSON filename back to PDF filename."""
+    if json_filename.endswith('.json'):
+        return json_filename[:-5] + '.pdf'  # Replace .json with .pdf
+    return json_filename
+
+def page_for_offset(page_offsets, offset):
+    """Return the 1-based page number containing a character offset of full_text."""
+    if not page_offsets:
+        return None
+    return max(1, bisect_right(page_offsets, offset))
+
+def get_page_text(paper, page_number):
+    """
+    Return the cleaned text of one page (1-based) of an extracted paper.
+    
+    Uses the page_offsets index, so no re-parsing of the PDF is needed.
+    Returns None if the paper has no page index or the page does not exist.
+    """
+    page_offsets = paper.get("page_offsets")
+    if not page_offsets or not 1 <= page_number <= len(page_offsets):
+        return None
+    full_text = paper.get("full_text", "")
+    start = page_offsets[page_number - 1]
+    end = page_offsets[page_number] - 1 if page_number < len(page_offsets) else len(full_text)
+    return full_text[start:max(start, end)]
+
+def check_pdf_extraction_capabilities():
+    """Check which PDF extraction libraries are available."""
+    capabilities = []
+    
+    if PYMUPDF_AVAILABLE:
+        capabilities.append("PyMuPDF (recommended)")
+    
+    if PDFPLUMBER_AVAILABLE:
+        capabilities.append("pdfplumber (fallback)")
+    
+    if not capabilities:
+        return "No PDF extraction libraries available. Please install PyMuPDF or pdfplumber."
+    
+    return f"Available: {', '.join(capabilities)}"
@@ -0,0 +1,112 @@
+"""
+Preflight Module
+
+Cheap triage of PDFs before full text extraction. Only the file header, the
+trailer/cross-reference table (parsed when PyMuPDF opens the file), the
+encryption dictionary and a small sample of pages are examined, so files that
+cannot yield text are rejected without a full PyMuPDF parse followed by a full
+pdfplumber parse:
+
+  - no %PDF- header                          -> PDF_CORRUPTED
+  - unreadable trailer / xref                -> PDF_CORRUPTED
+  - password required to open                -> PDF_ENCRYPTED
+  - more pages than the configured limit     -> RESOURCE_LIMIT
+  - sampled pages have no text layer and are
+    covered by images (scanned, no OCR)      -> NO_TEXT_CONTENT
+
+Anything else, including every file when PyMuPDF is not installed beyond the
+header check, is passed on to full extraction.
+"""
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# The PDF header must start within the first 1024 bytes (PDF 1.7, Annex H)
+_HEADER_WINDOW = 1024
+
+# Pages read from the start of the document (the last page is sampled as well)
+SAMPLE_PAGES = 3
+
+# A page with fewer characters than this has no usable text layer
+MIN_PAGE_TEXT = 20
+
+# Fraction of the page area covered by images for a page to count as scanned
+MIN_IMAGE_COVERAGE = 0.5
+
+def _has_pdf_header(pdf_path):
+    with open(pdf_path, "rb") as f:
+        return b"%PDF-" in f.read(_HEADER_WINDOW)
+
+def _sample_page_numbers(page_count, sample_pages):
+    numbers = list(range(min(sample_pages, page_count)))
+    if page_count > sample_pages:
+        numbers.append(page_count - 1)
+    return numbers
+
+def _image_coverage(page):
+    """Fraction of the page area covered by images (overlaps counted once per image)."""
+    page_rect = page.rect
+    page_area = page_rect.width * page_rect.height
+    if page_area <= 0:
+        return 0.0
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info["bbox"]) & page_rect
+        if not bbox.is_empty:
+            covered += bbox.width * bbox.height
+    return min(1.0, covered / page_area)
+
+def preflight_pdf(pdf_path, sample_pages=SAMPLE_PAGES, max_pages=None):
+    """
+    Classify a PDF before full extraction.
+
+    Returns:
+        tuple: (error_code, reason) where error_code is None if the file should
+               go on to full extraction, otherwise one of 'FILE_NOT_FOUND',
+               'PDF_CORRUPTED', 'PDF_ENCRYPTED', 'RESOURCE_LIMIT' or
+               'NO_TEXT_CONTENT', and reason is a short explanation
+    """
+    try:
+        if not _has_pdf_header(pdf_path):
+            return 'PDF_CORRUPTED', "no %PDF- header"
+    except FileNotFoundError:
+        return 'FILE_NOT_FOUND', "file not found"
+    except OSError as e:
+        return 'FILE_NOT_FOUND', str(e)
+
+    if not PYMUPDF_AVAILABLE:
+        return None, ""
+
+    try:
+        doc = fitz.open(pdf_path)
+    except fitz.FileDataError as e:
+        return 'PDF_CORRUPTED', f"unreadable structure ({e})"
+    except Exception:
+        # Not conclusive; the extractor's fallback may still cope
+        return None, ""
+
+    try:
+        if doc.needs_pass:
+            return 'PDF_ENCRYPTED', "password required"
+        page_count = doc.page_count
+        if page_count == 0:
+            return 'NO_TEXT_CONTENT', "no pages"
+        if max_pages and page_count > max_pages:
+            return 'RESOURCE_LIMIT', f"{page_count} pages"
+
+        for number in _sample_page_numbers(page_count, sample_pages):
+            page = doc[number]
+            if len(page.get_text().strip()) >= MIN_PAGE_TEXT:
+                return None, ""
+            if _image_coverage(page) < MIN_IMAGE_COVERAGE:
+                # Textless but not scanned (blank, vector-only, ...): let extraction decide
+                return None, ""
+        return 'NO_TEXT_CONTENT', "sampled pages are scanned images without a text layer"
+    except Exception:
+        # Damaged page objects and the like: full extraction reports the details
+        return None, ""
+    finally:
+        doc.close()
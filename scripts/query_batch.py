@@ -0,0 +1,126 @@
+"""
+Query Batch Module
+
+Screens one corpus against several named queries in a single pass, e.g.
+the variants of a sensitivity analysis or the sub-questions of a review.
+Every paper is read once and its text scanned once for the terms of all
+queries together (see validator.evaluate_queries); each query then gets
+exactly the results a separate run with that query would give.
+
+A queries file holds one query per section, headed by its name in square
+brackets. As in a single query file, lines starting with # are comments
+and the lines of a query are joined with spaces:
+
+    # Sensitivity analysis
+    [core]
+    (forest* OR woodland*) AND management
+
+    [broad]
+    forest* OR woodland* OR tree*
+
+Names become folder names of the per-query reports, so they may only
+contain letters, digits, '_', '-' and '.'.
+"""
+
+import csv
+import re
+from pathlib import Path
+
+from validator import duplicate_result, iter_papers, load_config, validate_single_paper_queries
+
+_HEADER = re.compile(r"^\[(.*)\]$")
+_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+def load_query_batch(queries_file):
+    """
+    Read a queries file.
+
+    Returns:
+        list: (name, query string) in file order
+
+    Raises:
+        ValueError: On text before the first header, invalid or repeated
+                    names, or a header without a query
+    """
+    queries = []
+    name, lines = None, []
+
+    def finish():
+        if name is not None:
+            if not lines:
+                raise ValueError(f"Query [{name}] is empty")
+            queries.append((name, " ".join(lines)))
+
+    text = Path(queries_file).read_text(encoding="utf-8")
+    for line_number, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        header = _HEADER.match(stripped)
+        if header:
+            finish()
+            name, lines = header.group(1).strip(), []
+            if not _NAME.match(name):
+                raise ValueError(f"Line {line_number}: invalid query name [{name}] "
+                                 "(use letters, digits, '_', '-' and '.')")
+            if any(name == existing for existing, _query in queries):
+                raise ValueError(f"Line {line_number}: query [{name}] is defined twice")
+        elif name is None:
+            raise ValueError(f"Line {line_number}: query text before the first [name] header")
+        else:
+            lines.append(stripped)
+    finish()
+    if not queries:
+        raise ValueError("Queries file contains no queries")
+    return queries
+
+def iter_batch_results(json_dir, query_nodes, config_path="config.json", *, corpus_format=None,
+                       dedup_threshold=None, json_options=None):
+    """
+    Validate papers against several queries and yield, per paper, the list
+    of its results (one per query node, in order).
+
+    Papers are read by validator.iter_papers, as for
+    validator.iter_validation_results (json_dir in any corpus format and
+    selected by json_options, one paper in memory at a time, duplicates
+    receiving their representative's verdicts with dedup_threshold).
+    """
+    config = load_config(config_path)
+    representatives = {}
+
+    for paper, duplicate in iter_papers(json_dir, corpus_format, dedup_threshold=dedup_threshold,
+                                        json_options=json_options):
+        if duplicate is not None:
+            yield [duplicate_result(result, paper, duplicate) for result in representatives[duplicate[0]]]
+            continue
+        results = validate_single_paper_queries(paper, query_nodes, config)
+        if dedup_threshold is not None:
+            representatives[paper.get("filename", "unknown")] = results
+        yield results
+
+def validate_papers_batch(json_dir, query_nodes, config_path="config.json", *, corpus_format=None,
+                          dedup_threshold=None, json_options=None):
+    """
+    Collect iter_batch_results per query.
+
+    Returns:
+        list: For each query node, the list of its validation results, as
+              validator.validate_papers returns them for that query alone
+    """
+    by_query = [[] for _ in query_nodes]
+    for results in iter_batch_results(json_dir, query_nodes, config_path, corpus_format=corpus_format,
+                                      dedup_threshold=dedup_threshold, json_options=json_options):
+        for query_results, result in zip(by_query, results):
+            query_results.append(result)
+    return by_query
+
+def save_query_matrix(names, results_by_query, output_path):
+    """
+    Write the paper x query verdicts as CSV: one row per paper, one column
+    per query, 1 for included and 0 for excluded papers.
+    """
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["filename"] + list(names))
+        for row in zip(*results_by_query):
+            writer.writerow([row[0]["filename"]] + [int(bool(r["overall_result"])) for r in row])
@@ -1,215 +1,483 @@
-"""
-Boolean Query Parser for ULST
-
-Parses a raw Boolean query string into an AST and prepares regex patterns
-for efficient evaluation by the validator. Supports:
-  - Operators: AND, OR, NOT (case-insensitive)
-  - Parentheses for grouping
-  - Terms with trailing wildcard *
-  - Quoted phrases, optionally with trailing * on the last token
-
-Public API:
-  parse_query(query: str) -> Node
-  pretty_print(node: Node) -> str
-
-Error handling:
-  Raises QuerySyntaxError with message and location info on invalid input.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import List, Union
-import re
-
-from pyparsing import (
-    CaselessKeyword,
-    Forward,
-    Group,
-    Literal,
-    ParseBaseException,
-    ParserElement,
-    QuotedString,
-    StringEnd,
-    Word,
-    alphanums,
-    Suppress,
-    infixNotation,
-    opAssoc,
-)
-
-
-class QuerySyntaxError(Exception):
-    """Raised when the query string cannot be parsed."""
-
-    def __init__(self, message: str, loc: int | None = None, line: str | None = None, col: int | None = None):
-        super().__init__(message)
-        self.loc = loc
-        self.line = line
-        self.col = col
-
-
-@dataclass(frozen=True)
-class TermNode:
-    kind: str
-    original: str
-    is_phrase: bool
-    pattern: str
-
-
-@dataclass(frozen=True)
-class AndNode:
-    kind: str
-    children: List["Node"]
-
-
-@dataclass(frozen=True)
-class OrNode:
-    kind: str
-    children: List["Node"]
-
-
-@dataclass(frozen=True)
-class NotNode:
-    kind: str
-    child: "Node"
-
-
-Node = Union[TermNode, AndNode, OrNode, NotNode]
-
-
-def _escape_term_to_regex(term: str, is_phrase: bool) -> str:
-    """Translate a term to a regex pattern string with word boundaries and wildcard support.
-
-    Rules:
-    - Unquoted: word-boundary on both sides; trailing * -> \w*
-      e.g., forest -> \bforest\b, forest* -> \bforest\w*
-    - Quoted: treat spaces as \s+; add word-boundaries at start and end; last token may have * suffix
-      e.g., "ecosystem service" -> \becosystem\s+service\b
-            "ecosystem service*" -> \becosystem\s+service\w*
-    """
-    if not is_phrase:
-        if term.endswith("*"):
-            stem = term[:-1]
-            return r"\b" + re.escape(stem) + r"\w*"
-        return r"\b" + re.escape(term) + r"\b"
-
-    # phrase case
-    inner = term
-    # If trailing wildcard present on last token in phrase
-    trailing_wild = inner.endswith("*")
-    if trailing_wild:
-        inner = inner[:-1]
-
-    # Split on whitespace and join with \s+
-    tokens = inner.strip().split()
-    if not tokens:
-        return r""
-
-    escaped = [re.escape(tok) for tok in tokens]
-    body = r"\s+".join(escaped)
-    if trailing_wild:
-        # Allow suffix on last token
-        if len(tokens) == 1:
-            body = escaped[0] + r"\w*"
-        else:
-            body = r"\s+".join(escaped[:-1] + [escaped[-1] + r"\w*"])
-        # For trailing wildcard phrases, omit the trailing word boundary to allow extended suffixes
-        return r"\b" + body
-
-    return r"\b" + body + r"\b"
-
-
-def parse_query(query: str) -> Node:
-    """Parse the Boolean query into an AST.
-
-    Raises QuerySyntaxError with basic location information on invalid input.
-    """
-    if query is None or query.strip() == "":
-        raise QuerySyntaxError("Empty query string")
-
-    ParserElement.set_default_whitespace_chars(" \t\r\n")
-
-    LPAREN, RPAREN = map(Suppress, (Literal("("), Literal(")")))
-    AND = CaselessKeyword("AND")
-    OR = CaselessKeyword("OR")
-    NOT = CaselessKeyword("NOT")
-
-    # Terms: unquoted words with allowed chars, or quoted strings
-    # Allow '*' to be part of word so trailing wildcard stays with the token
-    word = Word(alphanums + "_-.*")
-    phrase = QuotedString('"', escChar='\\', unquoteResults=True)
-
-    def make_term(original: str, is_phrase: bool) -> TermNode:
-        return TermNode(kind="term", original=original, is_phrase=is_phrase, pattern=_escape_term_to_regex(original, is_phrase))
-
-    # Use set_parse_action with context to mark phrase vs word
-    word.set_parse_action(lambda s, l, t: make_term(t[0], False))
-    phrase.set_parse_action(lambda s, l, t: make_term(t[0], True))
-
-    operand = Forward()
-    # Parentheses should just yield the inner operand (no extra grouping)
-    atom = (phrase | word | (LPAREN + operand + RPAREN))
-
-    def and_action(tokens):
-        nodes: List[Node] = [tok for tok in tokens[0][::2]]
-        flat: List[Node] = []
-        for n in nodes:
-            if isinstance(n, AndNode):
-                flat.extend(n.children)
-            else:
-                flat.append(n)
-        return AndNode(kind="and", children=flat)
-
-    def or_action(tokens):
-        nodes: List[Node] = [tok for tok in tokens[0][::2]]
-        flat: List[Node] = []
-        for n in nodes:
-            if isinstance(n, OrNode):
-                flat.extend(n.children)
-            else:
-                flat.append(n)
-        return OrNode(kind="or", children=flat)
-
-    def not_action(tokens):
-        node = tokens[0][1]
-        return NotNode(kind="not", child=node)
-
-    expr = infixNotation(
-        atom,
-        [
-            (NOT, 1, opAssoc.RIGHT, not_action),
-            (AND, 2, opAssoc.LEFT, and_action),
-            (OR, 2, opAssoc.LEFT, or_action),
-        ],
-    )
-
-    operand <<= expr
-
-    try:
-        parsed = (expr + StringEnd()).parse_string(query, parse_all=True)
-        return parsed[0]
-    except ParseBaseException as e:
-        msg = f"Query syntax error at col {e.column}: {e.msg}"
-        raise QuerySyntaxError(msg, loc=e.loc, line=e.line, col=e.column)
-
-
-def pretty_print(node: Node, indent: int = 0) -> str:
-    pad = "".rjust(indent)
-    if isinstance(node, TermNode):
-        return f"{pad}TERM(\"{node.original}\" -> {node.pattern})"
-    if isinstance(node, AndNode):
-        lines = [f"{pad}AND"]
-        for c in node.children:
-            lines.append(pretty_print(c, indent + 2))
-        return "\n".join(lines)
-    if isinstance(node, OrNode):
-        lines = [f"{pad}OR"]
-        for c in node.children:
-            lines.append(pretty_print(c, indent + 2))
-        return "\n".join(lines)
-    if isinstance(node, NotNode):
-        lines = [f"{pad}NOT"]
-        lines.append(pretty_print(node.child, indent + 2))
-        return "\n".join(lines)
-    return f"{pad}<unknown>"
+"""
+Boolean Query Parser for ULST
+
+Parses a raw Boolean query string into an AST and prepares regex patterns
+for efficient evaluation by the validator. Supports:
+  - Operators: AND, OR, NOT (case-insensitive)
+  - Parentheses for grouping
+  - Terms with trailing wildcard *
+  - Quoted phrases, optionally with trailing * on the last token
+
+Public API:
+  parse_query(query: str, cache_dir=None) -> Node
+  pretty_print(node: Node) -> str
+  node_to_dict(node: Node) -> dict, node_from_dict(data: dict) -> Node
+
+Queries are parsed by a hand-written tokenizer and operator-precedence
+parser in a single left-to-right pass with an explicit stack, so search
+strings with hundreds of OR'd terms or deep nesting parse in linear time
+and never hit Python's recursion limit. It accepts exactly the language of
+the original pyparsing grammar (kept as _parse_pyparsing, the reference
+for the differential tests, when pyparsing is installed) and reports
+errors at the same positions.
+
+Parsed queries are cached in memory, keyed by the query text with whitespace
+outside quotes normalized; with cache_dir they are also stored on disk as
+JSON (the AST including each term's regex pattern), so other processes
+parsing the same query skip parsing entirely.
+
+Error handling:
+  Raises QuerySyntaxError with message and location info on invalid input.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Union
+import hashlib
+import json
+import os
+import re
+import threading
+
+try:
+    from pyparsing import (
+        CaselessKeyword,
+        Forward,
+        Literal,
+        OpAssoc,
+        ParseBaseException,
+        ParserElement,
+        QuotedString,
+        StringEnd,
+        Word,
+        alphanums,
+        Suppress,
+        infix_notation,
+    )
+    PYPARSING_AVAILABLE = True
+except ImportError:
+    PYPARSING_AVAILABLE = False
+
+# Bump when the grammar or the term patterns change: invalidates cached parses
+QUERY_CACHE_VERSION = 1
+
+
+class QuerySyntaxError(Exception):
+    """Raised when the query string cannot be parsed."""
+
+    def __init__(self, message: str, loc: int | None = None, line: str | None = None, col: int | None = None):
+        super().__init__(message)
+        self.loc = loc
+        self.line = line
+        self.col = col
+
+
+@dataclass(frozen=True)
+class TermNode:
+    kind: str
+    original: str
+    is_phrase: bool
+    pattern: str
+
+
+@dataclass(frozen=True)
+class AndNode:
+    kind: str
+    children: List["Node"]
+
+
+@dataclass(frozen=True)
+class OrNode:
+    kind: str
+    children: List["Node"]
+
+
+@dataclass(frozen=True)
+class NotNode:
+    kind: str
+    child: "Node"
+
+
+Node = Union[TermNode, AndNode, OrNode, NotNode]
+
+
+def _escape_term_to_regex(term: str, is_phrase: bool) -> str:
+    """Translate a term to a regex pattern string with word boundaries and wildcard support.
+
+    Rules:
+    - Unquoted: word-boundary on both sides; trailing * -> \w*
+      e.g., forest -> \bforest\b, forest* -> \bforest\w*
+    - Quoted: treat spaces as \s+; add word-boundaries at start and end; last token may have * suffix
+      e.g., "ecosystem service" -> \becosystem\s+service\b
+            "ecosystem service*" -> \becosystem\s+service\w*
+    """
+    if not is_phrase:
+        if term.endswith("*"):
+            stem = term[:-1]
+            return r"\b" + re.escape(stem) + r"\w*"
+        return r"\b" + re.escape(term) + r"\b"
+
+    # phrase case
+    inner = term
+    # If trailing wildcard present on last token in phrase
+    trailing_wild = inner.endswith("*")
+    if trailing_wild:
+        inner = inner[:-1]
+
+    # Split on whitespace and join with \s+
+    tokens = inner.strip().split()
+    if not tokens:
+        return r""
+
+    escaped = [re.escape(tok) for tok in tokens]
+    body = r"\s+".join(escaped)
+    if trailing_wild:
+        # Allow suffix on last token
+        if len(tokens) == 1:
+            body = escaped[0] + r"\w*"
+        else:
+            body = r"\s+".join(escaped[:-1] + [escaped[-1] + r"\w*"])
+        # For trailing wildcard phrases, omit the trailing word boundary to allow extended suffixes
+        return r"\b" + body
+
+    return r"\b" + body + r"\b"
+
+
+def _make_term(original: str, is_phrase: bool) -> TermNode:
+    return TermNode(kind="term", original=original, is_phrase=is_phrase, pattern=_escape_term_to_regex(original, is_phrase))
+
+
+def _and_action(tokens):
+    nodes: List[Node] = [tok for tok in tokens[0][::2]]
+    flat: List[Node] = []
+    for n in nodes:
+        if isinstance(n, AndNode):
+            flat.extend(n.children)
+        else:
+            flat.append(n)
+    return AndNode(kind="and", children=flat)
+
+
+def _or_action(tokens):
+    nodes: List[Node] = [tok for tok in tokens[0][::2]]
+    flat: List[Node] = []
+    for n in nodes:
+        if isinstance(n, OrNode):
+            flat.extend(n.children)
+        else:
+            flat.append(n)
+    return OrNode(kind="or", children=flat)
+
+
+def _not_action(tokens):
+    node = tokens[0][1]
+    return NotNode(kind="not", child=node)
+
+
+def _build_grammar():
+    ParserElement.set_default_whitespace_chars(" \t\r\n")
+
+    LPAREN, RPAREN = map(Suppress, (Literal("("), Literal(")")))
+    AND = CaselessKeyword("AND")
+    OR = CaselessKeyword("OR")
+    NOT = CaselessKeyword("NOT")
+
+    # Terms: unquoted words with allowed chars, or quoted strings
+    # Allow '*' to be part of word so trailing wildcard stays with the token
+    word = Word(alphanums + "_-.*")
+    phrase = QuotedString('"', esc_char='\\', unquote_results=True)
+
+    # Use set_parse_action with context to mark phrase vs word
+    word.set_parse_action(lambda s, l, t: _make_term(t[0], False))
+    phrase.set_parse_action(lambda s, l, t: _make_term(t[0], True))
+
+    operand = Forward()
+    # Parentheses should just yield the inner operand (no extra grouping)
+    atom = (phrase | word | (LPAREN + operand + RPAREN))
+
+    expr = infix_notation(
+        atom,
+        [
+            (NOT, 1, OpAssoc.RIGHT, _not_action),
+            (AND, 2, OpAssoc.LEFT, _and_action),
+            (OR, 2, OpAssoc.LEFT, _or_action),
+        ],
+    )
+
+    operand <<= expr
+    return expr + StringEnd()
+
+
+# Reference grammar, built once per process. Packrat parsing is left off: with this grammar it
+# made parsing slower, not faster (infix_notation already avoids re-parsing
+# operands per precedence level), and it is a process-wide pyparsing switch
+_GRAMMAR = _build_grammar() if PYPARSING_AVAILABLE else None
+# The grammar is shared, so parses are serialized
+_GRAMMAR_LOCK = threading.Lock()
+
+# Whitespace between tokens (as for the grammar)
+_WHITESPACE = " \t\r\n"
+
+# Quoted phrases (kept verbatim) or runs of whitespace (collapsed)
+_NORMALIZE = re.compile(r'"(?:[^"\\]|\\.)*"?|[ \t\r\n]+')
+
+
+def normalize_query(query: str) -> str:
+    """Query text with whitespace outside quoted phrases collapsed, as used for cache keys."""
+    return _NORMALIZE.sub(lambda m: m.group(0) if m.group(0).startswith('"') else " ", query.strip(_WHITESPACE))
+
+
+def query_cache_key(query: str) -> str:
+    """Hash identifying a query's parse in the on-disk cache."""
+    text = f"{QUERY_CACHE_VERSION}\n{normalize_query(query)}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Tokens of the query language, as in the grammar above
+_WORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-.*")
+# Characters that may not touch a keyword (pyparsing's default keyword chars)
+_KEYWORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_$")
+_PHRASE = re.compile(r'"(?:\\.|[^"\n\r\\])*"')
+# Escapes inside a phrase: \t \n \f \r stand for whitespace, any other escaped
+# character for itself (numeric escapes are not converted reliably across
+# pyparsing versions and are treated as escaped characters)
+_PHRASE_ESCAPE = re.compile(r"\\(?:([tnfr])|(.))")
+_WHITESPACE_ESCAPES = {"t": "\t", "n": "\n", "f": "\f", "r": "\r"}
+
+_EXPECTED_OPERAND = "Expected a term, a quoted phrase or '('"
+_EXPECTED_CLOSE = "Expected ')'"
+_EXPECTED_END = "Expected AND, OR or end of text"
+
+
+def _unescape_phrase_char(m) -> str:
+    return _WHITESPACE_ESCAPES[m.group(1)] if m.group(1) else m.group(2)
+
+
+def _keyword_at(text: str, i: int) -> str | None:
+    """The keyword (AND, OR or NOT, uppercased) starting at text[i], if any."""
+    for keyword in ("AND", "OR", "NOT"):
+        end = i + len(keyword)
+        if (text[i:end].upper() == keyword
+                and (end == len(text) or text[end] not in _KEYWORD_CHARS)
+                and (i == 0 or text[i - 1] not in _KEYWORD_CHARS)):
+            return keyword
+    return None
+
+
+def _syntax_error(text: str, loc: int, message: str) -> QuerySyntaxError:
+    """QuerySyntaxError for text[loc], with line and column computed as pyparsing does."""
+    line_start = text.rfind("\n", 0, loc)
+    line_end = text.find("\n", loc)
+    line = text[line_start + 1:line_end] if line_end >= 0 else text[line_start + 1:]
+    col = 1 if 0 < loc < len(text) and text[loc - 1] == "\n" else loc - line_start
+    return QuerySyntaxError(f"Query syntax error at col {col}: {message}", loc=loc, line=line, col=col)
+
+
+def _join(kind: str, items: List[Node]) -> Node:
+    """One AND/OR node for a chain of operands, absorbing operands of the same kind."""
+    if len(items) == 1:
+        return items[0]
+    node_type = AndNode if kind == "and" else OrNode
+    children: List[Node] = []
+    for item in items:
+        if isinstance(item, node_type):
+            children.extend(item.children)
+        else:
+            children.append(item)
+    return node_type(kind=kind, children=children)
+
+
+class _Group:
+    """Operands of one parenthesized group (or the whole query) parsed so far."""
+
+    __slots__ = ("or_items", "and_items", "nots")
+
+    def __init__(self):
+        self.or_items: List[Node] = []
+        self.and_items: List[Node] = []
+        self.nots = 0  # NOT prefixes waiting for their operand
+
+    def add(self, node: Node) -> None:
+        for _ in range(self.nots):
+            node = NotNode(kind="not", child=node)
+        self.nots = 0
+        self.and_items.append(node)
+
+    def close(self) -> Node:
+        self.or_items.append(_join("and", self.and_items))
+        return _join("or", self.or_items)
+
+
+def _parse_linear(query: str) -> Node:
+    """Parse a query in one pass; same AST and error positions as _parse_pyparsing.
+
+    NOT binds tighter than AND, AND tighter than OR. Chains of the same
+    operator become one node, so parsing is linear in the query length, and
+    parentheses are tracked on an explicit stack instead of by recursion.
+    """
+    # Like pyparsing, tabs are expanded first and positions refer to the result
+    text = query.expandtabs()
+    n = len(text)
+    groups = [_Group()]
+    i = 0
+    expect_operand = True
+    while True:
+        while i < n and text[i] in _WHITESPACE:
+            i += 1
+        group = groups[-1]
+        if expect_operand:
+            if i == n:
+                raise _syntax_error(text, i, _EXPECTED_OPERAND)
+            c = text[i]
+            if c == "(":
+                groups.append(_Group())
+                i += 1
+            elif c == '"':
+                m = _PHRASE.match(text, i)
+                if m is None:
+                    raise _syntax_error(text, i, _EXPECTED_OPERAND)
+                group.add(_make_term(_PHRASE_ESCAPE.sub(_unescape_phrase_char, m.group(0)[1:-1]), True))
+                i = m.end()
+                expect_operand = False
+            elif c in _WORD_CHARS:
+                # AND and OR are plain words where an operand is expected, NOT is not
+                if _keyword_at(text, i) == "NOT":
+                    group.nots += 1
+                    i += 3
+                    continue
+                start = i
+                while i < n and text[i] in _WORD_CHARS:
+                    i += 1
+                group.add(_make_term(text[start:i], False))
+                expect_operand = False
+            else:
+                raise _syntax_error(text, i, _EXPECTED_OPERAND)
+            continue
+
+        if i == n:
+            if len(groups) > 1:
+                raise _syntax_error(text, i, _EXPECTED_CLOSE)
+            return group.close()
+        keyword = _keyword_at(text, i)
+        if keyword == "AND":
+            i += 3
+            expect_operand = True
+        elif keyword == "OR":
+            group.or_items.append(_join("and", group.and_items))
+            group.and_items = []
+            i += 2
+            expect_operand = True
+        elif text[i] == ")" and len(groups) > 1:
+            groups.pop()
+            groups[-1].add(group.close())
+            i += 1
+        else:
+            raise _syntax_error(text, i, _EXPECTED_CLOSE if len(groups) > 1 else _EXPECTED_END)
+
+
+def parse_query(query: str, cache_dir=None) -> Node:
+    """Parse the Boolean query into an AST.
+
+    Repeated queries are answered from an in-memory cache; with cache_dir,
+    parses are also read from and written to that directory.
+
+    Raises QuerySyntaxError with basic location information on invalid input.
+    """
+    if query is None or query.strip() == "":
+        raise QuerySyntaxError("Empty query string")
+    normalized = normalize_query(query)
+    if cache_dir is None:
+        return _parse_normalized(query, normalized)
+
+    path = Path(cache_dir) / f"{query_cache_key(normalized)}.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+        if record.get("query") == normalized:
+            return node_from_dict(record["ast"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    node = _parse_normalized(query, normalized)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name, so concurrent readers never see a partial file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"query": normalized, "ast": node_to_dict(node)}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+    return node
+
+
+def _parse_normalized(query: str, normalized: str) -> Node:
+    try:
+        return _parse_cached(normalized)
+    except QuerySyntaxError:
+        # Report the error at its position in the query as written
+        _parse_linear(query)
+        raise
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(query: str) -> Node:
+    return _parse_linear(query)
+
+
+def _parse_pyparsing(query: str) -> Node:
+    if not PYPARSING_AVAILABLE:
+        raise ImportError("pyparsing is not installed")
+    try:
+        with _GRAMMAR_LOCK:
+            parsed = _GRAMMAR.parse_string(query, parse_all=True)
+        return parsed[0]
+    except ParseBaseException as e:
+        msg = f"Query syntax error at col {e.column}: {e.msg}"
+        raise QuerySyntaxError(msg, loc=e.loc, line=e.line, col=e.column)
+
+
+def node_to_dict(node: Node) -> dict:
+    """JSON-serializable form of a query AST (see node_from_dict)."""
+    if isinstance(node, TermNode):
+        return {"kind": "term", "original": node.original, "is_phrase": node.is_phrase, "pattern": node.pattern}
+    if isinstance(node, NotNode):
+        return {"kind": "not", "child": node_to_dict(node.child)}
+    return {"kind": node.kind, "children": [node_to_dict(c) for c in node.children]}
+
+
+def node_from_dict(data: dict) -> Node:
+    """Rebuild a query AST from node_to_dict output."""
+    kind = data["kind"]
+    if kind == "term":
+        return TermNode(kind="term", original=data["original"], is_phrase=data["is_phrase"], pattern=data["pattern"])
+    if kind == "not":
+        return NotNode(kind="not", child=node_from_dict(data["child"]))
+    if kind == "and":
+        return AndNode(kind="and", children=[node_from_dict(c) for c in data["children"]])
+    if kind == "or":
+        return OrNode(kind="or", children=[node_from_dict(c) for c in data["children"]])
+    raise ValueError(f"Unknown query node kind: {kind}")
+
+
+def pretty_print(node: Node, indent: int = 0) -> str:
+    pad = "".rjust(indent)
+    if isinstance(node, TermNode):
+        return f"{pad}TERM(\"{node.original}\" -> {node.pattern})"
+    if isinstance(node, AndNode):
+        lines = [f"{pad}AND"]
+        for c in node.children:
+            lines.append(pretty_print(c, indent + 2))
+        return "\n".join(lines)
+    if isinstance(node, OrNode):
+        lines = [f"{pad}OR"]
+        for c in node.children:
+            lines.append(pretty_print(c, indent + 2))
+        return "\n".join(lines)
+    if isinstance(node, NotNode):
+        lines = [f"{pad}NOT"]
+        lines.append(pretty_print(node.child, indent + 2))
+        return "\n".join(lines)
+    return f"{pad}<unknown>"
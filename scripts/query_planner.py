@@ -0,0 +1,118 @@
+"""
+Query Planner Module
+
+Chooses the order in which the children of AND and OR nodes are evaluated.
+An AND is decided as soon as one child is false, an OR as soon as one is
+true, so a rare term written last in an AND (or a common one written last
+in an OR) should be evaluated first: the remaining children then often do
+not need to be scanned at all.
+
+Each subtree gets an estimated probability of being true in a paper (from
+document frequencies) and an expected evaluation cost (from the complexity
+of its term patterns). Children are ordered by the classic rank for
+short-circuit evaluation: cost / P(false) for AND, cost / P(true) for OR,
+cheapest per chance of deciding the node first; ties keep the written
+order. Probabilities of siblings are combined as if they were independent.
+
+Document frequencies come from a corpus index (exact, see
+corpus_index.CorpusIndex.document_frequencies) or are learned from the
+first papers of a run: the planner observes which terms the first
+sample_size papers contain and only then builds the plan.
+
+The plan only changes the order of evaluation. Verdicts and evidence stay
+those of the query as written (see validator.evaluate_ast).
+"""
+
+from collections import Counter
+from dataclasses import replace
+
+# Papers evaluated without a plan to learn term frequencies
+DEFAULT_SAMPLE_SIZE = 50
+
+def term_cost(pattern):
+    """Relative cost of scanning for a term pattern: phrases and wildcards cost more."""
+    return 1.0 + 0.5 * pattern.count("\\s+") + (0.5 if pattern.endswith("\\w*") else 0.0)
+
+class QueryPlanner:
+    """
+    Plan for evaluating one query AST.
+
+    Args:
+        query_node: Query AST as written
+        sample_size: Papers to observe before planning (without frequencies)
+        frequencies: Optional {term pattern: fraction of papers containing it};
+                     the plan is then built right away
+    """
+
+    def __init__(self, query_node, sample_size=DEFAULT_SAMPLE_SIZE, frequencies=None):
+        self.query_node = query_node
+        self.sample_size = sample_size
+        self.documents = 0
+        self.plan = None
+        self._found = Counter()
+        self._frequencies = frequencies
+        self._estimates = {}
+        if frequencies is not None:
+            self._build()
+
+    def observe(self, matched):
+        """Record which terms (by TermNode.pattern) one unplanned paper contains."""
+        if self.plan is not None:
+            return
+        self.documents += 1
+        self._found.update(pattern for pattern, found in matched.items() if found)
+        if self.documents >= self.sample_size:
+            self._build()
+
+    def frequency(self, pattern):
+        """Estimated fraction of papers containing a term."""
+        if self._frequencies is not None:
+            return self._frequencies.get(pattern, 0.5)
+        # Smoothed, so terms not seen in the sample are rare but not impossible
+        return (self._found[pattern] + 0.5) / (self.documents + 1)
+
+    def _build(self):
+        self.plan, _p, _cost = self._estimate(self.query_node)
+
+    def _estimate(self, node):
+        """Return (planned node, P(true), expected cost) of a subtree."""
+        kind = getattr(node, "kind", None)
+        if kind == "term":
+            p, cost = self.frequency(node.pattern), term_cost(node.pattern)
+            planned = node
+        elif kind == "not":
+            child, p, cost = self._estimate(node.child)
+            planned, p = replace(node, child=child), 1.0 - p
+        else:
+            estimates = [self._estimate(c) for c in node.children]
+            if kind == "and":
+                estimates.sort(key=lambda e: e[2] / max(1.0 - e[1], 1e-9))
+            else:
+                estimates.sort(key=lambda e: e[2] / max(e[1], 1e-9))
+            # A child is only evaluated if all earlier ones left the node open
+            p_open, cost = 1.0, 0.0
+            for _child, p_child, cost_child in estimates:
+                cost += p_open * cost_child
+                p_open *= p_child if kind == "and" else 1.0 - p_child
+            p = p_open if kind == "and" else 1.0 - p_open
+            planned = replace(node, children=[e[0] for e in estimates])
+        self._estimates[id(planned)] = (p, cost)
+        return planned, p, cost
+
+    def format_plan(self, indent=0):
+        """The planned tree in query_parser.pretty_print layout, with estimates."""
+        if self.plan is None:
+            return "".rjust(indent) + f"(no plan yet: {self.documents} of {self.sample_size} papers sampled)"
+        return "\n".join(self._format(self.plan, indent))
+
+    def _format(self, node, indent):
+        pad = "".rjust(indent)
+        p, cost = self._estimates[id(node)]
+        note = f"  [p={p:.3f}, cost={cost:.2f}]"
+        if node.kind == "term":
+            return [f"{pad}TERM(\"{node.original}\" -> {node.pattern}){note}"]
+        children = [node.child] if node.kind == "not" else node.children
+        lines = [f"{pad}{node.kind.upper()}{note}"]
+        for c in children:
+            lines.extend(self._format(c, indent + 2))
+        return lines
@@ -0,0 +1,191 @@
+"""
+Term Scanner Module
+
+Finds the matches of all terms of a query in one pass over a document,
+instead of one search (plus one evidence pass) per term.
+
+The term patterns are combined into a single zero-width lookahead
+alternation, (?=p1|p2|...), whose finditer stops at every position where
+at least one term matches. Only there are the individual term patterns
+tried, anchored at that position, which also finds terms hidden behind an
+earlier alternative (e.g. "forest" and "forest*" both matching at the same
+offset). Each term's matches are then filtered to be non-overlapping, so
+every term gets exactly the matches its own finditer would return.
+
+Once a term has reached the requested number of matches it is dropped and
+the scan continues with a combined pattern of the remaining terms, so
+frequent terms do not cost a Python-level step per occurrence.
+
+The regex engine still tries every alternative at every position, so that
+scan slows down linearly with the number of terms. For long queries the
+"aho-corasick" engine instead finds the candidate positions with an
+Aho-Corasick automaton over the literal start of each term (its first
+word, already folded for case-insensitive queries), whose cost does not
+depend on the number of terms. Word boundaries, the rest of a phrase and
+wildcard suffixes are checked afterwards by matching the term's own
+pattern at the candidate, so both engines return identical matches. Terms
+without a literal start fall back to the regex scan.
+"""
+
+import re
+from functools import lru_cache
+
+from aho_corasick import PYAHOCORASICK_AVAILABLE, AhoCorasick
+
+# Matches collected per term (evidence snippets per term in the report)
+DEFAULT_MATCH_LIMIT = 3
+
+# Values of the text_processing.matching_engine setting
+MATCHING_ENGINES = ("auto", "regex", "aho-corasick")
+DEFAULT_MATCHING_ENGINE = "auto"
+
+# "auto" uses the pure-Python automaton from this many literal terms on
+# (see benchmarks/bench_term_matching.py); with pyahocorasick, always
+AUTO_AHO_CORASICK_TERMS = 150
+
+# Patterns built only from \b and \w* can match the empty string; they are
+# scanned on their own with finditer, whose empty-match rules differ
+_ZERO_WIDTH_PARTS = re.compile(r"\\b|\\w\*")
+
+def _can_match_empty(pattern):
+    return not _ZERO_WIDTH_PARTS.sub("", pattern)
+
+@lru_cache(maxsize=256)
+def _combined_regex(patterns):
+    return re.compile("(?=" + "|".join(f"(?:{p})" for p in patterns) + ")")
+
+@lru_cache(maxsize=4096)
+def _term_regex(pattern):
+    return re.compile(pattern)
+
+# Pattern syntax built by query_parser._escape_term_to_regex besides escaped text
+_TERM_SYNTAX = ("\\b", "\\s+", "\\w*")
+
+@lru_cache(maxsize=4096)
+def _literal_key(pattern):
+    """
+    Literal text every match of pattern starts with, or None.
+
+    Understands the patterns built by query_parser._escape_term_to_regex:
+    re.escape()d text, \\s+ between words, \\b and a \\w* suffix. The key is
+    the text before the first \\s+ or \\w*. Any other regex syntax returns
+    None, as does a pattern without leading text.
+    """
+    key = []
+    in_key = True
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if pattern.startswith(_TERM_SYNTAX, i):
+            if pattern[i + 1] != "b":
+                in_key = False
+            elif key:
+                in_key = False
+            i += 2 if pattern[i + 1] == "b" else 3
+            continue
+        if ch == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            ch = pattern[i + 1]
+            i += 2
+        elif ch in ".^$*+?{}[]|()":
+            return None
+        else:
+            i += 1
+        if in_key:
+            key.append(ch)
+    return "".join(key) or None
+
+@lru_cache(maxsize=64)
+def _automaton(keys):
+    return AhoCorasick(keys)
+
+def scan_terms(text, patterns, limit=DEFAULT_MATCH_LIMIT, engine=DEFAULT_MATCHING_ENGINE):
+    """
+    Find the first matches of several regex patterns in one pass.
+
+    Args:
+        text: Text to scan
+        patterns: Iterable of regex pattern strings (compiled without flags)
+        limit: Matches to collect per pattern; scanning stops once every
+               pattern has this many (limit=1 answers "does it occur?")
+        engine: "regex", "aho-corasick" or "auto" (see MATCHING_ENGINES)
+
+    Returns:
+        dict: {pattern: [(start, end), ...]} with the first `limit`
+              matches of each pattern, exactly as re.finditer would
+              return them; patterns without a match map to []
+    """
+    if engine not in MATCHING_ENGINES:
+        raise ValueError(f"Unknown matching engine '{engine}' (expected one of {', '.join(MATCHING_ENGINES)})")
+    hits = {p: [] for p in patterns}
+    remaining = list(hits)
+    if engine != "regex":
+        keyed = [p for p in remaining if _literal_key(p)]
+        if engine == "aho-corasick" or PYAHOCORASICK_AVAILABLE or len(keyed) >= AUTO_AHO_CORASICK_TERMS:
+            _scan_candidates(text, keyed, limit, hits)
+            keyed = set(keyed)
+            remaining = [p for p in remaining if p not in keyed]
+    _scan_regex(text, remaining, limit, hits)
+    return hits
+
+def _scan_candidates(text, patterns, limit, hits):
+    """Aho-Corasick engine: verify each term at the occurrences of its literal start."""
+    by_key = {}
+    for pattern in patterns:
+        by_key.setdefault(_literal_key(pattern), []).append(pattern)
+    automaton = _automaton(tuple(by_key))
+    terms = [(len(key) - 1, by_key[key]) for key in automaton.keys]
+
+    last_end = dict.fromkeys(patterns, 0)
+    open_terms = len(patterns)
+    for end, index in automaton.iter(text):
+        offset, candidates = terms[index]
+        at = end - offset
+        for pattern in candidates:
+            found = hits[pattern]
+            if at < last_end[pattern] or len(found) >= limit:
+                continue
+            m = _term_regex(pattern).match(text, at)
+            if m:
+                found.append(m.span())
+                last_end[pattern] = m.end()
+                if len(found) >= limit:
+                    open_terms -= 1
+        if not open_terms:
+            break
+
+def _scan_regex(text, patterns, limit, hits):
+    """Regex engine: combined lookahead scan (see the module docstring)."""
+    remaining = []
+    for pattern in patterns:
+        if _can_match_empty(pattern):
+            for m in _term_regex(pattern).finditer(text):
+                hits[pattern].append(m.span())
+                if len(hits[pattern]) >= limit:
+                    break
+        else:
+            remaining.append(pattern)
+
+    # End of each pattern's last match: its next match may not start before
+    last_end = dict.fromkeys(remaining, 0)
+    pos = 0
+    while remaining:
+        finished = False
+        for candidate in _combined_regex(tuple(remaining)).finditer(text, pos):
+            at = candidate.start()
+            for pattern in remaining:
+                if at < last_end[pattern]:
+                    continue
+                m = _term_regex(pattern).match(text, at)
+                if m:
+                    hits[pattern].append(m.span())
+                    last_end[pattern] = m.end()
+                    if len(hits[pattern]) >= limit:
+                        finished = True
+            if finished:
+                pos = at + 1
+                break
+        if not finished:
+            break
+        remaining = [p for p in remaining if len(hits[p]) < limit]
@@ -9,15 +9,20 @@ import json
 import re
 from pathlib import Path
 from search_parser import compile_regex_patterns
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 
 # Query AST types (imported lazily to avoid tight coupling during legacy runs)
 try:
-    from query_parser import TermNode, AndNode, OrNode, NotNode, pretty_print
+    from query_parser import TermNode, AndNode, OrNode, NotNode, pretty_print, _escape_term_to_regex
 except Exception:
     TermNode = AndNode = OrNode = NotNode = None  # type: ignore
-    pretty_print = None  # type: ignore
-from pdf_extractor import load_json_content, get_paper_filename
+    pretty_print = _escape_term_to_regex = None  # type: ignore
+from pdf_extractor import iter_json_content, get_paper_filename, page_for_offset
+from corpus_store import CorpusReader, has_corpus
+from packed_corpus import PackedCorpus, has_pack
+from dedup import Deduplicator
+from text_normalizer import NORMALIZATION_VERSION, collapse_whitespace, fold_text, unfold_offset
+from term_scanner import DEFAULT_MATCH_LIMIT, DEFAULT_MATCHING_ENGINE, scan_terms
 
 def load_config(config_path="config.json"):
     """Load configuration settings."""
@@ -31,40 +36,124 @@ def load_config(config_path="config.json"):
             "text_processing": {"case_sensitive": False, "encoding": "utf-8"}
         }
 
-def validate_papers(json_dir, search_blocks, config_path="config.json", *, query_node=None):
+def validate_papers(json_dir, search_blocks, config_path="config.json", *, query_node=None, corpus_format=None,
+                    dedup_threshold=None, planner=None, json_options=None):
     """Validate papers against search criteria using configurable logic.
 
+    Collects the results of iter_validation_results (see there) into a list.
+    """
+    return list(iter_validation_results(json_dir, search_blocks, config_path, query_node=query_node,
+                                        corpus_format=corpus_format, dedup_threshold=dedup_threshold,
+                                        planner=planner, json_options=json_options))
+
+def iter_validation_results(json_dir, search_blocks, config_path="config.json", *, query_node=None,
+                            corpus_format=None, dedup_threshold=None, planner=None, json_options=None):
+    """Validate papers one at a time and yield their results.
+
     Modes:
     - Legacy mode (search_blocks provided, query_node is None):
         Evaluate per-block regexes with config-driven AND/OR and combinations.
     - Query mode (query_node provided):
         Evaluate a Boolean AST against document text; config.validation_logic is ignored.
+
+    json_dir may hold one JSON file per paper ("json"), a corpus store
+    ("jsonl.gz", streamed one paper at a time) or a packed corpus ("pack",
+    memory-mapped, see packed_corpus.py). corpus_format=None picks the pack,
+    then the corpus store, if json_dir contains one. Either way papers are read
+    one at a time and released after evaluation, so memory use stays flat
+    regardless of corpus size. JSON files are read from json_dir itself unless
+    json_options select others (see open_papers).
+
+    With dedup_threshold set, duplicate papers (see dedup.Deduplicator) are
+    not evaluated again: they receive their cluster representative's verdict
+    and carry 'duplicate_of', 'duplicate_match' and 'duplicate_similarity'.
+
+    In query mode, planner (a query_planner.QueryPlanner for query_node)
+    orders the evaluation of the query's terms; results are unchanged.
     """
 
     # Load configuration
     config = load_config(config_path)
 
-    # Load paper content
-    papers = load_json_content(json_dir)
-
-    if not papers:
-        raise ValueError(f"No papers found in {json_dir}")
-
     # Prepare compiled patterns (legacy) or regex cache (query)
     compiled_blocks = None
     if query_node is None:
         compiled_blocks = compile_regex_patterns(search_blocks)
 
-    validation_results = []
-
-    for paper in papers:
+    representatives = {}
+    for paper, duplicate in iter_papers(json_dir, corpus_format, dedup_threshold=dedup_threshold,
+                                        json_options=json_options):
+        if duplicate is not None:
+            yield duplicate_result(representatives[duplicate[0]], paper, duplicate)
+            continue
         if query_node is not None:
-            result = validate_single_paper_query(paper, query_node, config)
+            result = validate_single_paper_query(paper, query_node, config, planner)
         else:
             result = validate_single_paper(paper, compiled_blocks, config)
-        validation_results.append(result)
+        if dedup_threshold is not None:
+            representatives[paper.get("filename", "unknown")] = result
+        yield result
+
+def detect_corpus_format(json_dir):
+    """Storage format of extracted papers in json_dir: "pack", "jsonl.gz" or "json"."""
+    if has_pack(json_dir):
+        return "pack"
+    return "jsonl.gz" if has_corpus(json_dir) else "json"
+
+def open_papers(json_dir, corpus_format=None, json_options=None):
+    """Open the papers of json_dir for streaming; returns (papers, corpus_format).
+
+    json_options: pdf_extractor.iter_json_content arguments selecting the
+    JSON files to read (default: those directly in json_dir).
+    A "pack" source must be closed by the caller.
+    """
+    if corpus_format is None:
+        corpus_format = detect_corpus_format(json_dir)
+    if corpus_format == "pack":
+        papers = PackedCorpus(json_dir)
+        print(f"Reading {len(papers)} papers from packed corpus")
+    elif corpus_format == "jsonl.gz":
+        papers = CorpusReader(json_dir)
+        print(f"Streaming {len(papers)} papers from corpus store")
+    else:
+        papers = iter_json_content(json_dir, **(json_options or {}))
+    return papers, corpus_format
+
+def iter_papers(json_dir, corpus_format=None, *, dedup_threshold=None, json_options=None):
+    """Stream the papers of json_dir (see open_papers) as (paper, duplicate) pairs.
 
-    return validation_results
+    With dedup_threshold set, duplicate is (representative filename, match,
+    similarity) for a duplicate paper (see dedup.Deduplicator), which callers
+    give their representative's result via duplicate_result; otherwise it is
+    None. The pack is closed when the iteration ends.
+
+    Raises:
+        ValueError: If json_dir holds no papers
+    """
+    papers, corpus_format = open_papers(json_dir, corpus_format, json_options)
+    deduplicator = Deduplicator(dedup_threshold) if dedup_threshold is not None else None
+    count = 0
+
+    try:
+        for paper in papers:
+            count += 1
+            duplicate = deduplicator.check(paper) if deduplicator and paper.get("full_text") else None
+            yield paper, duplicate
+    finally:
+        if corpus_format == "pack":
+            papers.close()
+
+    if not count:
+        raise ValueError(f"No papers found in {json_dir}")
+
+def duplicate_result(result, paper, duplicate):
+    """Copy of the representative's result for a duplicate paper (see iter_papers)."""
+    representative, match, similarity = duplicate
+    return dict(result,
+                filename=get_paper_filename(paper.get("filename", "unknown")),
+                duplicate_of=get_paper_filename(representative),
+                duplicate_match=match,
+                duplicate_similarity=similarity)
 
 def validate_single_paper(paper, compiled_blocks, config):
     """Validate a single paper against all search blocks with configurable logic."""
@@ -141,6 +230,7 @@ def validate_single_paper(paper, compiled_blocks, config):
 # ------------------ Query-mode evaluation ------------------
 
 _REGEX_CACHE: Dict[str, Any] = {}
+_FOLDED_PATTERNS: Dict[str, str] = {}
 
 
 def _compile_regex(pattern: str, case_sensitive: bool) -> Any:
@@ -156,40 +246,131 @@ def _compile_regex(pattern: str, case_sensitive: bool) -> Any:
     return rx
 
 
+def _term_regex(node, case_sensitive: bool) -> Any:
+    """Compiled regex for a term node.
+
+    Case-insensitive terms are folded like the text (see text_normalizer.fold_text)
+    and matched case-sensitively against the folded copy.
+    """
+    if case_sensitive:
+        return _compile_regex(node.pattern, True)
+    pattern = _FOLDED_PATTERNS.get(node.pattern)
+    if pattern is None:
+        pattern = _escape_term_to_regex(fold_text(node.original)[0], node.is_phrase)
+        _FOLDED_PATTERNS[node.pattern] = pattern
+    return _compile_regex(pattern, True)
+
+
 def _prep_text(text: str, case_sensitive: bool) -> str:
     if not text:
         return ""
     # Normalize whitespace; case handled by regex flags
-    return re.sub(r"\s+", " ", text).strip()
+    return collapse_whitespace(text)
 
 
-def _evidence_from_matches(rx, text: str, term: str, context: int = 30) -> List[Dict[str, Any]]:
+def _evidence_from_spans(spans, text: str, term: str, context: int = 30, page_offsets=None,
+                         folded=None) -> List[Dict[str, Any]]:
     ev: List[Dict[str, Any]] = []
-    for m in rx.finditer(text):
-        start, end = m.span()
+    fold_offsets = folded[1] if folded else None
+    for start, end in spans:
+        if fold_offsets is not None:
+            start = unfold_offset(fold_offsets, start)
+            end = unfold_offset(fold_offsets, end, end=True)
         s = max(0, start - context)
         e = min(len(text), end + context)
         snippet = text[s:e]
-        ev.append({"term": term, "span": [start, end], "snippet": snippet})
-        if len(ev) >= 3:
+        item = {"term": term, "span": [start, end], "snippet": snippet}
+        if page_offsets:
+            item["page"] = page_for_offset(page_offsets, start)
+        ev.append(item)
+        if len(ev) >= DEFAULT_MATCH_LIMIT:
             break
     return ev
 
 
-def evaluate_ast(node, text: str, *, case_sensitive: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
+def evaluate_ast(node, text: str, *, case_sensitive: bool = False, page_offsets=None,
+                 normalized: bool = False, folded=None,
+                 engine: str = DEFAULT_MATCHING_ENGINE, planner=None,
+                 evidence: bool = True) -> Tuple[bool, List[Dict[str, Any]]]:
     """Evaluate the Boolean AST over the text and collect match evidence.
 
+    If page_offsets (from the extracted JSON) is given, each evidence item also
+    carries the 1-based "page" it was found on.
+
+    Case-insensitive queries are matched against a case- and accent-folded copy
+    of the text, so "Luscher" also finds "Lüscher"; evidence spans and snippets
+    refer to the unfolded text. normalized=True skips whitespace normalization
+    for text that is already canonical (current extracted JSON), and folded may
+    pass its precomputed (folded_text, fold_offsets). engine selects the term
+    matching engine (see term_scanner.MATCHING_ENGINES); all give the same result.
+
+    With a query_planner.QueryPlanner whose plan is ready, the verdict is
+    decided first by evaluating the planned tree, scanning the terms of each
+    child of the root only when it is reached; the remaining terms are only
+    scanned (for evidence) if the verdict is True. Until then the planner
+    observes which terms each paper contains.
+
+    The tree is evaluated on match spans only; snippets are cut from the text
+    afterwards, and only if the verdict is True (they are discarded for
+    excluded papers). evidence=False gives the verdict alone: every term is
+    only searched up to its first match and the evidence list is empty.
+
     Returns (verdict, evidence_list).
     """
-    text2 = _prep_text(text, case_sensitive)
+    text2, folded, scanned = _scan_inputs(text, case_sensitive, normalized, folded)
+    patterns = {n.pattern: _term_regex(n, case_sensitive).pattern for n in _iter_terms(node)}
+    limit = DEFAULT_MATCH_LIMIT if evidence else 1
+    if planner is not None and planner.plan is not None:
+        hits: Dict[str, Any] = {}
+        verdict = _planned_verdict(planner.plan, scanned, patterns, hits, engine, limit)
+        if not verdict or not evidence:
+            return verdict, []
+        missing = [p for p in patterns.values() if p not in hits]
+        if missing:
+            hits.update(scan_terms(scanned, missing, engine=engine))
+    else:
+        # One pass over the text finds the first matches of every term
+        hits = scan_terms(scanned, patterns.values(), limit=limit, engine=engine)
+        if planner is not None:
+            planner.observe({term: bool(hits[p]) for term, p in patterns.items()})
+    return _verdict_from_hits(node, hits, patterns, text2, page_offsets, folded, evidence)
+
+
+def evaluate_queries(nodes, text: str, *, case_sensitive: bool = False, page_offsets=None,
+                     normalized: bool = False, folded=None, engine: str = DEFAULT_MATCHING_ENGINE,
+                     evidence: bool = True) -> List[Tuple[bool, List[Dict[str, Any]]]]:
+    """Evaluate several Boolean ASTs over the same text with one scan.
+
+    The terms of all queries are searched in a single scan_terms pass (terms
+    shared by several queries only once). Returns one (verdict,
+    evidence_list) per node, each exactly as evaluate_ast would return it.
+    """
+    text2, folded, scanned = _scan_inputs(text, case_sensitive, normalized, folded)
+    patterns = {n.pattern: _term_regex(n, case_sensitive).pattern for node in nodes for n in _iter_terms(node)}
+    hits = scan_terms(scanned, set(patterns.values()), limit=DEFAULT_MATCH_LIMIT if evidence else 1, engine=engine)
+    return [_verdict_from_hits(node, hits, patterns, text2, page_offsets, folded, evidence) for node in nodes]
+
 
-    def eval_node(n) -> Tuple[bool, List[Dict[str, Any]]]:
+def _scan_inputs(text: str, case_sensitive: bool, normalized: bool, folded):
+    """(normalized text, (folded_text, fold_offsets) or None, text to scan) for evaluate_ast."""
+    text2 = text if normalized or folded is not None else _prep_text(text, case_sensitive)
+    if case_sensitive:
+        folded = None
+    elif folded is None:
+        folded = fold_text(text2)
+    return text2, folded, (folded[0] if folded else text2)
+
+
+def _verdict_from_hits(node, hits, patterns, text2: str, page_offsets, folded,
+                       evidence: bool) -> Tuple[bool, List[Dict[str, Any]]]:
+    """Verdict and evidence of a query AST from the match spans of its terms."""
+
+    # Evaluated on spans: evidence is the list of matched terms that support the verdict
+    def eval_node(n) -> Tuple[bool, List[Any]]:
         # Term
         if hasattr(n, "kind") and getattr(n, "kind") == "term":
-            rx = _compile_regex(n.pattern, case_sensitive)
-            m = rx.search(text2)
-            if m:
-                return True, _evidence_from_matches(rx, text2, n.original)
+            if hits[patterns[n.pattern]]:
+                return True, [n]
             return False, []
 
         # NOT
@@ -199,7 +380,7 @@ def evaluate_ast(node, text: str, *, case_sensitive: bool = False) -> Tuple[bool
 
         # AND
         if hasattr(n, "kind") and getattr(n, "kind") == "and":
-            all_ev: List[Dict[str, Any]] = []
+            all_ev: List[Any] = []
             for c in n.children:
                 ok, ev = eval_node(c)
                 if not ok:
@@ -207,43 +388,206 @@ def evaluate_ast(node, text: str, *, case_sensitive: bool = False) -> Tuple[bool
                 all_ev.extend(ev)
             return True, all_ev
 
-        # OR
+        # OR: evidence of the first true child
         if hasattr(n, "kind") and getattr(n, "kind") == "or":
-            first_ev: List[Dict[str, Any]] = []
-            any_true = False
             for c in n.children:
                 ok, ev = eval_node(c)
-                if ok and not any_true:
-                    any_true = True
-                    first_ev = ev
-            return any_true, (first_ev if any_true else [])
+                if ok:
+                    return True, ev
+            return False, []
 
         # Unknown node
         return False, []
 
-    return eval_node(node)
-
+    verdict, terms = eval_node(node)
+    if not verdict or not evidence:
+        return verdict, []
+    evidence_list: List[Dict[str, Any]] = []
+    for n in terms:
+        evidence_list.extend(_evidence_from_spans(hits[patterns[n.pattern]], text2, n.original,
+                                                  page_offsets=page_offsets, folded=folded))
+    return True, evidence_list
+
+
+def _planned_verdict(plan, scanned: str, patterns, hits, engine: str, limit: int = DEFAULT_MATCH_LIMIT) -> bool:
+    """Verdict of a planned query tree, scanning each child's terms in one pass when it is reached."""
+
+    def ensure(n) -> None:
+        missing = {patterns[t.pattern] for t in _iter_terms(n)} - hits.keys()
+        if missing:
+            hits.update(scan_terms(scanned, missing, limit=limit, engine=engine))
+
+    def verdict(n) -> bool:
+        kind = getattr(n, "kind", None)
+        if kind == "term":
+            ensure(n)
+            return bool(hits[patterns[n.pattern]])
+        if kind == "not":
+            return not verdict(n.child)
+        if kind in ("and", "or"):
+            deciding = kind == "or"
+            for c in n.children:
+                ensure(c)
+                if verdict(c) == deciding:
+                    return deciding
+            return not deciding
+        return False
+
+    return verdict(plan)
+
+
+def _iter_terms(node):
+    """Yield every TermNode of a query AST (depth-first, left to right)."""
+    kind = getattr(node, "kind", None)
+    if kind == "term":
+        yield node
+    elif kind == "not":
+        yield from _iter_terms(node.child)
+    elif kind in ("and", "or"):
+        for c in node.children:
+            yield from _iter_terms(c)
+
+
+class IncrementalEvaluator:
+    """Evaluate a Boolean AST over text that arrives in chunks (e.g. PDF pages).
+
+    Term matches only accumulate as more text arrives, so every node is either
+    decided (True/False) or still open. feed() returns True as soon as the root
+    verdict is decided, e.g. once a NOT-free query is satisfied, so the caller
+    can stop reading the document.
+    """
 
-def validate_single_paper_query(paper, query_node, config):
-    """Validate a single paper using AST-based Boolean evaluation."""
-    json_filename = paper.get("filename", "unknown")
-    pdf_filename = get_paper_filename(json_filename)
+    # Characters of earlier text re-scanned with each chunk so phrases spanning a page break match
+    OVERLAP = 256
+
+    def __init__(self, query_node, *, case_sensitive: bool = False, engine: str = DEFAULT_MATCHING_ENGINE):
+        self.query_node = query_node
+        self.case_sensitive = case_sensitive
+        self.engine = engine
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all text fed so far."""
+        self._pending = {n.pattern: _term_regex(n, self.case_sensitive) for n in _iter_terms(self.query_node)}
+        self._matched = set()
+        self._tail = ""
+        self._verdict = self._state(self.query_node)
+
+    @property
+    def decided(self) -> bool:
+        return self._verdict is not None
+
+    @property
+    def verdict(self) -> Optional[bool]:
+        """The decided verdict, or None while more text could still change it."""
+        return self._verdict
+
+    def feed(self, text: str) -> bool:
+        """Add a chunk of text; return True once the verdict is decided."""
+        chunk = _prep_text(text, self.case_sensitive)
+        if not self.case_sensitive:
+            chunk = fold_text(chunk)[0]
+        if not chunk or self.decided:
+            return self.decided
+        window = f"{self._tail} {chunk}" if self._tail else chunk
+        hits = scan_terms(window, {rx.pattern for rx in self._pending.values()}, limit=1, engine=self.engine)
+        for pattern, rx in list(self._pending.items()):
+            if hits[rx.pattern]:
+                self._matched.add(pattern)
+                del self._pending[pattern]
+
+        # Keep the end of the window, starting at a word boundary
+        tail = window[-self.OVERLAP:]
+        if len(window) > self.OVERLAP:
+            cut = tail.find(" ")
+            tail = tail[cut + 1:] if cut >= 0 else ""
+        self._tail = tail
+
+        self._verdict = self._state(self.query_node)
+        return self.decided
+
+    def _state(self, n) -> Optional[bool]:
+        kind = getattr(n, "kind", None)
+        if kind == "term":
+            # An unmatched term may still match later text
+            return True if n.pattern in self._matched else None
+        if kind == "not":
+            child = self._state(n.child)
+            return None if child is None else (not child)
+        if kind == "and":
+            states = [self._state(c) for c in n.children]
+            if False in states:
+                return False
+            return True if all(st is True for st in states) else None
+        if kind == "or":
+            states = [self._state(c) for c in n.children]
+            if True in states:
+                return True
+            return False if all(st is False for st in states) else None
+        return False
+
+
+def validate_single_paper_query(paper, query_node, config, planner=None, evidence=True):
+    """Validate a single paper using AST-based Boolean evaluation.
+
+    planner: optional query_planner.QueryPlanner for query_node (see evaluate_ast).
+    evidence=False: verdict only, the result carries no match snippets.
+    """
+    pdf_filename = get_paper_filename(paper.get("filename", "unknown"))
     full_text = paper.get("full_text", "")
+    if not full_text:
+        return _no_text_result(pdf_filename)
+
+    verdict, evidence_list = evaluate_ast(query_node, full_text, planner=planner, evidence=evidence,
+                                          **_evaluation_options(paper, config))
+    return query_result(pdf_filename, verdict, evidence_list)
 
+
+def validate_single_paper_queries(paper, query_nodes, config, evidence=True):
+    """Validate a single paper against several queries, scanning its text once.
+
+    Returns one result per query node, each as validate_single_paper_query
+    would return it (see evaluate_queries).
+    """
+    pdf_filename = get_paper_filename(paper.get("filename", "unknown"))
+    full_text = paper.get("full_text", "")
     if not full_text:
-        # Keep schema similar, but block_results becomes evidence list for query mode
-        return {
-            "filename": pdf_filename,
-            "overall_result": False,
-            "block_results": [],
-            "error": "No text content",
-            "total_blocks": 0,
-            "blocks_passed": 0,
-            "validation_date": "2025-09-05",
-        }
+        return [_no_text_result(pdf_filename) for _ in query_nodes]
+
+    outcomes = evaluate_queries(query_nodes, full_text, evidence=evidence, **_evaluation_options(paper, config))
+    return [query_result(pdf_filename, verdict, evidence_list) for verdict, evidence_list in outcomes]
+
+
+def _evaluation_options(paper, config):
+    """Keyword arguments of evaluate_ast for a paper under config."""
+    text_processing = config.get("text_processing", {})
+    case_sensitive = text_processing.get("case_sensitive", False)
+    # JSON from the current extractor carries canonical text and its folded copy;
+    # anything older (or stamped with another version) is re-normalized in memory
+    current = paper.get("normalization_version") == NORMALIZATION_VERSION
+    folded = None
+    if current and not case_sensitive and "folded_text" in paper and "fold_offsets" in paper:
+        folded = (paper["folded_text"], paper["fold_offsets"])
+    return {"case_sensitive": case_sensitive, "page_offsets": paper.get("page_offsets"),
+            "normalized": current, "folded": folded,
+            "engine": text_processing.get("matching_engine", DEFAULT_MATCHING_ENGINE)}
+
+
+def _no_text_result(pdf_filename):
+    # Keep schema similar, but block_results becomes evidence list for query mode
+    return {
+        "filename": pdf_filename,
+        "overall_result": False,
+        "block_results": [],
+        "error": "No text content",
+        "total_blocks": 0,
+        "blocks_passed": 0,
+        "validation_date": "2025-09-05",
+    }
+
 
-    case_sensitive = config.get("text_processing", {}).get("case_sensitive", False)
-    verdict, evidence = evaluate_ast(query_node, full_text, case_sensitive=case_sensitive)
+def query_result(pdf_filename, verdict, evidence):
+    """Validation result of a query-mode verdict and its evidence list."""
     # Represent evidence in block_results for backward-compatible report consumption
     block_results = [{
         "block_name": "Query",
@@ -251,9 +595,29 @@ def validate_single_paper_query(paper, query_node, config):
         "matches_found": len(evidence),
         "sample_matches": [e.get("snippet", "") for e in evidence]
     }]
+    if any("page" in e for e in evidence):
+        # Parallel to sample_matches: page number of each snippet
+        block_results[0]["sample_pages"] = [e.get("page") for e in evidence]
 
     return create_validation_result(pdf_filename, block_results, verdict)
 
+
+def scanned_text(paper, case_sensitive: bool) -> str:
+    """The text of a paper that validate_single_paper_query matches terms against.
+
+    That is the whitespace-normalized full text, case- and accent-folded
+    unless case_sensitive (see evaluate_ast).
+    """
+    text = paper.get("full_text", "")
+    current = paper.get("normalization_version") == NORMALIZATION_VERSION
+    if not current:
+        text = _prep_text(text, case_sensitive)
+    if case_sensitive:
+        return text
+    if current and "folded_text" in paper and "fold_offsets" in paper:
+        return paper["folded_text"]
+    return fold_text(text)[0]
+
 def create_validation_result(filename, block_results, overall_passed, error=None):
     """Create standardized validation result."""
 
@@ -268,7 +632,17 @@ def create_validation_result(filename, block_results, overall_passed, error=None
     }
 
 def save_validation_results(results, output_path):
-    """Save validation results to JSON file."""
+    """Save validation results to JSON file.
+
+    results may be any iterable, e.g. iter_validation_results(...): each
+    result is written as soon as it arrives. The file is identical to
+    json.dump(list(results), f, indent=2).
+    """
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+        first = True
+        for result in results:
+            f.write("[\n  " if first else ",\n  ")
+            f.write(json.dumps(result, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            first = False
+        f.write("[]" if first else "\n]")
@@ -0,0 +1,294 @@
+"""
+Watch Mode Module
+
+Keeps a screening session running after the initial batch (--watch) and
+screens PDFs as they arrive in the input folder. The parsed query, the
+configuration and the PDF libraries stay loaded, so each new or changed
+PDF costs one extraction and one evaluation instead of a full re-run.
+
+The input folder is polled with os.scandir; a file is screened once its
+size and modification time are unchanged across two polls, so downloads
+and copies still in progress are not read half-written. If the optional
+watchdog package is installed, file system events wake the poll loop
+immediately instead of waiting for the next interval.
+
+After every change the outputs are updated in place:
+validation_results.json, failed_pdfs.json, the HTML report and the
+sorted_pdfs folders (only the changed PDFs are copied or removed).
+
+PDFs are extracted by a one-worker SupervisedPool that lives as long as the
+watcher, so the per-PDF timeout and memory cap apply as in batch mode and a
+hanging or memory-hungry PDF fails instead of stopping the session.
+"""
+
+import json
+import threading
+from functools import partial
+from pathlib import Path
+
+from corpus_store import CorpusWriter
+from extraction_supervisor import SupervisedPool
+from inventory import DEFAULT_INCLUDE, iter_inventory
+from packed_corpus import discard_pack
+from pdf_extractor import _extract_single_pdf, _supervised_outcome, json_path_for, paper_record
+from report_generator import generate_html_report, sort_pdf_files
+from search_parser import compile_regex_patterns
+from validator import save_validation_results, validate_single_paper, validate_single_paper_query
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Seconds between polls of the input folder
+DEFAULT_POLL_INTERVAL = 5.0
+
+def scan_pdfs(input_dir, **inventory_options):
+    """
+    Snapshot the PDFs in a folder.
+
+    inventory_options are passed on to inventory.iter_inventory (include,
+    exclude, recursive, skip_dirs).
+
+    Returns:
+        dict: {relative path: (size, mtime_ns)} for every PDF
+    """
+    return {entry.relative: (entry.size, entry.mtime_ns)
+            for entry in iter_inventory(input_dir, **inventory_options)}
+
+if WATCHDOG_AVAILABLE:
+    class _WakeHandler(FileSystemEventHandler):
+        """Wake the poll loop on any file system event in the input folder."""
+
+        def __init__(self, wake):
+            self._wake = wake
+
+        def on_any_event(self, event):
+            self._wake.set()
+
+class ScreeningWatcher:
+    """
+    Incrementally screen the PDFs of an input folder.
+
+    Args:
+        input_dir: Folder watched for PDFs
+        output_dir: Folder holding the screening outputs
+        config: Loaded configuration dict
+        query_node: Parsed query (query mode); search_blocks are used otherwise
+        search_blocks: Legacy search blocks
+        query_string: Query text shown in the HTML report
+        options: ExtractionOptions applied to every PDF
+        cache_dir: Optional extraction cache directory
+        extraction_dir: Optional folder where extracted text is stored as well
+        corpus_format: Storage format of extraction_dir ("json" or "jsonl.gz")
+        include, exclude, recursive: Which files of input_dir to watch (see
+                                     inventory.iter_inventory)
+        limits: Optional dict with 'timeout' (seconds), 'max_memory_mb' and
+                'recycle_after' for the extraction worker (see
+                run_screening.run_validation)
+
+    Call close() to stop the extraction worker; run() does so when it ends.
+    """
+
+    def __init__(self, input_dir, output_dir, config, *, query_node=None, search_blocks=None,
+                 query_string=None, options=None, cache_dir=None, extraction_dir=None,
+                 corpus_format="json", include=DEFAULT_INCLUDE, exclude=(), recursive=False, limits=None):
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        self.config = config
+        self.query_node = query_node
+        self.compiled_blocks = compile_regex_patterns(search_blocks) if query_node is None else None
+        self.search_blocks = search_blocks
+        self.query_string = query_string
+        self.options = options
+        self.cache_dir = cache_dir
+        self.extraction_dir = Path(extraction_dir) if extraction_dir else None
+        self.corpus_format = corpus_format
+        self.inventory_options = {"include": include, "exclude": exclude, "recursive": recursive,
+                                  "skip_dirs": [self.output_dir]}
+        limits = limits or {}
+        self._pool = SupervisedPool(partial(_extract_single_pdf, cache_dir=cache_dir, options=options),
+                                    timeout=limits.get("timeout"), max_memory_mb=limits.get("max_memory_mb"),
+                                    max_tasks_per_worker=limits.get("recycle_after"))
+
+        self.results = {}
+        self.failures = {}
+        self._screened = {}  # filename -> signature the current verdict is based on
+        self._pending = {}   # filename -> signature seen at the last poll
+        self._wake = threading.Event()
+
+    def seed(self, results, failed_pdfs, snapshot):
+        """
+        Take over the outcome of an initial batch run.
+
+        snapshot must be taken (scan_pdfs or Inventory.snapshot) before that run started, so that
+        files changed while it was running are screened again.
+        """
+        for result in results:
+            self.results[result["filename"]] = result
+        for failure in failed_pdfs or []:
+            self.failures[failure["filename"]] = failure
+        for filename, signature in snapshot.items():
+            if filename in self.results or filename in self.failures:
+                self._screened[filename] = signature
+
+    def poll(self, settle=True):
+        """
+        Screen new and changed PDFs and drop removed ones.
+
+        With settle=True a file is only screened once its signature was the
+        same at the previous poll; settle=False screens every change at once.
+
+        Returns:
+            list: filenames whose outcome changed (screened or removed)
+        """
+        snapshot = scan_pdfs(self.input_dir, **self.inventory_options)
+        ready = []
+        for filename, signature in sorted(snapshot.items()):
+            if self._screened.get(filename) == signature:
+                self._pending.pop(filename, None)
+                continue
+            if settle and self._pending.get(filename) != signature:
+                # Still being written (or just appeared): look again next poll
+                self._pending[filename] = signature
+                continue
+            self._pending.pop(filename, None)
+            ready.append((filename, signature))
+
+        removed = [name for name in set(self.results) | set(self.failures) | set(self._screened)
+                   if name not in snapshot]
+        for filename in removed:
+            self._remove(filename)
+        for filename in list(self._pending):
+            if filename not in snapshot:
+                del self._pending[filename]
+
+        for filename, signature in ready:
+            self._screen(filename)
+            self._screened[filename] = signature
+
+        changed = [filename for filename, _signature in ready] + sorted(removed)
+        if changed:
+            self.write_outputs([filename for filename, _signature in ready])
+        return changed
+
+    def _screen(self, filename):
+        pdf_path = self.input_dir / filename
+        [(_pdf_path, status, result)] = self._pool.imap([pdf_path])
+        outcome = _supervised_outcome(status, result)
+        self.results.pop(filename, None)
+        self.failures.pop(filename, None)
+
+        if outcome['error_code']:
+            self.failures[filename] = {
+                'filename': filename,
+                'error_code': outcome['error_code'],
+                'error_message': outcome['error_message'],
+                'stage': outcome.get('stage', 'extraction')
+            }
+            print(f"  ❌ {filename}: {outcome['error_message']}")
+            return
+
+        paper = paper_record(pdf_path, outcome, filename)
+        self._store_paper(paper)
+        if self.query_node is not None:
+            result = validate_single_paper_query(paper, self.query_node, self.config)
+        else:
+            result = validate_single_paper(paper, self.compiled_blocks, self.config)
+        self.results[filename] = result
+        verdict = "included" if result["overall_result"] else "excluded"
+        print(f"  ✅ {filename}: {verdict}")
+
+    def _store_paper(self, paper):
+        if self.extraction_dir is None:
+            return
+        self.extraction_dir.mkdir(parents=True, exist_ok=True)
+        discard_pack(self.extraction_dir)
+        if self.corpus_format == "jsonl.gz":
+            # Later records replace earlier ones for the same filename
+            with CorpusWriter(self.extraction_dir, append=True) as corpus:
+                corpus.write(paper)
+        else:
+            json_path = json_path_for(self.extraction_dir, paper["filename"])
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(paper, f, ensure_ascii=False, indent=2)
+
+    def _remove(self, filename):
+        self.results.pop(filename, None)
+        self.failures.pop(filename, None)
+        self._screened.pop(filename, None)
+        self._remove_sorted_copies(filename)
+        print(f"  🗑️  {filename}: removed")
+
+    def write_outputs(self, screened):
+        """Rewrite the result files and report and sort the screened PDFs."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        results = [self.results[name] for name in sorted(self.results)]
+        failed_pdfs = [self.failures[name] for name in sorted(self.failures)]
+        output_settings = self.config.get("output_settings", {})
+
+        if output_settings.get("json_results", True):
+            save_validation_results(results, self.output_dir / "validation_results.json")
+        failed_json = self.output_dir / "failed_pdfs.json"
+        if failed_pdfs:
+            with open(failed_json, "w", encoding="utf-8") as f:
+                json.dump(failed_pdfs, f, ensure_ascii=False, indent=2)
+        elif failed_json.exists():
+            failed_json.unlink()
+        if output_settings.get("html_report", True):
+            generate_html_report(results, self.search_blocks, self.output_dir,
+                                 query_string=self.query_string, failed_pdfs=failed_pdfs)
+
+        sorted_results = [self.results[name] for name in screened if name in self.results]
+        if sorted_results:
+            sort_pdf_files(sorted_results, self.input_dir, self.output_dir)
+        for name in screened:
+            if name in self.failures:
+                # Failed on re-screening: its earlier verdict no longer applies
+                self._remove_sorted_copies(name)
+
+        included = sum(1 for r in results if r["overall_result"])
+        print(f"📊 {len(results)} screened ({included} included), {len(failed_pdfs)} failed")
+
+    def _remove_sorted_copies(self, filename):
+        for folder in ("include", "exclude"):
+            sorted_copy = self.output_dir / "sorted_pdfs" / folder / filename
+            if sorted_copy.exists():
+                sorted_copy.unlink()
+
+    def close(self):
+        """Stop the extraction worker (a later poll starts a new one)."""
+        self._pool.close()
+
+    def run(self, interval=DEFAULT_POLL_INTERVAL, stop=None):
+        """
+        Poll until interrupted (Ctrl+C) or until the stop event is set.
+
+        Args:
+            interval: Seconds between polls
+            stop: Optional threading.Event that ends the loop
+        """
+        observer = None
+        if WATCHDOG_AVAILABLE:
+            observer = Observer()
+            observer.schedule(_WakeHandler(self._wake), str(self.input_dir),
+                              recursive=self.inventory_options["recursive"])
+            observer.start()
+        mode = "file system events" if observer else f"polling every {interval:g}s"
+        print(f"👀 Watching {self.input_dir} for new PDFs ({mode}); press Ctrl+C to stop")
+        try:
+            while stop is None or not stop.is_set():
+                self.poll()
+                # Files still settling are confirmed at a quicker follow-up poll
+                self._wake.wait(min(interval, 1.0) if self._pending else interval)
+                self._wake.clear()
+        except KeyboardInterrupt:
+            print("\n⏹️  Watch mode stopped")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self.close()
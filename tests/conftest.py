@@ -0,0 +1,40 @@
+"""
+Shared test fixtures.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def make_pdf():
+    """
+    Factory writing test PDFs with PyMuPDF (skips the test without it).
+
+    make_pdf(path, pages) writes one page per entry of pages, carrying that
+    text (None or "" for a blank page). image=True adds a full-page image to
+    every page, metadata is set as the document metadata and further keyword
+    arguments go to fitz's save (e.g. encryption). Returns path.
+    """
+    fitz = pytest.importorskip("fitz")
+
+    def make(path, pages, *, image=False, metadata=None, **save_args):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        doc = fitz.open()
+        for text in pages:
+            page = doc.new_page()
+            if text:
+                page.insert_textbox(fitz.Rect(50, 50, 550, 800), text)
+            if image:
+                pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 60, 80), False)
+                pixmap.clear_with(200)
+                page.insert_image(page.rect, pixmap=pixmap)
+        if metadata:
+            doc.set_metadata(metadata)
+        doc.save(str(path), **save_args)
+        doc.close()
+        return path
+
+    return make
@@ -0,0 +1,108 @@
+"""
+Tests for corpus_index.py module.
+Differential tests against validate_papers: screening through the index
+must give identical results for every storage format.
+"""
+
+import json
+import random
+import tempfile
+from pathlib import Path
+import sys
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from corpus_index import CorpusIndex, _term_words, build_index
+from corpus_store import CorpusWriter
+from packed_corpus import pack_directory
+from text_normalizer import NORMALIZATION_VERSION, fold_text
+
+pytest.importorskip("pyparsing")
+from query_parser import parse_query
+from validator import validate_papers
+
+VOCABULARY = ["forest", "forests", "forestry", "management", "Wald", "Wälder", "öko", "ecosystem",
+              "services", "service", "climate", "change", "x-ray", "co2", "study", "studies"]
+QUERIES = [
+    "forest", "forest*", "fores*", "wald*", "walder", "x-ray", "co2 OR study*",
+    '"ecosystem service*"', '"climate change" AND NOT forest*', "NOT (forest OR wald)",
+    "(forest* AND management) OR (x-ray AND NOT studies)", '"öko" AND "forests management"',
+    "missing", "missing*", "* AND forest",
+]
+
+
+def _corpus(seed, count=40):
+    rng = random.Random(seed)
+    papers = []
+    for i in range(count):
+        text = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 30)))
+        paper = {"filename": f"paper{i:03d}.pdf", "full_text": text}
+        if i % 3:
+            # Current extraction output; the rest is legacy JSON without the folded copy
+            folded, fold_offsets = fold_text(text)
+            paper.update(normalization_version=NORMALIZATION_VERSION, folded_text=folded,
+                         fold_offsets=fold_offsets)
+        papers.append(paper)
+    return papers
+
+
+def _write_json(papers, directory):
+    for paper in papers:
+        path = Path(directory) / Path(paper["filename"]).with_suffix(".json")
+        path.write_text(json.dumps(paper), encoding="utf-8")
+
+
+def _config(directory, case_sensitive):
+    path = Path(directory) / "config.json"
+    path.write_text(json.dumps({"text_processing": {"case_sensitive": case_sensitive}}), encoding="utf-8")
+    return str(path)
+
+
+class TestTermWords:
+    """Test splitting term patterns into index words."""
+
+    def test_single_words_are_exact(self):
+        assert _term_words(r"\bforest\b") == ([("forest", False)], True)
+        assert _term_words(r"\bforest\w*") == ([("forest", True)], True)
+
+    def test_phrases_and_punctuation_need_checking(self):
+        assert _term_words(r"\becosystem\s+service\w*") == ([("ecosystem", False), ("service", True)], False)
+        assert _term_words(r"\bx\-ray\b") == ([("x", False), ("ray", False)], False)
+        assert _term_words(r"\bco\-\w*") == ([("co", False)], False)
+        assert _term_words(r"\b\w*") == ([], False)
+
+
+@pytest.mark.parametrize("corpus_format", ["json", "jsonl.gz", "pack"])
+@pytest.mark.parametrize("case_sensitive", [False, True])
+def test_screen_matches_validate_papers(corpus_format, case_sensitive):
+    papers = _corpus(7 + case_sensitive)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus_dir = Path(temp_dir) / "corpus"
+        corpus_dir.mkdir()
+        if corpus_format == "jsonl.gz":
+            with CorpusWriter(corpus_dir) as writer:
+                for paper in papers:
+                    writer.write(paper)
+        else:
+            _write_json(papers, corpus_dir)
+            if corpus_format == "pack":
+                pack_directory(corpus_dir)
+        config = _config(temp_dir, case_sensitive)
+
+        with build_index(corpus_dir, case_sensitive) as index:
+            assert len(index) == len(papers)
+            for query in QUERIES:
+                node = parse_query(query)
+                expected = validate_papers(corpus_dir, None, config, query_node=node)
+                assert list(index.screen(node, json.loads(Path(config).read_text()))) == expected, query
+
+
+def test_exact_terms_need_no_loader():
+    index = CorpusIndex()
+    for paper in _corpus(3):
+        index.add(paper)
+    included = index.evaluate(parse_query("forest* AND NOT wald"))
+    assert included and all(index.filenames[i].startswith("paper") for i in included)
+    with pytest.raises(ValueError):
+        index.evaluate(parse_query('"climate change"'))
@@ -0,0 +1,112 @@
+"""
+Tests for corpus_store.py module.
+Covers round trips, append semantics, index recovery and pipeline integration.
+"""
+
+import gzip
+import json
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from corpus_store import CorpusWriter, CorpusReader, corpus_path, has_corpus, INDEX_SUFFIX
+
+
+def _paper(name, text):
+    return {"filename": name, "full_text": text, "text_length": len(text)}
+
+
+class TestRoundTrip:
+    """Test writing and reading records."""
+
+    def test_stream_and_lookup(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with CorpusWriter(temp_dir) as corpus:
+                corpus.write(_paper("a.pdf", "Forest management"))
+                corpus.write(_paper("b.pdf", "Ökosystemleistungen im Wald"))
+
+            assert has_corpus(temp_dir)
+            reader = CorpusReader(temp_dir)
+            assert len(reader) == 2
+            assert [p["filename"] for p in reader] == ["a.pdf", "b.pdf"]
+            assert reader.get("b.pdf")["full_text"] == "Ökosystemleistungen im Wald"
+            assert reader.get("missing.pdf") is None
+
+            # The store is an ordinary multi-member gzip file
+            with gzip.open(corpus_path(temp_dir), "rt", encoding="utf-8") as f:
+                assert [json.loads(line)["filename"] for line in f] == ["a.pdf", "b.pdf"]
+
+    def test_later_record_wins(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with CorpusWriter(temp_dir) as corpus:
+                corpus.write(_paper("a.pdf", "old text"))
+                corpus.write(_paper("b.pdf", "other"))
+            with CorpusWriter(temp_dir, append=True) as corpus:
+                corpus.write(_paper("a.pdf", "new text"))
+
+            reader = CorpusReader(temp_dir)
+            assert [(p["filename"], p["full_text"]) for p in reader] == [("a.pdf", "new text"), ("b.pdf", "other")]
+
+            # Without append a new, empty store is started
+            with CorpusWriter(temp_dir) as corpus:
+                corpus.write(_paper("c.pdf", "fresh"))
+            assert CorpusReader(temp_dir).filenames() == ["c.pdf"]
+
+
+class TestRecovery:
+    """Test behaviour after interrupted runs."""
+
+    def test_missing_index_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with CorpusWriter(temp_dir) as corpus:
+                for i in range(3):
+                    corpus.write(_paper(f"p{i}.pdf", f"text {i} " * 1000))
+            index_path = Path(str(corpus_path(temp_dir)) + INDEX_SUFFIX)
+            index_path.unlink()
+            # Truncated record from an interrupted write
+            with open(corpus_path(temp_dir), "ab") as f:
+                f.write(gzip.compress(b'{"filename": "cut.pdf"}\n')[:10])
+
+            reader = CorpusReader(temp_dir)
+            assert reader.filenames() == ["p0.pdf", "p1.pdf", "p2.pdf"]
+            assert index_path.exists()
+            assert reader.get("p2.pdf")["full_text"].startswith("text 2")
+
+    def test_partial_index_line_is_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with CorpusWriter(temp_dir) as corpus:
+                corpus.write(_paper("a.pdf", "first"))
+            index_path = Path(str(corpus_path(temp_dir)) + INDEX_SUFFIX)
+            with open(index_path, "ab") as f:
+                f.write(b"12")
+            with CorpusWriter(temp_dir, append=True) as corpus:
+                corpus.write(_paper("b.pdf", "second"))
+
+            assert [p["full_text"] for p in CorpusReader(temp_dir)] == ["first", "second"]
+
+
+class TestPipeline:
+    """Test extraction into, and validation from, a corpus store."""
+
+    def test_extract_and_validate(self, make_pdf):
+        pytest.importorskip("pyparsing")
+        from pdf_extractor import extract_pdfs_to_json
+        from query_parser import parse_query
+        from validator import validate_papers
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+            for name, topic in [("forest.pdf", "forest management"), ("ocean.pdf", "ocean acidification")]:
+                make_pdf(input_dir / name, [f"This paper studies {topic} in depth. " * 5])
+
+            count, failed = extract_pdfs_to_json(str(input_dir), str(output_dir), corpus_format="jsonl.gz")
+            assert count == 2 and failed == []
+            assert list(output_dir.glob("*.json")) == []
+
+            results = validate_papers(str(output_dir), None, query_node=parse_query('forest'))
+            assert {r["filename"]: r["overall_result"] for r in results} == {"forest.pdf": True, "ocean.pdf": False}
@@ -0,0 +1,97 @@
+"""
+Tests for dedup.py module.
+Covers MinHash similarity, exact/near duplicate detection and verdict propagation.
+"""
+
+import json
+import random
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from dedup import Deduplicator, minhash_signature, estimate_similarity, duplicate_clusters
+from report_generator import generate_html_report
+
+
+def _text(seed, words=1500):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(3000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _edit(text, fraction, seed=0):
+    """Replace a fraction of the words, like a preprint differing from the published version."""
+    rng = random.Random(seed)
+    words = text.split()
+    for i in rng.sample(range(len(words)), int(len(words) * fraction)):
+        words[i] = "changed"
+    return " ".join(words)
+
+
+class TestSignatures:
+    """Test MinHash similarity estimates."""
+
+    def test_similarity_estimates(self):
+        base = _text(1)
+        sig = minhash_signature(base)
+        assert estimate_similarity(sig, minhash_signature(base)) == 1.0
+        assert estimate_similarity(sig, minhash_signature(_edit(base, 0.01))) > 0.85
+        assert estimate_similarity(sig, minhash_signature(_text(2))) < 0.1
+
+
+class TestDeduplicator:
+    """Test streaming duplicate detection."""
+
+    def test_exact_and_near_duplicates(self):
+        base = _text(1)
+        dedup = Deduplicator(threshold=0.8)
+        assert dedup.check({"filename": "a.pdf", "full_text": base}) is None
+        assert dedup.check({"filename": "b.pdf", "full_text": _text(2)}) is None
+        assert dedup.check({"filename": "a_copy.pdf", "full_text": base}) == ("a.pdf", "identical_text", 1.0)
+        representative, match, similarity = dedup.check({"filename": "a_v2.pdf", "full_text": _edit(base, 0.01)})
+        assert (representative, match) == ("a.pdf", "near_duplicate") and similarity >= 0.8
+        assert dedup.check({"filename": "c.pdf", "full_text": _edit(base, 0.5)}) is None
+
+    def test_identical_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("x.pdf", "y.pdf"):
+                (Path(temp_dir) / name).write_bytes(b"%PDF-1.4 same bytes")
+            dedup = Deduplicator()
+            assert dedup.check({"filename": "x.pdf", "pdf_path": str(Path(temp_dir) / "x.pdf"),
+                                "full_text": "text one"}) is None
+            # Different extracted text (e.g. other extractor version), same bytes
+            assert dedup.check({"filename": "y.pdf", "pdf_path": str(Path(temp_dir) / "y.pdf"),
+                                "full_text": "text two"}) == ("x.pdf", "identical_file", 1.0)
+
+
+class TestVerdictPropagation:
+    """Test that duplicates inherit their representative's verdict."""
+
+    def test_validate_papers_with_dedup(self):
+        pytest.importorskip("pyparsing")
+        from query_parser import parse_query
+        from validator import validate_papers
+
+        base = "forest management " + _text(1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            papers = {"a.pdf": base, "b.pdf": "ocean " + _text(2), "a_copy.pdf": base}
+            for name, text in papers.items():
+                with open(Path(temp_dir) / f"{name[:-4]}.json", "w", encoding="utf-8") as f:
+                    json.dump({"filename": name, "full_text": text}, f)
+
+            results = validate_papers(temp_dir, None, query_node=parse_query('forest'), dedup_threshold=0.8)
+            by_name = {r["filename"]: r for r in results}
+            assert by_name["a_copy.pdf"]["overall_result"] is True
+            assert by_name["b.pdf"]["overall_result"] is False
+            duplicates = [r for r in results if r.get("duplicate_of")]
+            assert len(duplicates) == 1
+            assert duplicates[0]["duplicate_of"] in ("a.pdf", "a_copy.pdf")
+
+            clusters = duplicate_clusters(results)
+            assert len(clusters) == 1
+            generate_html_report(results, None, temp_dir, query_string="forest")
+            content = (Path(temp_dir) / "validation_report.html").read_text(encoding="utf-8")
+            assert "Duplicate Papers" in content and "identical text" in content
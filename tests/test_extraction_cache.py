@@ -0,0 +1,70 @@
+"""
+Tests for extraction_cache.py and cache use in pdf_extractor.py.
+Covers content-addressed keys, version invalidation, failure caching and cache hits.
+"""
+
+import tempfile
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from extraction_cache import ExtractionCache, hash_pdf
+from pdf_extractor import extract_pdfs_to_json
+
+
+class TestExtractionCache:
+    """Test the cache store itself."""
+    
+    def test_roundtrip_and_version_invalidation(self):
+        """Entries are found by content hash and invalidated by a new version."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outcome = {'full_text': 'cached text', 'error_code': None, 'error_message': None}
+            cache = ExtractionCache(temp_dir, "v1")
+            assert cache.get("abc") is None
+            assert cache.put("abc", outcome) is True
+            assert cache.get("abc") == outcome
+            
+            assert ExtractionCache(temp_dir, "v2").get("abc") is None
+    
+    def test_only_definitive_failures_are_cached(self):
+        """Encrypted/corrupted PDFs are cached, transient failures are not."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ExtractionCache(temp_dir, "v1")
+            assert cache.put("enc", {'full_text': None, 'error_code': 'PDF_ENCRYPTED', 'error_message': 'x'})
+            assert not cache.put("unk", {'full_text': None, 'error_code': 'UNKNOWN_ERROR', 'error_message': 'x'})
+            assert cache.get("enc")['error_code'] == 'PDF_ENCRYPTED'
+            assert cache.get("unk") is None
+    
+    def test_hash_pdf_depends_on_content_only(self):
+        """Renamed copies share a hash; changed bytes do not."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            a = Path(temp_dir) / "a.pdf"
+            b = Path(temp_dir) / "renamed.pdf"
+            a.write_bytes(b"%PDF-1.4 same bytes")
+            b.write_bytes(b"%PDF-1.4 same bytes")
+            assert hash_pdf(a) == hash_pdf(b)
+            b.write_bytes(b"%PDF-1.4 other bytes")
+            assert hash_pdf(a) != hash_pdf(b)
+
+
+class TestExtractionWithCache:
+    """Test extract_pdfs_to_json with a cache directory."""
+    
+    def test_second_run_served_from_cache(self):
+        """Corrupted PDFs are not re-extracted on a second run."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            input_dir.mkdir()
+            (input_dir / "corrupt.pdf").write_text("This is not a real PDF file content", encoding='utf-8')
+            cache_dir = Path(temp_dir) / "cache"
+            
+            count, failed = extract_pdfs_to_json(str(input_dir), str(Path(temp_dir) / "out1"), cache_dir=str(cache_dir))
+            assert count == 0
+            assert failed[0]['error_code'] == 'PDF_CORRUPTED'
+            
+            with patch('pdf_extractor.extract_pages_from_pdf', side_effect=AssertionError("cache miss")):
+                count2, failed2 = extract_pdfs_to_json(str(input_dir), str(Path(temp_dir) / "out2"), cache_dir=str(cache_dir))
+            assert count2 == 0
+            assert failed2 == failed
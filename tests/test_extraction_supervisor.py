@@ -0,0 +1,93 @@
+"""
+Tests for extraction_supervisor.py and supervised extraction in pdf_extractor.py.
+Covers result ordering, timeouts, crashes, worker recycling and resource limits.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from extraction_supervisor import SupervisedPool, STATUS_OK, STATUS_TIMEOUT, STATUS_CRASHED
+from pdf_extractor import extract_pdfs_to_json, ExtractionOptions
+
+
+def _square_after_delay(x):
+    # Later items finish first to check that output order is preserved
+    time.sleep(0.05 * (3 - x % 4))
+    return x * x
+
+
+def _sleep_or_return(x):
+    if x == "hang":
+        time.sleep(60)
+    if x == "crash":
+        os._exit(3)
+    return x
+
+
+def _worker_pid(_x):
+    return os.getpid()
+
+
+class TestSupervisedPool:
+    """Test the supervised worker pool."""
+    
+    def test_results_in_input_order(self):
+        """Results come back in submission order."""
+        results = list(SupervisedPool(_square_after_delay, 3).imap(range(8)))
+        assert [item for item, _, _ in results] == list(range(8))
+        assert all(status == STATUS_OK for _, status, _ in results)
+        assert [r for _, _, r in results] == [x * x for x in range(8)]
+    
+    def test_timeout_and_crash_are_contained(self):
+        """A hung or crashing task is reported and the remaining work continues."""
+        start = time.monotonic()
+        results = list(SupervisedPool(_sleep_or_return, 2, timeout=1).imap(["a", "hang", "crash", "b"]))
+        assert time.monotonic() - start < 30
+        statuses = {item: (status, result) for item, status, result in results}
+        assert statuses["a"] == (STATUS_OK, "a")
+        assert statuses["b"] == (STATUS_OK, "b")
+        assert statuses["hang"][0] == STATUS_TIMEOUT
+        assert statuses["crash"] == (STATUS_CRASHED, 3)
+    
+    def test_workers_are_recycled(self):
+        """Each worker process handles at most max_tasks_per_worker items."""
+        results = list(SupervisedPool(_worker_pid, 1, max_tasks_per_worker=2).imap(range(6)))
+        pids = [pid for _, _, pid in results]
+        assert len(set(pids)) == 3
+    
+    def test_idle_workers_are_kept_between_calls(self):
+        """A pool reuses its worker across imap calls until closed."""
+        with SupervisedPool(_worker_pid, 1) as pool:
+            first = [pid for _, _, pid in pool.imap([0])]
+            second = [pid for _, _, pid in pool.imap([1])]
+        assert first == second
+        pool = SupervisedPool(_sleep_or_return, 1, timeout=1)
+        try:
+            assert [status for _, status, _ in pool.imap(["hang"])] == [STATUS_TIMEOUT]
+            assert list(pool.imap(["a"])) == [("a", STATUS_OK, "a")]
+        finally:
+            pool.close()
+
+
+class TestExtractionLimits:
+    """Test limits applied by extract_pdfs_to_json."""
+    
+    def test_page_limit_reported_as_resource_limit(self, make_pdf):
+        """Documents over the page ceiling fail with RESOURCE_LIMIT."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            make_pdf(input_dir / "three_pages.pdf", ["Forest management text. " * 10] * 3)
+            
+            count, failed = extract_pdfs_to_json(str(input_dir), str(Path(temp_dir) / "out"),
+                                                 options=ExtractionOptions(max_pages=2), timeout=60)
+            assert count == 0
+            assert failed[0]['error_code'] == 'RESOURCE_LIMIT'
+            
+            count, failed = extract_pdfs_to_json(str(input_dir), str(Path(temp_dir) / "out"),
+                                                 options=ExtractionOptions(max_pages=3))
+            assert count == 1 and failed == []
@@ -0,0 +1,81 @@
+"""
+Tests for front_matter.py module and the abstract extraction stage.
+Covers heading detection, XMP metadata and cache separation between stages.
+"""
+
+import json
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from front_matter import find_front_matter_end, _read_xmp
+from pdf_extractor import extract_pdfs_to_json, ExtractionOptions
+
+
+class TestHeadingDetection:
+    """Test detection of the heading that ends the front matter."""
+
+    @pytest.mark.parametrize("heading", ["Introduction", "1. Introduction", "1 INTRODUCTION",
+                                         "I. Introduction", "  2 Einleitung  "])
+    def test_headings(self, heading):
+        page = f"Title\nAbstract text here.\n{heading}\nBody text."
+        assert page[find_front_matter_end(page):].strip().startswith(heading.strip())
+
+    def test_running_text_is_not_a_heading(self):
+        page = "Abstract. The introduction of new species is discussed.\nIntroduction of pests"
+        assert find_front_matter_end(page) is None
+
+
+class TestXmpMetadata:
+    """Test reading descriptive fields from XMP packets."""
+
+    def test_dublin_core_fields(self):
+        xmp = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+          <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+            <rdf:Description xmlns:dc="http://purl.org/dc/elements/1.1/">
+              <dc:title><rdf:Alt><rdf:li xml:lang="x-default">Forest dynamics</rdf:li></rdf:Alt></dc:title>
+              <dc:subject><rdf:Bag><rdf:li>forestry</rdf:li><rdf:li>climate</rdf:li></rdf:Bag></dc:subject>
+            </rdf:Description>
+          </rdf:RDF>
+        </x:xmpmeta>"""
+        assert _read_xmp(xmp) == {"title": "Forest dynamics", "keywords": "forestry; climate"}
+        assert _read_xmp("<not xml") == {}
+
+
+class TestAbstractStage:
+    """Test front-matter-only extraction."""
+
+    def test_reads_only_front_matter(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            bodies = [
+                "A study of mountain forests\n\nAbstract\n" + "We model forest dynamics under climate change. " * 4,
+                "Keywords: forestry, climate\n\n1. Introduction\n" + "Body text about ungulates. " * 4,
+                "Methods section about ocean sampling. " * 4,
+            ]
+            make_pdf(input_dir / "paper.pdf", bodies,
+                     metadata={"title": "Mountain forest dynamics", "keywords": "silviculture"})
+
+            cache_dir = Path(temp_dir) / "cache"
+            abstract_dir = Path(temp_dir) / "abstract"
+            options = ExtractionOptions(stage="abstract", front_pages=3)
+            count, _failed = extract_pdfs_to_json(str(input_dir), str(abstract_dir), cache_dir=cache_dir,
+                                                  options=options)
+            assert count == 1
+            data = json.loads((abstract_dir / "paper.json").read_text(encoding='utf-8'))
+            assert data["extraction_stage"] == "abstract"
+            assert data["pages_read"] == 2
+            assert data["full_text"].startswith("Mountain forest dynamics. silviculture")
+            assert "Keywords: forestry" in data["full_text"]
+            assert "ungulates" not in data["full_text"] and "ocean" not in data["full_text"]
+            assert data["full_text"][data["page_offsets"][0]:].startswith("A study of mountain forests")
+
+            # A full-text run sharing the cache must not get the front matter back
+            full_dir = Path(temp_dir) / "full"
+            extract_pdfs_to_json(str(input_dir), str(full_dir), cache_dir=cache_dir)
+            data = json.loads((full_dir / "paper.json").read_text(encoding='utf-8'))
+            assert "extraction_stage" not in data
+            assert "ocean sampling" in data["full_text"]
@@ -0,0 +1,107 @@
+"""
+Tests for inventory.py module.
+Covers recursive listing, include/exclude patterns and nested input folders.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from inventory import build_inventory, iter_inventory
+from report_generator import sort_pdf_files
+
+
+def _touch(root, relative, content=b"%PDF-1.4"):
+    path = Path(root) / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+class TestInventory:
+    """Test listing of the input folder."""
+
+    def test_flat_by_default(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.pdf", "B.PDF", ".hidden.pdf", "notes.txt", "2020/c.pdf"):
+                _touch(temp_dir, name)
+            _touch(temp_dir, "a.json", b"{}")
+            inventory = build_inventory(temp_dir)
+            assert [e.relative for e in inventory.pdfs] == ["B.PDF", "a.pdf"]
+            assert inventory.pdfs[1].size == 8
+            assert inventory.json_count == 1 and not inventory.corpus
+
+    def test_recursive_with_patterns(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.pdf", "2020/scopus/a.pdf", "2020/wos/b.pdf", "2020/wos/b_supplement.pdf",
+                         "drafts/x.pdf", "2021/c.pdf", "results/sorted_pdfs/include/a.pdf"):
+                _touch(temp_dir, name)
+            entries = iter_inventory(temp_dir, recursive=True, exclude=["drafts", "*_supplement.pdf"],
+                                     skip_dirs=[Path(temp_dir) / "results"])
+            assert sorted(e.relative for e in entries) == ["2020/scopus/a.pdf", "2020/wos/b.pdf",
+                                                           "2021/c.pdf", "a.pdf"]
+            entries = iter_inventory(temp_dir, recursive=True, include=["2020/*"], exclude=["results"])
+            assert sorted(e.relative for e in entries) == ["2020/scopus/a.pdf", "2020/wos/b.pdf",
+                                                           "2020/wos/b_supplement.pdf"]
+
+
+class TestJsonListing:
+    """Test that pre-extracted JSON is selected like the PDFs."""
+
+    def test_json_follows_pdf_options(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.json", "b_supplement.json", "2020/c.json", "drafts/d.json",
+                         "out/validation_results.json", "notes.txt"):
+                _touch(temp_dir, name, b"{}")
+            out = Path(temp_dir) / "out"
+
+            def names(inventory):
+                return [p.relative_to(temp_dir).as_posix() for p in inventory.json_files]
+
+            inventory = build_inventory(temp_dir, skip_dirs=[out])
+            assert names(inventory) == ["a.json", "b_supplement.json"] and inventory.json_count == 2
+            inventory = build_inventory(temp_dir, exclude=["drafts", "*_supplement.pdf"], recursive=True,
+                                        skip_dirs=[out])
+            assert names(inventory) == ["2020/c.json", "a.json"] and inventory.json_count == 2
+            inventory = build_inventory(temp_dir, include=["2020/*"], recursive=True, skip_dirs=[out])
+            assert names(inventory) == ["2020/c.json"]
+
+    def test_pdfs_and_json_are_listed_in_one_pass(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.pdf", "a.json", "2020/b.pdf", "2020/b.json"):
+                _touch(temp_dir, name)
+            with patch("inventory.os.scandir", wraps=os.scandir) as scandir:
+                inventory = build_inventory(temp_dir, recursive=True)
+            assert scandir.call_count == 2
+            assert [e.relative for e in inventory.pdfs] == ["2020/b.pdf", "a.pdf"] and inventory.json_count == 2
+
+
+class TestNestedInput:
+    """Test that subfolder structure survives extraction and sorting."""
+
+    def test_extraction_and_sorting_keep_subfolders(self, make_pdf):
+        from pdf_extractor import extract_pdfs_to_json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            for relative in ("scopus/paper.pdf", "wos/paper.pdf"):
+                make_pdf(input_dir / relative, [f"Text of {relative}. " * 10])
+
+            output_dir = Path(temp_dir) / "json"
+            inventory = build_inventory(input_dir, recursive=True)
+            count, failed = extract_pdfs_to_json(str(input_dir), str(output_dir), inventory=inventory)
+            assert count == 2 and failed == []
+            data = json.loads((output_dir / "wos" / "paper.json").read_text(encoding="utf-8"))
+            assert data["filename"] == "wos/paper.pdf"
+            assert "wos/paper.pdf" in data["full_text"]
+
+            results = [{"filename": "scopus/paper.pdf", "overall_result": True},
+                       {"filename": "wos/paper.pdf", "overall_result": False}]
+            sort_pdf_files(results, input_dir, temp_dir)
+            assert (Path(temp_dir) / "sorted_pdfs" / "include" / "scopus" / "paper.pdf").exists()
+            assert (Path(temp_dir) / "sorted_pdfs" / "exclude" / "wos" / "paper.pdf").exists()
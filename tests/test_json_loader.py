@@ -0,0 +1,69 @@
+"""
+Tests for json_loader.py module.
+Covers ordering, error reporting, the read-ahead bound and decoder fallback.
+"""
+
+import json
+import threading
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import json_loader
+from json_loader import iter_json_files
+from pdf_extractor import load_json_content
+
+
+def _write_papers(directory, count):
+    paths = []
+    for i in range(count):
+        path = Path(directory) / f"paper{i:03d}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"filename": f"paper{i:03d}.pdf", "full_text": f"Text {i} über Wälder"}, f)
+        paths.append(path)
+    return paths
+
+
+class TestPrefetch:
+    """Test threaded prefetching."""
+
+    @pytest.mark.parametrize("threads", [1, 4])
+    def test_order_and_errors(self, threads):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_papers(temp_dir, 30)
+            paths[7].write_text("{broken", encoding="utf-8")
+            loaded = list(iter_json_files(paths, threads=threads, read_ahead=5))
+            assert [path for path, _data, _error in loaded] == paths
+            assert loaded[7][1] is None and isinstance(loaded[7][2], ValueError)
+            assert loaded[8][1]["full_text"] == "Text 8 über Wälder"
+
+    def test_read_ahead_is_bounded(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_papers(temp_dir, 40)
+            lock = threading.Lock()
+            read = []
+            original = json_loader._read_file
+
+            def counting_read(path):
+                with lock:
+                    read.append(path)
+                return original(path)
+
+            monkeypatch.setattr(json_loader, "_read_file", counting_read)
+            papers = iter_json_files(paths, threads=4, read_ahead=6)
+            for consumed, _item in enumerate(papers, 1):
+                if consumed == 10:
+                    break
+            papers.close()
+            # Consumed files plus at most read_ahead prefetched ones
+            assert len(read) <= 10 + 6
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(json_loader, "ORJSON_AVAILABLE", False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write_papers(temp_dir, 3)
+            papers = load_json_content(temp_dir)
+            assert [p["filename"] for p in papers] == ["paper000.pdf", "paper001.pdf", "paper002.pdf"]
@@ -0,0 +1,97 @@
+"""
+Tests for packed_corpus.py module.
+Covers round trips, lazy views, lookups and use by the validator.
+"""
+
+import json
+import re
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import json_loader
+from packed_corpus import PackedCorpus, has_pack, pack_directory, write_pack, pack_path
+from pdf_extractor import extract_pdfs_to_json
+from text_normalizer import NORMALIZATION_VERSION, fold_text
+
+
+def _paper(name, text):
+    folded, fold_offsets = fold_text(text)
+    return {"filename": name, "full_text": text, "page_offsets": [0],
+            "normalization_version": NORMALIZATION_VERSION,
+            "folded_text": folded, "fold_offsets": fold_offsets}
+
+
+PAPERS = [
+    _paper("a.pdf", "Waldbewirtschaftung im Gebirge. Forest management."),
+    {"filename": "2020/b.pdf", "full_text": "Ocean sampling (legacy record without folded text)."},
+    _paper("c.pdf", ""),
+]
+
+
+class TestPack:
+    """Test packing and reading back."""
+
+    @pytest.mark.parametrize("orjson", [True, False])
+    def test_round_trip(self, monkeypatch, orjson):
+        monkeypatch.setattr(json_loader, "ORJSON_AVAILABLE", orjson and json_loader.ORJSON_AVAILABLE)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert write_pack(iter(PAPERS), temp_dir) == 3
+            with PackedCorpus(temp_dir) as corpus:
+                assert len(corpus) == 3
+                assert [dict(doc) for doc in corpus] == PAPERS
+                assert corpus.filenames() == ["a.pdf", "2020/b.pdf", "c.pdf"]
+                doc = corpus.get("2020/b.pdf")
+                assert "folded_text" not in doc and doc.get("folded_text") is None
+                assert doc["full_text"].startswith("Ocean")
+                assert corpus.get("missing.pdf") is None
+
+    def test_zero_copy_bytes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pack(PAPERS, temp_dir)
+            with PackedCorpus(temp_dir) as corpus:
+                doc = corpus[0]
+                text_bytes = doc.text_bytes
+                assert isinstance(text_bytes, memoryview)
+                assert re.search(rb"Forest", text_bytes) is not None
+                assert bytes(doc.folded_bytes) == PAPERS[0]["folded_text"].encode("utf-8")
+                del text_bytes
+
+    def test_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pack_path(temp_dir).write_bytes(b"not a pack" * 10)
+            with pytest.raises(ValueError):
+                PackedCorpus(temp_dir)
+
+
+class TestPackedScreening:
+    """Test that screening a pack matches screening the JSON files."""
+
+    def test_validate_papers_uses_pack(self):
+        pytest.importorskip("pyparsing")
+        from query_parser import parse_query
+        from validator import validate_papers
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for paper in PAPERS:
+                path = Path(temp_dir) / Path(paper["filename"]).with_suffix(".json")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(paper), encoding="utf-8")
+            query = parse_query("wald* OR ocean")
+            # One paper is in a subfolder, as extracted from a recursive input folder
+            recursive = {"recursive": True}
+            from_json = validate_papers(temp_dir, None, query_node=query, json_options=recursive)
+            assert len(from_json) == 3
+
+            assert pack_directory(temp_dir) == 2
+            assert pack_directory(temp_dir, recursive=True) == 3
+            assert validate_papers(temp_dir, None, query_node=query) == from_json
+            assert validate_papers(temp_dir, None, query_node=query, corpus_format="json",
+                                   json_options=recursive) == from_json
+
+            # New extraction results make the pack stale: it is removed
+            extract_pdfs_to_json(str(Path(temp_dir) / "no_pdfs_here"), temp_dir)
+            assert not has_pack(temp_dir)
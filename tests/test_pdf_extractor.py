@@ -1,144 +1,258 @@
-"""
-Tests for pdf_extractor.py module.
-Covers capability reporting, empty directories, and corrupt files.
-"""
-
-import pytest
-import tempfile
-import shutil
-import os
-from pathlib import Path
-import sys
-from unittest.mock import patch
-
-# Add scripts to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-from pdf_extractor import (
-    extract_pdfs_to_json, 
-    check_pdf_extraction_capabilities,
-    load_json_content,
-    get_paper_filename
-)
-
-
-class TestCapabilityReporting:
-    """Test PDF extraction capability reporting."""
-    
-    def test_capability_reporting_with_libraries(self):
-        """Test capability string when libraries are available."""
-        capabilities = check_pdf_extraction_capabilities()
-        # Should contain at least one of the libraries
-        assert "PyMuPDF" in capabilities or "pdfplumber" in capabilities
-    
-    @patch('pdf_extractor.PYMUPDF_AVAILABLE', False)
-    @patch('pdf_extractor.PDFPLUMBER_AVAILABLE', False)
-    def test_capability_reporting_no_libraries(self):
-        """Test capability string when no libraries are available."""
-        capabilities = check_pdf_extraction_capabilities()
-        assert "No PDF extraction libraries available" in capabilities
-
-
-class TestPDFExtraction:
-    """Test PDF extraction functionality."""
-    
-    def test_extract_no_pdfs_returns_zero(self):
-        """Test that empty PDF directory returns 0 and prints warning."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            input_dir = Path(temp_dir) / "input"
-            output_dir = Path(temp_dir) / "output" 
-            input_dir.mkdir()
-            output_dir.mkdir()
-            
-            # No PDF files in input directory
-            result = extract_pdfs_to_json(str(input_dir), str(output_dir))
-            # Now returns (count, failed_list) tuple
-            assert result[0] == 0
-    
-    def test_extract_corrupt_pdf_handled_gracefully(self):
-        """Test that corrupt PDF files are handled without crashing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            input_dir = Path(temp_dir) / "input"
-            output_dir = Path(temp_dir) / "output"
-            input_dir.mkdir()
-            output_dir.mkdir()
-            
-            # Create a fake "PDF" that's actually just text
-            fake_pdf = input_dir / "corrupt.pdf"
-            fake_pdf.write_text("This is not a real PDF file content", encoding='utf-8')
-            
-            # Should handle gracefully without crashing
-            result = extract_pdfs_to_json(str(input_dir), str(output_dir))
-            
-            # Result should be (0, [failed_list]) since extraction failed
-            assert result[0] == 0
-            # Should have one failed PDF in the list
-            assert len(result[1]) == 1
-            assert result[1][0]['filename'] == 'corrupt.pdf'
-            assert 'PDF_CORRUPTED' in result[1][0]['error_code']
-            
-            # No JSON should be created for the corrupt file
-            json_files = list(output_dir.glob("*.json"))
-            assert len(json_files) == 0
-
-
-class TestJSONHandling:
-    """Test JSON loading and filename conversion."""
-    
-    def test_load_json_content(self):
-        """Test loading JSON files from directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_dir = Path(temp_dir)
-            
-            # Create sample JSON files
-            json1 = {
-                "filename": "paper1.pdf",
-                "full_text": "Sample text content for paper 1",
-                "text_length": 30
-            }
-            json2 = {
-                "filename": "paper2.pdf", 
-                "full_text": "Sample text content for paper 2",
-                "text_length": 30
-            }
-            
-            (json_dir / "paper1.json").write_text(
-                json.dumps(json1, indent=2), encoding='utf-8'
-            )
-            (json_dir / "paper2.json").write_text(
-                json.dumps(json2, indent=2), encoding='utf-8'
-            )
-            
-            papers = load_json_content(str(json_dir))
-            assert len(papers) == 2
-            assert all("full_text" in paper for paper in papers)
-    
-    def test_get_paper_filename_conversion(self):
-        """Test conversion from JSON filename to PDF filename."""
-        assert get_paper_filename("paper1.json") == "paper1.pdf"
-        assert get_paper_filename("paper.pdf") == "paper.pdf"  # Already PDF
-        assert get_paper_filename("no_extension") == "no_extension"
-    
-    def test_load_json_handles_corrupt_files(self):
-        """Test that corrupt JSON files are handled gracefully."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_dir = Path(temp_dir)
-            
-            # Create a valid JSON
-            valid_json = {"filename": "valid.pdf", "full_text": "Valid content"}
-            (json_dir / "valid.json").write_text(
-                json.dumps(valid_json), encoding='utf-8'
-            )
-            
-            # Create corrupt JSON
-            (json_dir / "corrupt.json").write_text(
-                "{ invalid json content", encoding='utf-8'
-            )
-            
-            papers = load_json_content(str(json_dir))
-            # Should load only the valid JSON
-            assert len(papers) == 1
-            assert papers[0]["filename"] == "valid.pdf"
-
-
-# Need to import json for the tests
+"""
+Tests for pdf_extractor.py module.
+Covers capability reporting, empty directories, and corrupt files.
+"""
+
+import pytest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from text_normalizer import NORMALIZATION_VERSION
+from pdf_extractor import (
+    extract_pdfs_to_json, 
+    check_pdf_extraction_capabilities,
+    load_json_content,
+    get_paper_filename,
+    join_cleaned_pages,
+    page_for_offset,
+    get_page_text
+)
+
+
+class TestCapabilityReporting:
+    """Test PDF extraction capability reporting."""
+    
+    def test_capability_reporting_with_libraries(self):
+        """Test capability string when libraries are available."""
+        capabilities = check_pdf_extraction_capabilities()
+        # Should contain at least one of the libraries
+        assert "PyMuPDF" in capabilities or "pdfplumber" in capabilities
+    
+    @patch('pdf_extractor.PYMUPDF_AVAILABLE', False)
+    @patch('pdf_extractor.PDFPLUMBER_AVAILABLE', False)
+    def test_capability_reporting_no_libraries(self):
+        """Test capability string when no libraries are available."""
+        capabilities = check_pdf_extraction_capabilities()
+        assert "No PDF extraction libraries available" in capabilities
+
+
+class TestPDFExtraction:
+    """Test PDF extraction functionality."""
+    
+    def test_extract_no_pdfs_returns_zero(self):
+        """Test that empty PDF directory returns 0 and prints warning."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output" 
+            input_dir.mkdir()
+            output_dir.mkdir()
+            
+            # No PDF files in input directory
+            result = extract_pdfs_to_json(str(input_dir), str(output_dir))
+            # Now returns (count, failed_list) tuple
+            assert result[0] == 0
+    
+    def test_extract_corrupt_pdf_handled_gracefully(self):
+        """Test that corrupt PDF files are handled without crashing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+            output_dir.mkdir()
+            
+            # Create a fake "PDF" that's actually just text
+            fake_pdf = input_dir / "corrupt.pdf"
+            fake_pdf.write_text("This is not a real PDF file content", encoding='utf-8')
+            
+            # Should handle gracefully without crashing
+            result = extract_pdfs_to_json(str(input_dir), str(output_dir))
+            
+            # Result should be (0, [failed_list]) since extraction failed
+            assert result[0] == 0
+            # Should have one failed PDF in the list
+            assert len(result[1]) == 1
+            assert result[1][0]['filename'] == 'corrupt.pdf'
+            assert 'PDF_CORRUPTED' in result[1][0]['error_code']
+            
+            # No JSON should be created for the corrupt file
+            json_files = list(output_dir.glob("*.json"))
+            assert len(json_files) == 0
+
+
+class TestParallelExtraction:
+    """Test process-pool extraction."""
+    
+    def test_parallel_matches_sequential(self, make_pdf):
+        """Parallel extraction returns the same, deterministically ordered results."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            input_dir.mkdir()
+            for i in range(4):
+                make_pdf(input_dir / f"paper{i}.pdf",
+                         [f"Paper {i} discusses forest management and ecosystem services. " * 5])
+            (input_dir / "broken_a.pdf").write_text("not a pdf", encoding='utf-8')
+            (input_dir / "broken_b.pdf").write_text("not a pdf either", encoding='utf-8')
+            
+            seq_dir = Path(temp_dir) / "seq"
+            par_dir = Path(temp_dir) / "par"
+            seq_count, seq_failed = extract_pdfs_to_json(str(input_dir), str(seq_dir))
+            par_count, par_failed = extract_pdfs_to_json(str(input_dir), str(par_dir), workers=3)
+            
+            assert seq_count == par_count == 4
+            assert par_failed == seq_failed
+            assert [f['filename'] for f in par_failed] == ['broken_a.pdf', 'broken_b.pdf']
+            for json_path in seq_dir.glob("*.json"):
+                assert json.loads(json_path.read_text(encoding='utf-8')) == \
+                    json.loads((par_dir / json_path.name).read_text(encoding='utf-8'))
+
+
+class TestEarlyStop:
+    """Test page-streaming extraction with early query termination."""
+    
+    def test_early_stop_reads_only_needed_pages(self, make_pdf):
+        """Reading stops on the page where the query verdict is decided."""
+        pytest.importorskip("pyparsing")
+        from query_parser import parse_query
+        from pdf_extractor import ExtractionOptions
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            make_pdf(input_dir / "long.pdf",
+                     [f"Page {i} discusses forest management and planning in detail. " * 3 for i in range(10)])
+            
+            options = ExtractionOptions(stop_query=parse_query('forest AND management'))
+            count, failed = extract_pdfs_to_json(str(input_dir), str(output_dir), options=options)
+            assert count == 1 and failed == []
+            data = json.loads((output_dir / "long.json").read_text(encoding='utf-8'))
+            assert data["extraction_complete"] is False
+            assert data["pages_read"] == 1
+            
+            # A query that can only be decided at the end reads everything
+            options = ExtractionOptions(stop_query=parse_query('forest AND ocean'))
+            extract_pdfs_to_json(str(input_dir), str(output_dir), options=options)
+            data = json.loads((output_dir / "long.json").read_text(encoding='utf-8'))
+            assert "extraction_complete" not in data
+            # Folded shadow copy for case-insensitive matching
+            assert data["folded_text"] == data["full_text"].lower()
+            assert data["normalization_version"] == NORMALIZATION_VERSION
+
+
+class TestPageFallback:
+    """Test per-page pdfplumber fallback for empty or garbled PyMuPDF pages."""
+    
+    def test_only_bad_pages_are_reextracted(self, make_pdf):
+        """Problem pages come from pdfplumber, the rest stays on PyMuPDF."""
+        pytest.importorskip("pdfplumber")
+        import pdf_extractor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            make_pdf(input_dir / "mixed.pdf", [f"Page {i} covers forest planning. " * 3 for i in range(3)])
+            
+            real_iter = pdf_extractor.iter_pages_with_pymupdf
+            # Page 2 has no text layer, page 3 has a broken font encoding
+            damage = {1: "", 2: "\ufffd\x03" * 20}
+            def damaged_pages(pdf_path):
+                for i, text in enumerate(real_iter(pdf_path)):
+                    yield damage.get(i, text)
+            
+            with patch('pdf_extractor.iter_pages_with_pymupdf', damaged_pages):
+                count, failed = extract_pdfs_to_json(str(input_dir), str(output_dir))
+            
+            assert count == 1 and failed == []
+            data = json.loads((output_dir / "mixed.json").read_text(encoding='utf-8'))
+            assert data["page_engines"] == ["PyMuPDF", "pdfplumber", "pdfplumber"]
+            assert data["extraction_method"] == "PyMuPDF+pdfplumber"
+            assert "Page 1 covers" in data["full_text"] and "Page 2 covers" in data["full_text"]
+
+
+class TestPageIndex:
+    """Test the per-page offset index stored with extracted text."""
+    
+    def test_offsets_map_back_to_pages(self):
+        """Offsets locate each page in full_text, including empty pages."""
+        text, offsets = join_cleaned_pages(["First  page\n text 1\n", "", "Second page\n", "Third"])
+        assert text == "First page text Second page Third"
+        assert len(offsets) == 4
+        assert page_for_offset(offsets, text.index("text")) == 1
+        assert page_for_offset(offsets, text.index("Second")) == 3
+        assert page_for_offset(offsets, text.index("Third")) == 4
+        
+        paper = {"full_text": text, "page_offsets": offsets}
+        assert get_page_text(paper, 1) == "First page text"
+        assert get_page_text(paper, 2) == ""
+        assert get_page_text(paper, 3) == "Second page"
+        assert get_page_text(paper, 4) == "Third"
+        assert get_page_text(paper, 5) is None
+        assert get_page_text({"full_text": text}, 1) is None
+
+
+class TestJSONHandling:
+    """Test JSON loading and filename conversion."""
+    
+    def test_load_json_content(self):
+        """Test loading JSON files from directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_dir = Path(temp_dir)
+            
+            # Create sample JSON files
+            json1 = {
+                "filename": "paper1.pdf",
+                "full_text": "Sample text content for paper 1",
+                "text_length": 30
+            }
+            json2 = {
+                "filename": "paper2.pdf", 
+                "full_text": "Sample text content for paper 2",
+                "text_length": 30
+            }
+            
+            (json_dir / "paper1.json").write_text(
+                json.dumps(json1, indent=2), encoding='utf-8'
+            )
+            (json_dir / "paper2.json").write_text(
+                json.dumps(json2, indent=2), encoding='utf-8'
+            )
+            
+            papers = load_json_content(str(json_dir))
+            assert len(papers) == 2
+            assert all("full_text" in paper for paper in papers)
+    
+    def test_get_paper_filename_conversion(self):
+        """Test conversion from JSON filename to PDF filename."""
+        assert get_paper_filename("paper1.json") == "paper1.pdf"
+        assert get_paper_filename("paper.pdf") == "paper.pdf"  # Already PDF
+        assert get_paper_filename("no_extension") == "no_extension"
+    
+    def test_load_json_handles_corrupt_files(self):
+        """Test that corrupt JSON files are handled gracefully."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_dir = Path(temp_dir)
+            
+            # Create a valid JSON
+            valid_json = {"filename": "valid.pdf", "full_text": "Valid content"}
+            (json_dir / "valid.json").write_text(
+                json.dumps(valid_json), encoding='utf-8'
+            )
+            
+            # Create corrupt JSON
+            (json_dir / "corrupt.json").write_text(
+                "{ invalid json content", encoding='utf-8'
+            )
+            
+            papers = load_json_content(str(json_dir))
+            # Should load only the valid JSON
+            assert len(papers) == 1
+            assert papers[0]["filename"] == "valid.pdf"
+
+
+# Need to import json for the tests
 import json
\ No newline at end of file
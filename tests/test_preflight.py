@@ -0,0 +1,80 @@
+"""
+Tests for preflight.py module.
+Covers triage of corrupt, encrypted, oversized and image-only PDFs.
+"""
+
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from preflight import preflight_pdf
+from pdf_extractor import extract_pdfs_to_json
+
+fitz = pytest.importorskip("fitz")
+
+
+class TestTriage:
+    """Test the classification of single files."""
+
+    def test_text_pdf_passes(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf = Path(temp_dir) / "text.pdf"
+            make_pdf(pdf, ["Forest management and ecosystem services. " * 5] * 5)
+            assert preflight_pdf(pdf) == (None, "")
+
+    def test_missing_header_is_corrupt(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf = Path(temp_dir) / "fake.pdf"
+            pdf.write_text("This is not a real PDF file content", encoding='utf-8')
+            assert preflight_pdf(pdf)[0] == 'PDF_CORRUPTED'
+
+    def test_encrypted_pdf(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf = Path(temp_dir) / "locked.pdf"
+            make_pdf(pdf, ["Secret forest data " * 5], encryption=fitz.PDF_ENCRYPT_AES_256,
+                     user_pw="user", owner_pw="owner")
+            assert preflight_pdf(pdf)[0] == 'PDF_ENCRYPTED'
+
+    def test_scanned_pdf_has_no_text(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf = Path(temp_dir) / "scan.pdf"
+            make_pdf(pdf, [None] * 6, image=True)
+            assert preflight_pdf(pdf)[0] == 'NO_TEXT_CONTENT'
+
+            # A blank page is not evidence of a scan
+            blank = Path(temp_dir) / "blank.pdf"
+            make_pdf(blank, [None] * 6)
+            assert preflight_pdf(blank) == (None, "")
+
+    def test_page_limit(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf = Path(temp_dir) / "long.pdf"
+            make_pdf(pdf, ["Page text about forests " * 3] * 12)
+            assert preflight_pdf(pdf, max_pages=10)[0] == 'RESOURCE_LIMIT'
+            assert preflight_pdf(pdf, max_pages=20) == (None, "")
+
+
+class TestPipelineIntegration:
+    """Test that triaged files skip full extraction."""
+
+    def test_triaged_files_never_reach_extraction(self, make_pdf):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+            make_pdf(input_dir / "scan.pdf", [None] * 4, image=True)
+            (input_dir / "fake.pdf").write_text("not a pdf", encoding='utf-8')
+
+            with patch('pdf_extractor.extract_pages_from_pdf') as extract:
+                count, failed = extract_pdfs_to_json(str(input_dir), str(output_dir))
+
+            assert count == 0
+            extract.assert_not_called()
+            assert [(f['filename'], f['error_code'], f['stage']) for f in failed] == [
+                ('fake.pdf', 'PDF_CORRUPTED', 'preflight'),
+                ('scan.pdf', 'NO_TEXT_CONTENT', 'preflight')
+            ]
@@ -0,0 +1,95 @@
+"""
+Tests for query_batch.py module.
+Covers the queries file format, differential tests against validate_papers
+for each query of a batch, and the paper x query matrix.
+"""
+
+import csv
+import json
+import random
+import tempfile
+from pathlib import Path
+import sys
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from query_batch import load_query_batch, save_query_matrix, validate_papers_batch
+
+pytest.importorskip("pyparsing")
+from query_parser import parse_query
+from validator import evaluate_ast, evaluate_queries, validate_papers
+
+VOCABULARY = ["forest", "forests", "Wälder", "management", "ecosystem", "services", "climate", "change",
+              "x-ray", "study", "studies"]
+QUERIES = ["forest*", "forest* AND NOT walder", '"ecosystem service*" OR x-ray', "(climate AND change) OR study",
+           "NOT (forest OR studies)", "missing"]
+
+
+def _write_queries(directory, text):
+    path = Path(directory) / "queries.txt"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestQueriesFile:
+    """Test reading queries files."""
+
+    def test_sections_comments_and_multiline_queries(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = _write_queries(temp_dir, "# Variants\n\n[core]\nforest* AND\n  management\n"
+                                            "# between\n[broad-2.v1]\nforest* OR tree*\n")
+            assert load_query_batch(path) == [("core", "forest* AND management"),
+                                              ("broad-2.v1", "forest* OR tree*")]
+
+    @pytest.mark.parametrize("text, message", [
+        ("forest*\n[core]\nwald\n", "before the first"),
+        ("[core]\nforest\n[core]\nwald\n", "defined twice"),
+        ("[my query]\nforest\n", "invalid query name"),
+        ("[core]\n[broad]\nforest\n", "[core] is empty"),
+        ("# nothing\n", "no queries"),
+    ])
+    def test_invalid_files(self, text, message):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError, match=message.replace("[", r"\[").replace("]", r"\]")):
+                load_query_batch(_write_queries(temp_dir, text))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_evaluate_queries_matches_evaluate_ast(seed):
+    rng = random.Random(seed)
+    text = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 25)))
+    nodes = [parse_query(q) for q in QUERIES]
+    assert evaluate_queries(nodes, text) == [evaluate_ast(node, text) for node in nodes]
+    assert evaluate_queries(nodes, text, evidence=False) == [evaluate_ast(node, text, evidence=False)
+                                                             for node in nodes]
+
+
+@pytest.mark.parametrize("dedup_threshold", [None, 0.8])
+def test_batch_matches_separate_runs(dedup_threshold):
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus_dir = Path(temp_dir) / "corpus"
+        corpus_dir.mkdir()
+        texts = [" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 30))) for _ in range(25)]
+        # A duplicate and a paper without text
+        texts += [texts[3], ""]
+        for i, text in enumerate(texts):
+            (corpus_dir / f"paper{i:02d}.json").write_text(
+                json.dumps({"filename": f"paper{i:02d}.pdf", "full_text": text}), encoding="utf-8")
+        config = Path(temp_dir) / "config.json"
+        config.write_text(json.dumps({"text_processing": {"case_sensitive": False}}), encoding="utf-8")
+
+        nodes = [parse_query(q) for q in QUERIES]
+        by_query = validate_papers_batch(corpus_dir, nodes, config, dedup_threshold=dedup_threshold)
+        assert by_query == [validate_papers(corpus_dir, None, config, query_node=node,
+                                            dedup_threshold=dedup_threshold) for node in nodes]
+
+        matrix = Path(temp_dir) / "query_matrix.csv"
+        save_query_matrix([f"q{i}" for i in range(len(nodes))], by_query, matrix)
+        with open(matrix, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["filename"] + [f"q{i}" for i in range(len(nodes))]
+        assert len(rows) == len(texts) + 1
+        for row, results in zip(rows[1:], zip(*by_query)):
+            assert row == [results[0]["filename"]] + [str(int(r["overall_result"])) for r in results]
@@ -1,63 +1,162 @@
-"""
-Tests for AST-based evaluation in validator.py using the query parser.
-Skips cleanly if pyparsing (parser dependency) is not installed.
-"""
-
-import sys
-from pathlib import Path
-import pytest
-
-try:
-    import pyparsing  # noqa: F401
-except Exception:  # pragma: no cover - environment without deps
-    pytest.skip("pyparsing not installed; skipping query-evaluator tests", allow_module_level=True)
-
-# Add scripts dir to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
-from query_parser import parse_query  # type: ignore
-from validator import evaluate_ast, validate_single_paper_query  # type: ignore
-
-
-def test_evaluate_ast_and_or_not():
-    text = "This paper covers forest management and planning, with ecosystem services."
-    node = parse_query('forest AND management')
-    verdict, evidence = evaluate_ast(node, text)
-    assert verdict is True
-    assert evidence and any('forest' in e['snippet'].lower() for e in evidence)
-
-    node2 = parse_query('forest OR ocean')
-    v2, _ = evaluate_ast(node2, text)
-    assert v2 is True
-
-    node3 = parse_query('forest AND NOT urban')
-    v3, _ = evaluate_ast(node3, text)
-    assert v3 is True
-
-    node4 = parse_query('forest AND NOT planning')
-    v4, _ = evaluate_ast(node4, text)
-    assert v4 is False
-
-
-def test_evaluate_ast_phrase_and_wildcard():
-    text = "The study covers ecosystem services and forested landscapes in detail."
-    node = parse_query('"ecosystem service*" AND forest*')
-    verdict, evidence = evaluate_ast(node, text)
-    assert verdict is True
-    # Evidence may be limited; ensure structure
-    assert isinstance(evidence, list)
-
-
-def test_validate_single_paper_query_structure():
-    paper = {
-        "filename": "sample.pdf",
-        "full_text": "Decision support systems for forest management and optimization of ecosystem services."
-    }
-    cfg = {"text_processing": {"case_sensitive": False}}
-    node = parse_query('decision AND forest AND optimization')
-    res = validate_single_paper_query(paper, node, cfg)
-    assert res["filename"].endswith("sample.pdf")
-    assert res["overall_result"] is True
-    assert "block_results" in res and isinstance(res["block_results"], list)
-    assert res["total_blocks"] == 1
-    assert res["blocks_passed"] in (0, 1)
+"""
+Tests for AST-based evaluation in validator.py using the query parser.
+Skips cleanly if pyparsing (parser dependency) is not installed.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+try:
+    import pyparsing  # noqa: F401
+except Exception:  # pragma: no cover - environment without deps
+    pytest.skip("pyparsing not installed; skipping query-evaluator tests", allow_module_level=True)
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from query_parser import parse_query  # type: ignore
+from validator import evaluate_ast, validate_single_paper_query  # type: ignore
+
+
+def test_evaluate_ast_and_or_not():
+    text = "This paper covers forest management and planning, with ecosystem services."
+    node = parse_query('forest AND management')
+    verdict, evidence = evaluate_ast(node, text)
+    assert verdict is True
+    assert evidence and any('forest' in e['snippet'].lower() for e in evidence)
+
+    node2 = parse_query('forest OR ocean')
+    v2, _ = evaluate_ast(node2, text)
+    assert v2 is True
+
+    node3 = parse_query('forest AND NOT urban')
+    v3, _ = evaluate_ast(node3, text)
+    assert v3 is True
+
+    node4 = parse_query('forest AND NOT planning')
+    v4, _ = evaluate_ast(node4, text)
+    assert v4 is False
+
+
+def test_evaluate_ast_phrase_and_wildcard():
+    text = "The study covers ecosystem services and forested landscapes in detail."
+    node = parse_query('"ecosystem service*" AND forest*')
+    verdict, evidence = evaluate_ast(node, text)
+    assert verdict is True
+    # Evidence may be limited; ensure structure
+    assert isinstance(evidence, list)
+
+
+def test_validate_single_paper_query_structure():
+    paper = {
+        "filename": "sample.pdf",
+        "full_text": "Decision support systems for forest management and optimization of ecosystem services."
+    }
+    cfg = {"text_processing": {"case_sensitive": False}}
+    node = parse_query('decision AND forest AND optimization')
+    res = validate_single_paper_query(paper, node, cfg)
+    assert res["filename"].endswith("sample.pdf")
+    assert res["overall_result"] is True
+    assert "block_results" in res and isinstance(res["block_results"], list)
+    assert res["total_blocks"] == 1
+    assert res["blocks_passed"] in (0, 1)
+
+
+def test_incremental_evaluator_decides_early():
+    from validator import IncrementalEvaluator  # type: ignore
+    ev = IncrementalEvaluator(parse_query('forest AND management'))
+    assert ev.feed("Page one is about forest ecology.") is False
+    assert ev.verdict is None
+    assert ev.feed("Page two covers management plans.") is True
+    assert ev.verdict is True
+
+
+def test_incremental_evaluator_not_and_page_breaks():
+    from validator import IncrementalEvaluator  # type: ignore
+    # NOT can only be decided once the negated term is seen
+    ev = IncrementalEvaluator(parse_query('forest AND NOT urban'))
+    assert ev.feed("forest management") is False
+    assert ev.feed("an urban setting") is True
+    assert ev.verdict is False
+
+    # Phrases split across two chunks still match
+    ev2 = IncrementalEvaluator(parse_query('"ecosystem services"'))
+    assert ev2.feed("This study of " + "x " * 300 + "ecosystem") is False
+    assert ev2.feed("services in forests") is True
+    assert ev2.verdict is True
+
+
+def test_evidence_carries_page_numbers():
+    paper = {
+        "filename": "paged.pdf",
+        "full_text": "Intro text here. Results on forest management.",
+        "page_offsets": [0, 17],
+    }
+    cfg = {"text_processing": {"case_sensitive": False}}
+    res = validate_single_paper_query(paper, parse_query('intro AND forest'), cfg)
+    assert res["overall_result"] is True
+    assert res["block_results"][0]["sample_pages"] == [1, 2]
+
+
+def test_accent_insensitive_matching_reports_original_spans():
+    text = "Die Schutzwälder nach Lüscher et al. schützen vor Steinschlag."
+    verdict, evidence = evaluate_ast(parse_query('Luscher AND schutzwald*'), text)
+    assert verdict is True
+    for e in evidence:
+        start, end = e["span"]
+        assert text[start:end] in ("Lüscher", "Schutzwälder")
+    # Case-sensitive mode keeps exact matching
+    v2, _ = evaluate_ast(parse_query('Luscher'), text, case_sensitive=True)
+    assert v2 is False
+
+
+def test_precomputed_folded_text_matches_stale_json():
+    from text_normalizer import NORMALIZATION_VERSION, fold_text  # type: ignore
+    full_text = "Waldbau in der Schweiz. Ökosystemleistungen und Straßen."
+    folded_text, fold_offsets = fold_text(full_text)
+    current = {
+        "filename": "current.pdf",
+        "full_text": full_text,
+        "normalization_version": NORMALIZATION_VERSION,
+        "folded_text": folded_text,
+        "fold_offsets": fold_offsets,
+    }
+    stale = {"filename": "stale.pdf", "full_text": full_text, "normalization_version": "0",
+             "folded_text": "bogus", "fold_offsets": [[0, 0]]}
+    cfg = {"text_processing": {"case_sensitive": False}}
+    node = parse_query('okosystem* AND strassen')
+    res_current = validate_single_paper_query(current, node, cfg)
+    res_stale = validate_single_paper_query(stale, node, cfg)
+    assert res_current["overall_result"] is True
+    assert res_current["block_results"] == res_stale["block_results"]
+
+
+def test_snippets_only_for_included_papers(monkeypatch):
+    import validator  # type: ignore
+    calls = []
+    original = validator._evidence_from_spans
+
+    def recording(spans, text, term, **kwargs):
+        calls.append(term)
+        return original(spans, text, term, **kwargs)
+
+    monkeypatch.setattr(validator, "_evidence_from_spans", recording)
+    text = "Forest management in the Alps, forest planning and wood."
+    assert evaluate_ast(parse_query('forest AND management AND ocean'), text) == (False, [])
+    assert calls == []
+
+    # Evidence of an OR comes from its first true child only
+    verdict, evidence = evaluate_ast(parse_query('(ocean OR forest OR wood) AND alps'), text)
+    assert verdict is True and calls == ["forest", "alps"]
+    assert [e["term"] for e in evidence] == ["forest", "forest", "alps"]
+
+
+def test_verdict_only_evaluation():
+    text = "Forest management in the Alps, forest planning and wood."
+    for query in ['forest AND management', 'forest AND NOT wood', '"forest planning" OR ocean', 'NOT alps*']:
+        node = parse_query(query)
+        assert evaluate_ast(node, text, evidence=False) == (evaluate_ast(node, text)[0], [])
+    paper = {"filename": "sample.pdf", "full_text": text}
+    res = validate_single_paper_query(paper, parse_query('forest*'), {}, evidence=False)
+    assert res["overall_result"] is True and res["block_results"][0]["sample_matches"] == []
@@ -1,136 +1,228 @@
-"""
-Tests for scripts/query_parser.py
-Validates Boolean grammar (AND/OR/NOT, precedence, parentheses),
-quoted phrases, and wildcard handling.
-"""
-
-import sys
-from pathlib import Path
-import pytest
-
-# Add scripts dir to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
-from query_parser import parse_query, pretty_print, TermNode, AndNode, OrNode, NotNode, QuerySyntaxError  # type: ignore
-
-
-class TestQueryParser:
-    def test_simple_and(self):
-        node = parse_query("A AND B")
-        assert isinstance(node, AndNode)
-        assert all(isinstance(c, TermNode) for c in node.children)
-
-    def test_simple_or(self):
-        node = parse_query("A OR B")
-        assert isinstance(node, OrNode)
-        assert all(isinstance(c, TermNode) for c in node.children)
-
-    def test_simple_not(self):
-        node = parse_query("NOT A")
-        assert isinstance(node, NotNode)
-        assert isinstance(node.child, TermNode)
-
-    def test_nested_expression(self):
-        node = parse_query("A AND (B OR C)")
-        assert isinstance(node, AndNode)
-        assert isinstance(node.children[1], OrNode)
-
-    def test_operator_precedence(self):
-        n1 = parse_query("NOT A OR B")
-        # Should be (NOT A) OR B
-        assert isinstance(n1, OrNode)
-        assert isinstance(n1.children[0], NotNode)
-
-        n2 = parse_query("A AND B OR C")
-        # Should be (A AND B) OR C
-        assert isinstance(n2, OrNode)
-        assert isinstance(n2.children[0], AndNode)
-
-    def test_phrase(self):
-        node = parse_query('"hello world"')
-        assert isinstance(node, TermNode)
-        assert node.is_phrase is True
-        assert "hello\\s+world" in node.pattern
-
-    def test_wildcard(self):
-        node = parse_query('forest*')
-        assert isinstance(node, TermNode)
-        assert node.is_phrase is False
-        assert node.pattern.endswith(r"\w*")
-
-    def test_phrase_with_wildcard(self):
-        node = parse_query('"ecosystem service*"')
-        assert isinstance(node, TermNode)
-        assert node.is_phrase is True
-        assert node.pattern.endswith(r"\w*")
-
-    def test_empty_query_raises(self):
-        with pytest.raises(QuerySyntaxError):
-            parse_query("")
-
-    def test_mismatched_parentheses(self):
-        with pytest.raises(QuerySyntaxError):
-            parse_query("(A AND B")
-"""
-Tests for query_parser.py module.
-"""
-
-import sys
-from pathlib import Path
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-from query_parser import parse_query, pretty_print, QuerySyntaxError
-
-
-def test_parses_simple_and():
-    node = parse_query("A AND B")
-    s = pretty_print(node)
-    assert "AND" in s and '"A"' in s and '"B"' in s
-
-
-def test_parses_simple_or():
-    node = parse_query("A OR B")
-    s = pretty_print(node)
-    assert "OR" in s and '"A"' in s and '"B"' in s
-
-
-def test_parses_simple_not():
-    node = parse_query("NOT A")
-    s = pretty_print(node)
-    assert "NOT" in s and '"A"' in s
-
-
-def test_parses_quoted_phrase_and_wildcard():
-    node = parse_query('"hello world*" AND test*')
-    s = pretty_print(node)
-    assert "hello world" in s and "test" in s
-
-
-def test_parses_nested_expression():
-    node = parse_query("A AND (B OR C)")
-    s = pretty_print(node)
-    assert "AND" in s and "OR" in s
-
-
-def test_operator_precedence():
-    # NOT has highest precedence, then AND, then OR
-    node = parse_query("NOT A OR B")
-    s = pretty_print(node)
-    # Expect OR at top, NOT applied to A
-    assert s.splitlines()[0].strip() == "OR"
-
-
-def test_invalid_operator_raises():
-    with pytest.raises(QuerySyntaxError):
-        parse_query("A NAND B")
-
-
-def test_mismatched_parentheses_raises():
-    with pytest.raises(QuerySyntaxError):
-        parse_query("(A AND B")
-
-
-def test_empty_query_raises():
-    with pytest.raises(QuerySyntaxError):
-        parse_query("")
+"""
+Tests for scripts/query_parser.py
+Validates Boolean grammar (AND/OR/NOT, precedence, parentheses),
+quoted phrases, and wildcard handling.
+"""
+
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from query_parser import parse_query, pretty_print, TermNode, AndNode, OrNode, NotNode, QuerySyntaxError  # type: ignore
+from query_parser import node_from_dict, node_to_dict, normalize_query, query_cache_key  # type: ignore
+from query_parser import PYPARSING_AVAILABLE, _parse_linear, _parse_pyparsing  # type: ignore
+
+
+class TestQueryParser:
+    def test_simple_and(self):
+        node = parse_query("A AND B")
+        assert isinstance(node, AndNode)
+        assert all(isinstance(c, TermNode) for c in node.children)
+
+    def test_simple_or(self):
+        node = parse_query("A OR B")
+        assert isinstance(node, OrNode)
+        assert all(isinstance(c, TermNode) for c in node.children)
+
+    def test_simple_not(self):
+        node = parse_query("NOT A")
+        assert isinstance(node, NotNode)
+        assert isinstance(node.child, TermNode)
+
+    def test_nested_expression(self):
+        node = parse_query("A AND (B OR C)")
+        assert isinstance(node, AndNode)
+        assert isinstance(node.children[1], OrNode)
+
+    def test_operator_precedence(self):
+        n1 = parse_query("NOT A OR B")
+        # Should be (NOT A) OR B
+        assert isinstance(n1, OrNode)
+        assert isinstance(n1.children[0], NotNode)
+
+        n2 = parse_query("A AND B OR C")
+        # Should be (A AND B) OR C
+        assert isinstance(n2, OrNode)
+        assert isinstance(n2.children[0], AndNode)
+
+    def test_phrase(self):
+        node = parse_query('"hello world"')
+        assert isinstance(node, TermNode)
+        assert node.is_phrase is True
+        assert "hello\\s+world" in node.pattern
+
+    def test_wildcard(self):
+        node = parse_query('forest*')
+        assert isinstance(node, TermNode)
+        assert node.is_phrase is False
+        assert node.pattern.endswith(r"\w*")
+
+    def test_phrase_with_wildcard(self):
+        node = parse_query('"ecosystem service*"')
+        assert isinstance(node, TermNode)
+        assert node.is_phrase is True
+        assert node.pattern.endswith(r"\w*")
+
+    def test_empty_query_raises(self):
+        with pytest.raises(QuerySyntaxError):
+            parse_query("")
+
+    def test_mismatched_parentheses(self):
+        with pytest.raises(QuerySyntaxError):
+            parse_query("(A AND B")
+"""
+Tests for query_parser.py module.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from query_parser import parse_query, pretty_print, QuerySyntaxError
+
+
+def test_parses_simple_and():
+    node = parse_query("A AND B")
+    s = pretty_print(node)
+    assert "AND" in s and '"A"' in s and '"B"' in s
+
+
+def test_parses_simple_or():
+    node = parse_query("A OR B")
+    s = pretty_print(node)
+    assert "OR" in s and '"A"' in s and '"B"' in s
+
+
+def test_parses_simple_not():
+    node = parse_query("NOT A")
+    s = pretty_print(node)
+    assert "NOT" in s and '"A"' in s
+
+
+def test_parses_quoted_phrase_and_wildcard():
+    node = parse_query('"hello world*" AND test*')
+    s = pretty_print(node)
+    assert "hello world" in s and "test" in s
+
+
+def test_parses_nested_expression():
+    node = parse_query("A AND (B OR C)")
+    s = pretty_print(node)
+    assert "AND" in s and "OR" in s
+
+
+def test_operator_precedence():
+    # NOT has highest precedence, then AND, then OR
+    node = parse_query("NOT A OR B")
+    s = pretty_print(node)
+    # Expect OR at top, NOT applied to A
+    assert s.splitlines()[0].strip() == "OR"
+
+
+def test_invalid_operator_raises():
+    with pytest.raises(QuerySyntaxError):
+        parse_query("A NAND B")
+
+
+def test_mismatched_parentheses_raises():
+    with pytest.raises(QuerySyntaxError):
+        parse_query("(A AND B")
+
+
+def test_empty_query_raises():
+    with pytest.raises(QuerySyntaxError):
+        parse_query("")
+
+
+class TestQueryCache:
+    def test_normalization_keeps_phrases(self):
+        assert normalize_query('  A\n AND   "two  words"  ') == 'A AND "two  words"'
+        assert query_cache_key("A  AND B") == query_cache_key("A AND B")
+        assert query_cache_key('"a  b"') != query_cache_key('"a b"')
+
+    def test_repeated_parse_is_cached(self):
+        assert parse_query("forest AND wald*") is parse_query("forest\tAND  wald*")
+
+    def test_dict_round_trip(self):
+        node = parse_query('NOT (a OR "b c*") AND d*')
+        assert node_from_dict(json.loads(json.dumps(node_to_dict(node)))) == node
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            node = parse_query("alpha AND (beta OR gamma*)", cache_dir=temp_dir)
+            path = Path(temp_dir) / f"{query_cache_key('alpha AND (beta OR gamma*)')}.json"
+            assert path.is_file()
+            # Read back from disk: the cached AST is used as stored
+            record = json.loads(path.read_text(encoding="utf-8"))
+            record["ast"]["children"][0]["original"] = "from-disk"
+            path.write_text(json.dumps(record), encoding="utf-8")
+            again = parse_query("alpha  AND (beta OR gamma*)", cache_dir=temp_dir)
+            assert again.children[0].original == "from-disk" and again.children[1] == node.children[1]
+
+            # A damaged entry is ignored and rewritten
+            path.write_text("{not json", encoding="utf-8")
+            assert parse_query("alpha AND (beta OR gamma*)", cache_dir=temp_dir) == node
+            assert json.loads(path.read_text(encoding="utf-8"))["ast"] == node_to_dict(node)
+
+    def test_errors_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for _ in range(2):
+                with pytest.raises(QuerySyntaxError):
+                    parse_query("(A AND", cache_dir=temp_dir)
+            assert not list(Path(temp_dir).iterdir())
+
+
+FRAGMENTS = ["a", "forest*", "x-ray", "co2", "*", "a.b", "AND", "and", "OR", "Or", "NOT", "not", "ANDx", "NOT-a",
+             "AND-b", "$", "Ä", "(", "(", ")", ")", '"a b"', '"eco  service*"', '""', '"a\\"b"', '"a\\tb\\\\"',
+             '"open', '"x\\yä\\n"']
+SEPARATORS = [" ", " ", " ", "", "  ", "\t", "\n", " \r\n "]
+
+
+def _random_fragments(rng):
+    return "".join(rng.choice(FRAGMENTS) + rng.choice(SEPARATORS) for _ in range(rng.randint(1, 8)))
+
+
+def _random_valid(rng, depth=0):
+    if depth >= 4 or rng.random() < 0.35:
+        return rng.choice(["a", "b*", '"c d"', "x-ray", "and", "NOT e", "not (f)"])
+    op = rng.choice([" AND ", " OR ", "\nand\t", " or "])
+    return "(" + op.join(_random_valid(rng, depth + 1) for _ in range(rng.randint(1, 4))) + ")"
+
+
+def _outcome(parse, query):
+    try:
+        return node_to_dict(parse(query))
+    except QuerySyntaxError as e:
+        return ("error", e.loc, e.line, e.col)
+
+
+class TestLinearParser:
+    @pytest.mark.parametrize("seed", range(300))
+    def test_matches_pyparsing(self, seed):
+        if not PYPARSING_AVAILABLE:
+            pytest.skip("pyparsing not installed")
+        rng = random.Random(seed)
+        query = _random_valid(rng) if seed % 3 == 0 else _random_fragments(rng)
+        assert _outcome(_parse_linear, query) == _outcome(_parse_pyparsing, query), repr(query)
+
+    def test_error_positions_refer_to_query_as_written(self):
+        with pytest.raises(QuerySyntaxError) as info:
+            parse_query("forest   AND\n\n   wald AND )")
+        assert (info.value.loc, info.value.line, info.value.col) == (26, "   wald AND )", 13)
+
+    def test_long_and_deep_queries(self):
+        terms = [f"term{i}*" for i in range(500)]
+        node = parse_query(" OR ".join(terms))
+        assert isinstance(node, OrNode) and len(node.children) == 500
+        # Far deeper than Python's recursion limit allows a recursive parser
+        node = parse_query("(" * 5000 + "a AND b" + ")" * 5000)
+        assert isinstance(node, AndNode) and len(node.children) == 2
+        node = parse_query("a AND (b OR (c AND " * 100 + "d" + "))" * 100)
+        assert len(node.children) == 2
@@ -0,0 +1,106 @@
+"""
+Tests for query_planner.py module.
+Covers child ordering, learning frequencies from a sample, the plan
+printout, and that planned evaluation gives unchanged results.
+"""
+
+import json
+import random
+import tempfile
+from pathlib import Path
+import sys
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from query_planner import QueryPlanner, term_cost
+
+pytest.importorskip("pyparsing")
+from query_parser import parse_query
+from validator import evaluate_ast, validate_papers
+
+WORDS = ["forest", "management", "wald", "ecosystem", "service", "climate", "study", "x-ray"]
+
+
+def _originals(node):
+    if node.kind == "term":
+        return node.original
+    if node.kind == "not":
+        return ["NOT", _originals(node.child)]
+    return [node.kind.upper()] + [_originals(c) for c in node.children]
+
+
+def _pattern(query):
+    return parse_query(query).pattern
+
+
+class TestOrdering:
+    """Test the order chosen for AND and OR children."""
+
+    def test_and_tries_rarest_first_or_most_frequent_first(self):
+        node = parse_query("study* AND rare AND (common OR scarce)")
+        frequencies = {_pattern("study*"): 0.9, _pattern("rare"): 0.01,
+                       _pattern("common"): 0.8, _pattern("scarce"): 0.05}
+        planner = QueryPlanner(node, frequencies=frequencies)
+        assert _originals(planner.plan) == ["AND", "rare", ["OR", "common", "scarce"], "study*"]
+        # The query as written is left alone
+        assert _originals(node) == ["AND", "study*", "rare", ["OR", "common", "scarce"]]
+
+    def test_ties_keep_written_order(self):
+        node = parse_query("b AND a AND c")
+        assert _originals(QueryPlanner(node, frequencies={}).plan) == ["AND", "b", "a", "c"]
+
+    def test_cost(self):
+        assert term_cost(_pattern("forest")) < term_cost(_pattern("forest*")) < term_cost(_pattern('"a b*"'))
+
+
+class TestSampling:
+    """Test planning from the first papers of a run."""
+
+    def test_plan_after_sample(self):
+        node = parse_query("common AND rare")
+        planner = QueryPlanner(node, sample_size=3)
+        assert planner.plan is None and "no plan yet" in planner.format_plan()
+        for _ in range(3):
+            planner.observe({_pattern("common"): True, _pattern("rare"): False})
+        assert _originals(planner.plan) == ["AND", "rare", "common"]
+        planner.observe({_pattern("common"): False, _pattern("rare"): True})
+        assert planner.documents == 3
+
+        lines = planner.format_plan().splitlines()
+        assert lines[0].startswith("AND  [p=")
+        assert lines[1].startswith('  TERM("rare" -> \\brare\\b)  [p=0.125, cost=1.00]')
+
+
+def _random_query(rng, depth=0):
+    if depth >= 3 or rng.random() < 0.3:
+        return rng.choice(WORDS) + rng.choice(["", "", "*"])
+    op = rng.choice(["AND", "OR", "AND NOT"])
+    if op == "AND NOT":
+        return f"({_random_query(rng, depth + 1)} AND NOT {_random_query(rng, depth + 1)})"
+    return "(" + f" {op} ".join(_random_query(rng, depth + 1) for _ in range(rng.randint(2, 4))) + ")"
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_planned_evaluation_matches_written_order(seed):
+    rng = random.Random(seed)
+    node = parse_query(_random_query(rng))
+    frequencies = {w: rng.random() for w in map(_pattern, WORDS)}
+    planner = QueryPlanner(node, frequencies=frequencies)
+    for _ in range(5):
+        text = " ".join(rng.choice(WORDS + ["other"]) for _ in range(rng.randint(0, 12)))
+        assert evaluate_ast(node, text, planner=planner) == evaluate_ast(node, text)
+
+
+def test_validate_papers_with_planner():
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(30):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 15)))
+            (Path(temp_dir) / f"p{i:02d}.json").write_text(json.dumps({"filename": f"p{i:02d}.pdf", "full_text": text}),
+                                                           encoding="utf-8")
+        node = parse_query("(forest* OR wald) AND NOT x-ray AND study")
+        planner = QueryPlanner(node, sample_size=10)
+        assert validate_papers(temp_dir, None, query_node=node, planner=planner) == \
+            validate_papers(temp_dir, None, query_node=node)
+        assert planner.plan is not None
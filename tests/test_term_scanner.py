@@ -0,0 +1,153 @@
+"""
+Tests for term_scanner.py module.
+Differential tests against per-term regex scanning, which the combined
+scanner replaces: matches, verdicts and evidence must stay identical, with
+either matching engine.
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import aho_corasick  # type: ignore
+import term_scanner  # type: ignore
+from aho_corasick import AhoCorasick  # type: ignore
+from term_scanner import MATCHING_ENGINES, _literal_key, scan_terms  # type: ignore
+from text_normalizer import fold_text  # type: ignore
+
+VOCABULARY = ["forest", "forests", "forestry", "management", "manage", "Wald", "Wälder", "öko",
+              "ecosystem", "services", "service", "climate", "change", "a", "x-ray", "co2"]
+
+
+def _random_text(rng, words=300):
+    separators = [" ", " ", " ", "  ", "\n", ", ", ". ", "-"]
+    return "".join(rng.choice(VOCABULARY) + rng.choice(separators) for _ in range(words))
+
+
+def _random_term(rng):
+    words = [rng.choice(VOCABULARY) for _ in range(rng.choice([1, 1, 1, 2, 3]))]
+    if rng.random() < 0.4:
+        words[-1] = words[-1][:rng.randint(1, len(words[-1]))] + "*"
+    return " ".join(words), len(words) > 1 or rng.random() < 0.2
+
+
+def _reference_hits(text, patterns, limit):
+    """The per-term scanning evaluate_ast did before the combined scanner."""
+    return {p: [m.span() for _, m in zip(range(limit), re.finditer(p, text))] for p in patterns}
+
+
+@pytest.fixture(params=["native", "python"])
+def automaton_impl(request, monkeypatch):
+    """Run with pyahocorasick (if installed) and with the pure-Python automaton."""
+    if request.param == "native" and not aho_corasick.PYAHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(aho_corasick, "PYAHOCORASICK_AVAILABLE", request.param == "native")
+    term_scanner._automaton.cache_clear()
+    yield request.param
+    term_scanner._automaton.cache_clear()
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("engine", MATCHING_ENGINES)
+def test_scan_matches_per_term_finditer(seed, engine, automaton_impl):
+    pytest.importorskip("pyparsing")
+    from query_parser import _escape_term_to_regex  # type: ignore
+
+    rng = random.Random(seed)
+    text = fold_text(_random_text(rng))[0] if seed % 2 else _random_text(rng)
+    terms = [_random_term(rng) for _ in range(rng.randint(1, 25))]
+    patterns = [_escape_term_to_regex(term, is_phrase) for term, is_phrase in terms]
+    patterns += [r"\bforest\b", r"\bforest\w*", r"\bzzz\b", r"\b\w*", ""]
+    for limit in (1, 3):
+        assert scan_terms(text, patterns, limit=limit, engine=engine) == _reference_hits(text, patterns, limit)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_automaton_finds_every_occurrence(seed, automaton_impl):
+    rng = random.Random(500 + seed)
+    text = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 400)))
+    keys = sorted({"".join(rng.choice("abc") for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 30))})
+    expected = sorted((m.start() + len(key) - 1, i) for i, key in enumerate(keys)
+                      for m in re.finditer(f"(?={re.escape(key)})", text))
+    assert sorted(AhoCorasick(keys).iter(text)) == expected
+
+
+def test_literal_key():
+    assert _literal_key(r"\bforest\b") == "forest"
+    assert _literal_key(r"\bforest\w*") == "forest"
+    assert _literal_key(r"\becosystem\s+service\w*") == "ecosystem"
+    assert _literal_key(r"\bx\-ray\b") == "x-ray"
+    # Zero-width patterns and other regex syntax go to the regex engine
+    assert _literal_key(r"\b\w*") is None
+    assert _literal_key("") is None
+    assert _literal_key(r"\bfoo\b|bar") is None
+    assert _literal_key(r"\bfo+\b") is None
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        scan_terms("forest", [r"\bforest\b"], engine="grep")
+
+
+def _random_query(rng, depth=0):
+    if depth >= 3 or rng.random() < 0.35:
+        term, is_phrase = _random_term(rng)
+        # The grammar only allows ASCII in unquoted words
+        term = term if is_phrase else term.replace(" ", "")
+        return f'"{term}"' if is_phrase or not term.isascii() else term
+    op = rng.choice(["AND", "OR", "AND NOT"])
+    if op == "AND NOT":
+        return f"({_random_query(rng, depth + 1)} AND NOT {_random_query(rng, depth + 1)})"
+    children = [_random_query(rng, depth + 1) for _ in range(rng.randint(2, 4))]
+    return "(" + f" {op} ".join(children) + ")"
+
+
+def _reference_evaluate(node, text, case_sensitive):
+    """evaluate_ast before the combined scanner: one search plus one finditer per term."""
+    import validator  # type: ignore
+
+    text2 = validator._prep_text(text, case_sensitive)
+    folded = None if case_sensitive else fold_text(text2)
+    scanned = folded[0] if folded else text2
+
+    def eval_node(n):
+        if n.kind == "term":
+            rx = validator._term_regex(n, case_sensitive)
+            if rx.search(scanned):
+                spans = [m.span() for _, m in zip(range(3), rx.finditer(scanned))]
+                return True, validator._evidence_from_spans(spans, text2, n.original, folded=folded)
+            return False, []
+        if n.kind == "not":
+            return (not eval_node(n.child)[0]), []
+        if n.kind == "and":
+            evidence = []
+            for c in n.children:
+                ok, ev = eval_node(c)
+                if not ok:
+                    return False, []
+                evidence.extend(ev)
+            return True, evidence
+        results = [eval_node(c) for c in n.children]
+        return next(((True, ev) for ok, ev in results if ok), (False, []))
+
+    return eval_node(node)
+
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("engine", ["regex", "aho-corasick"])
+def test_evaluate_ast_matches_reference(seed, engine):
+    pytest.importorskip("pyparsing")
+    from query_parser import parse_query  # type: ignore
+    from validator import evaluate_ast  # type: ignore
+
+    rng = random.Random(1000 + seed)
+    text = _random_text(rng, words=rng.randint(0, 200))
+    node = parse_query(_random_query(rng))
+    for case_sensitive in (False, True):
+        assert evaluate_ast(node, text, case_sensitive=case_sensitive, engine=engine) == \
+            _reference_evaluate(node, text, case_sensitive)
@@ -0,0 +1,93 @@
+"""
+Tests for text_normalizer.py module.
+Checks equivalence with the previous regex-based cleaner and the individual stages.
+"""
+
+import pytest
+import random
+import re
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from text_normalizer import TextNormalizer, DEFAULT_NORMALIZER, collapse_whitespace, fold_text, unfold_offset
+from pdf_extractor import clean_extracted_text
+
+
+def legacy_clean(text):
+    """Whitespace and page-number stages of the previous clean_extracted_text."""
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\b\d+\b\s*(?=\n|$)', '', text)
+    text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
+    return text.strip()
+
+
+class TestEquivalence:
+    """The fused normalizer must match the old regex chain."""
+    
+    def test_matches_legacy_chain_on_random_text(self):
+        """Randomized differential check against the legacy implementation."""
+        alphabet = ['a', 'Z', '1', '42', '_', '-', '.', ' ', '  ', '\n', '\t', '\r\n', '\xa0', 'é', '٣', ' ']
+        rng = random.Random(7)
+        for _ in range(20000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 15)))
+            assert DEFAULT_NORMALIZER.normalize(text) == legacy_clean(text), repr(text)
+            assert collapse_whitespace(text) == re.sub(r'\s+', ' ', text).strip(), repr(text)
+    
+    def test_page_number_stripping(self):
+        """Only a standalone trailing number is removed."""
+        assert clean_extracted_text("Forest management\n\n 12 \n") == "Forest management"
+        assert clean_extracted_text("Results for 2019 and x12") == "Results for 2019 and x12"
+        assert clean_extracted_text("3\n\n 4") == ""
+
+
+class TestStages:
+    """Test individual, configurable stages."""
+    
+    def test_quote_folding(self):
+        """Typographic quotes become ASCII quotes."""
+        assert clean_extracted_text("“protective forest” and ‘thinning’") == \
+            "\"protective forest\" and 'thinning'"
+    
+    def test_stages_can_be_disabled(self):
+        """Disabled stages leave the text untouched (apart from trimming)."""
+        normalizer = TextNormalizer(collapse_whitespace=False, fold_quotes=False, strip_page_numbers=False)
+        assert normalizer.normalize(" a  “b” 7 ") == "a  “b” 7"
+
+
+class TestFolding:
+    """Case/diacritic folding and the offset map back to the original text."""
+    
+    def test_ascii_is_lowercased_with_trivial_map(self):
+        assert fold_text("Forest Management") == ("forest management", [[0, 0]])
+    
+    def test_accents_ligatures_and_expansions(self):
+        folded, _ = fold_text("Lüscher, Straße, ﬁre, İzmir")
+        assert folded == "luscher, strasse, fire, izmir"
+    
+    def test_offsets_map_back_to_original(self):
+        # Decomposed umlaut (u + combining diaeresis) and an expanding sharp s
+        original = "Lu\u0308scher and Straße near Muenster"
+        folded, fold_offsets = fold_text(original)
+        for word in ("luscher", "strasse", "muenster"):
+            start = folded.index(word)
+            end = start + len(word)
+            mapped = original[unfold_offset(fold_offsets, start):unfold_offset(fold_offsets, end, end=True)]
+            assert fold_text(mapped)[0] == word
+    
+    def test_symbols_keep_word_boundaries(self):
+        # Compatibility decomposition would turn these symbols into letters or digits
+        folded, _ = fold_text("Forest™ management, № 5 at 20℃, x² and 3µm")
+        assert folded == "forest™ management, № 5 at 20℃, x2 and 3μm"
+        assert re.search(r"\bforest\b", folded)
+    
+    def test_term_next_to_symbol_matches(self):
+        pytest.importorskip("pyparsing")
+        from query_parser import parse_query
+        from validator import evaluate_ast
+        assert evaluate_ast(parse_query("forest"), "Forest™ management", evidence=False)
+        assert evaluate_ast(parse_query("forest AND management"), "Forest® Management™", evidence=False)
+
@@ -0,0 +1,107 @@
+"""
+Tests for watcher.py module.
+Covers settling of new files, incremental re-screening and removal.
+"""
+
+import json
+import os
+import pytest
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import watcher as watcher_module
+from watcher import ScreeningWatcher, scan_pdfs
+
+
+def _stall(pdf_path, cache_dir=None, options=None):
+    time.sleep(60)
+
+
+class TestScan:
+    """Test input folder snapshots."""
+
+    def test_only_visible_pdfs(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.pdf", "B.PDF", ".partial.pdf", "notes.txt"):
+                (Path(temp_dir) / name).write_bytes(b"%PDF-1.4")
+            (Path(temp_dir) / "folder.pdf").mkdir()
+            snapshot = scan_pdfs(temp_dir)
+            assert sorted(snapshot) == ["B.PDF", "a.pdf"]
+            assert snapshot["a.pdf"][0] == 8
+
+
+class TestWatcher:
+    """Test incremental screening of arriving, changed and removed PDFs."""
+
+    def test_incremental_screening(self, make_pdf):
+        pytest.importorskip("pyparsing")
+        from query_parser import parse_query
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+            watcher = ScreeningWatcher(input_dir, output_dir, {}, query_node=parse_query('forest'),
+                                       query_string='forest')
+            watcher.seed([], [], scan_pdfs(input_dir))
+
+            make_pdf(input_dir / "paper.pdf", ["Forest management in mountain regions. " * 20])
+            # First sighting only registers the file; it is screened once it has settled
+            assert watcher.poll() == []
+            assert watcher.poll() == ["paper.pdf"]
+            assert (output_dir / "sorted_pdfs" / "include" / "paper.pdf").exists()
+            results = json.loads((output_dir / "validation_results.json").read_text(encoding="utf-8"))
+            assert [(r["filename"], r["overall_result"]) for r in results] == [("paper.pdf", True)]
+            assert (output_dir / "validation_report.html").exists()
+
+            # Nothing changed: nothing is screened again
+            assert watcher.poll() == []
+
+            # A replaced file is re-screened and moves to the other folder
+            make_pdf(input_dir / "paper.pdf", ["Ocean sampling of coastal waters, a longer text. " * 20])
+            stat = (input_dir / "paper.pdf").stat()
+            os.utime(input_dir / "paper.pdf", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert watcher.poll(settle=False) == ["paper.pdf"]
+            assert (output_dir / "sorted_pdfs" / "exclude" / "paper.pdf").exists()
+            assert not (output_dir / "sorted_pdfs" / "include" / "paper.pdf").exists()
+
+            # A broken file is reported as failed
+            (input_dir / "broken.pdf").write_bytes(b"not a pdf")
+            assert watcher.poll(settle=False) == ["broken.pdf"]
+            failed = json.loads((output_dir / "failed_pdfs.json").read_text(encoding="utf-8"))
+            assert [f["filename"] for f in failed] == ["broken.pdf"]
+
+            # Removed files disappear from all outputs
+            (input_dir / "paper.pdf").unlink()
+            (input_dir / "broken.pdf").unlink()
+            assert watcher.poll() == ["broken.pdf", "paper.pdf"]
+            assert json.loads((output_dir / "validation_results.json").read_text(encoding="utf-8")) == []
+            assert not (output_dir / "failed_pdfs.json").exists()
+            assert not (output_dir / "sorted_pdfs" / "exclude" / "paper.pdf").exists()
+            watcher.close()
+
+    def test_seeded_files_are_not_rescreened(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "done.pdf").write_bytes(b"%PDF-1.4 screened in the batch run")
+            watcher = ScreeningWatcher(temp_dir, Path(temp_dir) / "out", {}, search_blocks=[])
+            watcher.seed([{"filename": "done.pdf", "overall_result": True}], [], scan_pdfs(temp_dir))
+            assert watcher.poll(settle=False) == []
+
+    def test_stalled_extraction_times_out(self, monkeypatch):
+        monkeypatch.setattr(watcher_module, "_extract_single_pdf", _stall)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "out"
+            (Path(temp_dir) / "stuck.pdf").write_bytes(b"%PDF-1.4")
+            watcher = ScreeningWatcher(temp_dir, output_dir, {}, search_blocks=[], limits={"timeout": 1})
+            start = time.monotonic()
+            try:
+                assert watcher.poll(settle=False) == ["stuck.pdf"]
+            finally:
+                watcher.close()
+            assert time.monotonic() - start < 30
+            failed = json.loads((output_dir / "failed_pdfs.json").read_text(encoding="utf-8"))
+            assert [(f["filename"], f["error_code"]) for f in failed] == [("stuck.pdf", "EXTRACTION_TIMEOUT")]